@@ -10,7 +10,7 @@ from typing import Any, Optional
 from loguru import logger
 
 from nanofolks.agent.skills import SkillsLoader
-from nanofolks.config.loader import load_config
+from nanofolks.config.loader import get_config
 from nanofolks.memory.embeddings import EmbeddingProvider
 from nanofolks.memory.store import TurboMemoryStore
 from nanofolks.security.secret_manager import get_secret_manager
@@ -33,7 +33,7 @@ class ContextBuilder:
         self.workspace = workspace
 
         # Initialize TurboMemoryStore with config
-        config = load_config()
+        config = get_config()
         if config.memory.enabled:
             # Initialize embedding provider for semantic search
             self.embedding_provider = EmbeddingProvider(config.memory.embedding)
@@ -179,7 +179,7 @@ Tools for servers marked as 'connected' are already registered and available for
         def escape_xml(s: str) -> str:
             return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
-        config = load_config()
+        config = get_config()
         available = {}
         
         # 1. Global servers
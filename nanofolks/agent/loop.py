@@ -31,12 +31,14 @@ from nanofolks.agent.work_log_manager import LogLevel, get_work_log_manager
 from nanofolks.bus.events import MessageEnvelope
 from nanofolks.bus.queue import MessageBus
 from nanofolks.config.schema import RoutingConfig
+from nanofolks.metrics import timed
 from nanofolks.providers.base import LLMProvider
 from nanofolks.reasoning.config import get_reasoning_config
 from nanofolks.security.sanitizer import SecretSanitizer
 from nanofolks.session.dual_mode import create_session_manager
 from nanofolks.session.manager import Session
 from nanofolks.teams import TeamManager
+from nanofolks.tracing import traced
 from nanofolks.utils.ids import (
     normalize_room_id,
     room_to_session_id,
@@ -64,6 +66,7 @@ class AgentLoop:
         workspace: Path,
         model: str | None = None,
         max_iterations: int = 20,
+        max_parallel_tools: int = 4,
         temperature: float = 0.7,
         max_tokens: int = 4096,
         brave_api_key: str | None = None,
@@ -112,6 +115,7 @@ class AgentLoop:
 
         self.model = model or provider.get_default_model()
         self.max_iterations = max_iterations
+        self.max_parallel_tools = max_parallel_tools
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.brave_api_key = brave_api_key
@@ -157,8 +161,8 @@ class AgentLoop:
         else:
             # Load config for session manager settings
             try:
-                from nanofolks.config.loader import load_config
-                config = load_config()
+                from nanofolks.config.loader import get_config
+                config = get_config()
             except Exception:
                 config = None
             self.sessions = create_session_manager(workspace, config)
@@ -184,6 +188,7 @@ class AgentLoop:
         # Initialize memory system if enabled
         self.memory_config = memory_config  # Store for later access
         self.memory_store = None
+        self.embedding_service = None
         self.activity_tracker = None
         self.background_processor = None
         self.memory_retrieval = None
@@ -195,14 +200,18 @@ class AgentLoop:
         if memory_config and memory_config.enabled:
             from nanofolks.memory.background import ActivityTracker, BackgroundProcessor
             from nanofolks.memory.context import create_context_assembler
-            from nanofolks.memory.embeddings import EmbeddingProvider
+            from nanofolks.memory.embedding_service import create_embedding_service
             from nanofolks.memory.retrieval import create_retrieval
             from nanofolks.memory.store import TurboMemoryStore
             from nanofolks.memory.summaries import create_summary_manager
 
-            embedding_provider = EmbeddingProvider(memory_config.embedding)
+            # Embeddings run on a batching worker thread, backed by a persistent cache
+            embedding_provider = create_embedding_service(memory_config, workspace)
+            self.embedding_service = embedding_provider
             self.memory_store = TurboMemoryStore(memory_config, workspace)
             self.memory_store.set_embedding_provider(embedding_provider)
+            if self.routing_stage:
+                self.routing_stage.set_embedding_provider(embedding_provider)
 
             # Initialize summary manager
             self.summary_manager = create_summary_manager(
@@ -1080,6 +1089,12 @@ class AgentLoop:
         if self.background_processor:
             await self.background_processor.stop()
 
+        if self.embedding_service:
+            self.embedding_service.close()
+
+        # Write back any cached session state
+        self.sessions.flush()
+
         await self.close_mcp()
         logger.info("Agent loop stopping")
 
@@ -1297,6 +1312,8 @@ class AgentLoop:
             )
             return self.model
 
+    @timed("agent.turn.duration_seconds")
+    @traced("agent.turn", trace_id_from=lambda self, msg, *args, **kwargs: msg.trace_id)
     async def _process_message(self, msg: MessageEnvelope) -> MessageEnvelope | None:
         """
         Process a single inbound message.
@@ -1552,17 +1569,15 @@ class AgentLoop:
         compaction_notice = None
         if self.session_compactor:
             try:
-                from nanofolks.memory.token_counter import count_messages
-
-                # Get current context usage
+                # Get current context usage (running total, only new messages are counted)
                 max_tokens = self.memory_config.enhanced_context.max_context_tokens if self.memory_config else 8000
-                current_tokens = count_messages(session.messages)
+                current_tokens = session.token_count()
 
                 # Check if compaction needed
-                if self.session_compactor.should_compact(session.messages, max_tokens):
+                if self.session_compactor.should_compact(session, max_tokens):
                     # Get strategy recommendation
                     strategy = self.session_compactor.get_compaction_strategy(
-                        session.messages, max_tokens
+                        session, max_tokens
                     )
 
                     logger.info(
@@ -1619,6 +1634,9 @@ class AgentLoop:
                         "strategy": strategy["strategy"],
                         "validation_passed": validation["is_valid"],
                     }
+                else:
+                    # Summarize older chunks ahead of time once near the threshold
+                    self.session_compactor.schedule_precompaction(session, max_tokens)
             except Exception as e:
                 logger.error(f"Session compaction failed: {e}")
                 # Continue without compaction - don't block message processing
@@ -1744,65 +1762,13 @@ class AgentLoop:
                     reasoning_content=response.reasoning_content,
                 )
 
-                # Execute tools
-                for tool_call in response.tool_calls:
-                    args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
-                    # Sanitize tool arguments to prevent secrets in logs
-                    sanitized_args = self.sanitizer.sanitize(args_str[:200])
-                    logger.info(f"Tool call: {tool_call.name}({sanitized_args})")
-                    
-                    # Show tool start progress
-                    if self._stream_callback:
-                        label = tool_call.name
-                        if tool_call.name == "sidekick":
-                            args = tool_call.arguments if isinstance(tool_call.arguments, dict) else None
-                            tasks = args.get("tasks") if args else None
-                            count = len(tasks) if isinstance(tasks, list) else 0
-                            label = f"🤝 sidekicks x{count}" if count else "🤝 sidekicks"
-                            await self._stream_callback(f"↳ {label}...")
-                        else:
-                            await self._stream_callback(f"↳ 🔧 {label}...")
-
-                    # Log tool execution start
-                    import time
-                    tool_start_time = time.time()
-
-                    try:
-                        result = await self.tools.execute(tool_call.name, tool_call.arguments)
-                        tool_duration_ms = int((time.time() - tool_start_time) * 1000)
-                        
-                        # Show tool completion progress
-                        if self._stream_callback:
-                            if tool_call.name == "sidekick":
-                                args = tool_call.arguments if isinstance(tool_call.arguments, dict) else None
-                                tasks = args.get("tasks") if args else None
-                                count = len(tasks) if isinstance(tasks, list) else 0
-                                label = f"sidekicks x{count}" if count else "sidekicks"
-                                await self._stream_callback(f"✓ {label}")
-                            else:
-                                await self._stream_callback(f"✓ {tool_call.name}")
-
-                        # Log successful tool execution
-                        self.work_log_manager.log_tool(
-                            tool_name=tool_call.name,
-                            tool_input=tool_call.arguments,
-                            tool_output=result,
-                            tool_status="success",
-                            duration_ms=tool_duration_ms
-                        )
-                    except Exception as tool_error:
-                        tool_duration_ms = int((time.time() - tool_start_time) * 1000)
-
-                        # Log failed tool execution
-                        self.work_log_manager.log(
-                            level=LogLevel.ERROR,
-                            category="tool_execution",
-                            message=f"Tool {tool_call.name} failed: {str(tool_error)}",
-                            details={"tool": tool_call.name, "error": str(tool_error)},
-                            duration_ms=tool_duration_ms
-                        )
-                        raise
-
+                # Execute tools; independent calls overlap, results keep call order
+                results = await self.tools.execute_batch(
+                    [(tc.name, tc.arguments) for tc in response.tool_calls],
+                    max_concurrency=self.max_parallel_tools,
+                    runner=lambda index, _name, _params: self._run_tool_call(response.tool_calls[index]),
+                )
+                for tool_call, result in zip(response.tool_calls, results):
                     messages = self.context.add_tool_result(
                         messages, tool_call.id, tool_call.name, result
                     )
@@ -1890,9 +1856,8 @@ class AgentLoop:
         response_metadata = msg.metadata or {}
         if self.memory_config and self.memory_config.enhanced_context.show_context_percentage:
             try:
-                from nanofolks.memory.token_counter import count_messages
                 max_tokens = self.memory_config.enhanced_context.max_context_tokens
-                current_tokens = count_messages(session.messages)
+                current_tokens = session.token_count()
                 percentage = current_tokens / max_tokens if max_tokens > 0 else 0
 
                 # Add context status to metadata
@@ -1930,6 +1895,67 @@ class AgentLoop:
             metadata=response_metadata,  # Includes context usage if enabled
         )
 
+    async def _run_tool_call(self, tool_call: Any) -> str:
+        """Execute one tool call with progress updates and work logging."""
+        args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
+        # Sanitize tool arguments to prevent secrets in logs
+        sanitized_args = self.sanitizer.sanitize(args_str[:200])
+        logger.info(f"Tool call: {tool_call.name}({sanitized_args})")
+
+        # Show tool start progress
+        if self._stream_callback:
+            label = tool_call.name
+            if tool_call.name == "sidekick":
+                args = tool_call.arguments if isinstance(tool_call.arguments, dict) else None
+                tasks = args.get("tasks") if args else None
+                count = len(tasks) if isinstance(tasks, list) else 0
+                label = f"🤝 sidekicks x{count}" if count else "🤝 sidekicks"
+                await self._stream_callback(f"↳ {label}...")
+            else:
+                await self._stream_callback(f"↳ 🔧 {label}...")
+
+        # Log tool execution start
+        import time
+        tool_start_time = time.time()
+
+        try:
+            result = await self.tools.execute(tool_call.name, tool_call.arguments)
+            tool_duration_ms = int((time.time() - tool_start_time) * 1000)
+
+            # Show tool completion progress
+            if self._stream_callback:
+                if tool_call.name == "sidekick":
+                    args = tool_call.arguments if isinstance(tool_call.arguments, dict) else None
+                    tasks = args.get("tasks") if args else None
+                    count = len(tasks) if isinstance(tasks, list) else 0
+                    label = f"sidekicks x{count}" if count else "sidekicks"
+                    await self._stream_callback(f"✓ {label}")
+                else:
+                    await self._stream_callback(f"✓ {tool_call.name}")
+
+            # Log successful tool execution
+            self.work_log_manager.log_tool(
+                tool_name=tool_call.name,
+                tool_input=tool_call.arguments,
+                tool_output=result,
+                tool_status="success",
+                duration_ms=tool_duration_ms
+            )
+        except Exception as tool_error:
+            tool_duration_ms = int((time.time() - tool_start_time) * 1000)
+
+            # Log failed tool execution
+            self.work_log_manager.log(
+                level=LogLevel.ERROR,
+                category="tool_execution",
+                message=f"Tool {tool_call.name} failed: {str(tool_error)}",
+                details={"tool": tool_call.name, "error": str(tool_error)},
+                duration_ms=tool_duration_ms
+            )
+            raise
+
+        return result
+
     async def _process_system_message(self, msg: MessageEnvelope) -> MessageEnvelope | None:
         """
         Process a system message (e.g., subagent announce).
@@ -2036,7 +2062,11 @@ class AgentLoop:
                 for tool_call in response.tool_calls:
                     args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
                     logger.info(f"Tool call: {tool_call.name}({args_str[:200]})")
-                    result = await self.tools.execute(tool_call.name, tool_call.arguments)
+                results = await self.tools.execute_batch(
+                    [(tc.name, tc.arguments) for tc in response.tool_calls],
+                    max_concurrency=self.max_parallel_tools,
+                )
+                for tool_call, result in zip(response.tool_calls, results):
                     messages = self.context.add_tool_result(
                         messages, tool_call.id, tool_call.name, result
                     )
@@ -2142,8 +2172,8 @@ class AgentLoop:
     def _has_required_config(self) -> bool:
         """Check if required configuration is present."""
         # Check if at least one provider has an API key
-        from nanofolks.config.loader import load_config
-        config = load_config()
+        from nanofolks.config.loader import get_config
+        config = get_config()
 
         providers = ['openrouter', 'anthropic', 'openai', 'groq', 'deepseek', 'moonshot']
         for provider_name in providers:
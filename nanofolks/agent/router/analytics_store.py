@@ -0,0 +1,357 @@
+"""Append-only SQLite store for routing decisions.
+
+Every routing decision is appended to ``routing_decisions`` through a
+background batched writer, so recording one on the hot path is a queue
+put. The same write transaction maintains running counters that
+calibration needs:
+
+- tier_counts: (client tier, LLM tier, confidence bucket) -> count
+- mismatch_actions: (client tier, LLM tier, action type) -> count, mismatches only
+- mismatch_ngrams: (client tier, LLM tier, n, n-gram) -> occurrences, mismatches only
+- decision_counts: (final tier, layer) -> count
+
+Calibration reads the counters plus the rows appended since its last run
+(tracked as a row-id watermark) instead of re-scanning the whole history.
+The counters cover exactly the rows still in ``routing_decisions``: prune()
+subtracts each dropped row's contribution, so statistics describe the
+newest ``max_records`` decisions rather than growing without bound.
+"""
+
+import json
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from nanofolks.utils.batched_writer import BatchedSQLiteWriter
+
+NGRAM_SIZES = (2, 3)
+
+_DECISION_COLUMNS = (
+    "timestamp", "content_preview", "client_tier", "client_confidence",
+    "llm_tier", "llm_confidence", "final_tier", "layer_used", "action_type",
+    "has_negations", "question_type", "code_presence", "extra",
+)
+
+
+def extract_ngrams(content: str, n: int = 2) -> list[str]:
+    """Extract n-grams (word phrases) from content, skipping words of 2 letters or less."""
+    words = [w for w in re.findall(r'\b\w+\b', content.lower()) if len(w) > 2]
+    return [" ".join(words[i:i + n]) for i in range(len(words) - n + 1)]
+
+
+def confidence_bucket(confidence: float) -> float:
+    """Round a confidence to its 0.1-wide calibration bucket."""
+    return round((confidence or 0.0) * 10) / 10
+
+
+class RoutingStatsStore:
+    """Append-only log of routing decisions with incrementally maintained counters."""
+
+    def __init__(self, db_path: Path, max_records: int = 100000):
+        """
+        Open (or create) the store and start its writer.
+
+        Args:
+            db_path: SQLite database file
+            max_records: Decisions kept by prune(), rows and counters alike
+        """
+        self.db_path = db_path
+        self.max_records = max_records
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+        self._writer = BatchedSQLiteWriter(db_path, name="routing stats")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection committed (or rolled back) and closed on exit."""
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS routing_decisions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    content_preview TEXT,
+                    client_tier TEXT,
+                    client_confidence REAL,
+                    llm_tier TEXT,
+                    llm_confidence REAL,
+                    final_tier TEXT,
+                    layer_used TEXT,
+                    action_type TEXT,
+                    has_negations INTEGER,
+                    question_type TEXT,
+                    code_presence REAL,
+                    extra TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_routing_decisions_tiers
+                    ON routing_decisions(llm_tier, client_tier);
+
+                CREATE TABLE IF NOT EXISTS tier_counts (
+                    client_tier TEXT NOT NULL,
+                    llm_tier TEXT NOT NULL,
+                    bucket REAL NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (client_tier, llm_tier, bucket)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS mismatch_actions (
+                    client_tier TEXT NOT NULL,
+                    llm_tier TEXT NOT NULL,
+                    action_type TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (client_tier, llm_tier, action_type)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS mismatch_ngrams (
+                    client_tier TEXT NOT NULL,
+                    llm_tier TEXT NOT NULL,
+                    n INTEGER NOT NULL,
+                    ngram TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (llm_tier, client_tier, n, ngram)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS decision_counts (
+                    final_tier TEXT NOT NULL,
+                    layer_used TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (final_tier, layer_used)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS store_state (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+            conn.execute("PRAGMA journal_mode=WAL")
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(self, record: dict[str, Any]) -> bool:
+        """
+        Queue a decision (as built by CalibrationManager.record_classification).
+
+        Returns:
+            False if the writer dropped it
+        """
+        return self._writer.submit(lambda conn: self._insert(conn, record))
+
+    def append_many(self, records: list[dict[str, Any]]) -> None:
+        """Queue several decisions to be written in one transaction."""
+        def write(conn: sqlite3.Connection) -> None:
+            for record in records:
+                self._insert(conn, record)
+        self._writer.submit(write)
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, record: dict[str, Any]) -> None:
+        extra = {k: v for k, v in record.items() if k not in _DECISION_COLUMNS}
+        row = dict(record)
+        row["has_negations"] = 1 if record.get("has_negations") else 0
+        row["extra"] = json.dumps(extra) if extra else None
+        row.setdefault("timestamp", datetime.now().isoformat())
+        conn.execute(
+            f"INSERT INTO routing_decisions ({', '.join(_DECISION_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(_DECISION_COLUMNS))})",
+            [row.get(column) for column in _DECISION_COLUMNS],
+        )
+        RoutingStatsStore._count(conn, record, 1)
+
+    @staticmethod
+    def _count(conn: sqlite3.Connection, record: dict[str, Any], delta: int) -> None:
+        """Add ``delta`` times the record's contribution to every counter table."""
+        conn.execute(
+            """
+            INSERT INTO decision_counts (final_tier, layer_used, count) VALUES (?, ?, ?)
+            ON CONFLICT(final_tier, layer_used) DO UPDATE SET count = count + excluded.count
+            """,
+            (record.get("final_tier") or "unknown", record.get("layer_used") or "client", delta),
+        )
+
+        client_tier = record.get("client_tier")
+        llm_tier = record.get("llm_tier")
+        if not (client_tier and llm_tier):
+            return
+
+        conn.execute(
+            """
+            INSERT INTO tier_counts (client_tier, llm_tier, bucket, count) VALUES (?, ?, ?, ?)
+            ON CONFLICT(client_tier, llm_tier, bucket) DO UPDATE SET count = count + excluded.count
+            """,
+            (client_tier, llm_tier, confidence_bucket(record.get("client_confidence")), delta),
+        )
+        if client_tier == llm_tier:
+            return
+
+        conn.execute(
+            """
+            INSERT INTO mismatch_actions (client_tier, llm_tier, action_type, count) VALUES (?, ?, ?, ?)
+            ON CONFLICT(client_tier, llm_tier, action_type) DO UPDATE SET count = count + excluded.count
+            """,
+            (client_tier, llm_tier, record.get("action_type") or "general", delta),
+        )
+        content = record.get("content_preview") or ""
+        counts: dict[tuple[int, str], int] = {}
+        for n in NGRAM_SIZES:
+            for ngram in extract_ngrams(content, n):
+                counts[(n, ngram)] = counts.get((n, ngram), 0) + delta
+        conn.executemany(
+            """
+            INSERT INTO mismatch_ngrams (client_tier, llm_tier, n, ngram, count) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(llm_tier, client_tier, n, ngram) DO UPDATE SET count = count + excluded.count
+            """,
+            [(client_tier, llm_tier, n, ngram, count) for (n, ngram), count in counts.items()],
+        )
+
+    def set_state(self, key: str, value: Optional[str]) -> None:
+        """Persist a piece of calibration state (applied in write order)."""
+        self._writer.submit(lambda conn: conn.execute(
+            "INSERT OR REPLACE INTO store_state (key, value) VALUES (?, ?)", (key, value)
+        ))
+
+    def prune(self) -> int:
+        """
+        Drop the oldest decisions beyond ``max_records``.
+
+        Each dropped row's contribution is subtracted from the counters in
+        the same transaction, and counter rows that reach zero are deleted,
+        so the counters keep describing only the retained decisions.
+
+        Returns:
+            Number of rows removed
+        """
+        removed = [0]
+
+        def write(conn: sqlite3.Connection) -> None:
+            cutoff = conn.execute(
+                "SELECT COALESCE(MAX(id), 0) - ? FROM routing_decisions", (self.max_records,)
+            ).fetchone()[0]
+            cursor = conn.execute(
+                "SELECT client_tier, client_confidence, llm_tier, final_tier, layer_used, "
+                "action_type, content_preview FROM routing_decisions WHERE id <= ?",
+                (cutoff,),
+            )
+            columns = [column[0] for column in cursor.description]
+            for values in cursor.fetchall():
+                self._count(conn, dict(zip(columns, values)), -1)
+            removed[0] = conn.execute(
+                "DELETE FROM routing_decisions WHERE id <= ?", (cutoff,)
+            ).rowcount
+            if removed[0]:
+                for table in ("decision_counts", "tier_counts", "mismatch_actions", "mismatch_ngrams"):
+                    conn.execute(f"DELETE FROM {table} WHERE count <= 0")
+
+        self._writer.submit(write)
+        self.flush()
+        return removed[0]
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every queued write is committed."""
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        """Commit pending writes and stop the writer."""
+        self._writer.close()
+
+    # ------------------------------------------------------------------
+    # Reads (each flushes the queue first so it sees every write)
+    # ------------------------------------------------------------------
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        self.flush()
+        with self._connect() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def get_state(self, key: str) -> Optional[str]:
+        rows = self._query("SELECT value FROM store_state WHERE key = ?", (key,))
+        return rows[0][0] if rows else None
+
+    def last_id(self) -> int:
+        """Row id of the newest decision (0 if none)."""
+        return self._query("SELECT COALESCE(MAX(id), 0) FROM routing_decisions")[0][0]
+
+    def count_since(self, after_id: int = 0) -> int:
+        """Number of decisions appended after ``after_id``."""
+        return self._query("SELECT COUNT(*) FROM routing_decisions WHERE id > ?", (after_id,))[0][0]
+
+    def total(self) -> int:
+        """Decisions currently retained (at most ``max_records`` after a prune)."""
+        return self._query("SELECT COALESCE(SUM(count), 0) FROM decision_counts")[0][0]
+
+    def decisions_since(self, after_id: int, through_id: Optional[int] = None) -> Iterator[tuple[str, Optional[str]]]:
+        """Yield (content_preview, final_tier) of decisions in (after_id, through_id]."""
+        sql = "SELECT content_preview, final_tier FROM routing_decisions WHERE id > ?"
+        params: tuple = (after_id,)
+        if through_id is not None:
+            sql += " AND id <= ?"
+            params += (through_id,)
+        for content, final_tier in self._query(sql + " ORDER BY id", params):
+            yield content or "", final_tier
+
+    def tier_counts(self) -> list[tuple[str, str, float, int]]:
+        """(client tier, LLM tier, confidence bucket, count) for decisions with both tiers."""
+        return self._query("SELECT client_tier, llm_tier, bucket, count FROM tier_counts")
+
+    def decision_distribution(self) -> tuple[dict[str, int], dict[str, int]]:
+        """Retained decision counts by final tier and by layer."""
+        tiers: dict[str, int] = {}
+        layers: dict[str, int] = {}
+        for final_tier, layer, count in self._query(
+            "SELECT final_tier, layer_used, count FROM decision_counts"
+        ):
+            tiers[final_tier] = tiers.get(final_tier, 0) + count
+            layers[layer] = layers.get(layer, 0) + count
+        return tiers, layers
+
+    def top_ngrams(
+        self,
+        llm_tier: str,
+        client_tier: Optional[str] = None,
+        sizes: tuple[int, ...] = NGRAM_SIZES,
+        limit: int = 5,
+    ) -> list[tuple[str, int]]:
+        """Most frequent n-grams in mismatches corrected to ``llm_tier``."""
+        sql = (
+            "SELECT ngram, SUM(count) AS total FROM mismatch_ngrams WHERE llm_tier = ? "
+            f"AND n IN ({', '.join('?' * len(sizes))})"
+        )
+        params: tuple = (llm_tier, *sizes)
+        if client_tier is not None:
+            sql += " AND client_tier = ?"
+            params += (client_tier,)
+        sql += " GROUP BY ngram ORDER BY total DESC, ngram LIMIT ?"
+        return self._query(sql, params + (limit,))
+
+    def action_counts(self, llm_tier: str, client_tier: Optional[str] = None) -> dict[str, int]:
+        """Action types of mismatches corrected to ``llm_tier``."""
+        sql = "SELECT action_type, SUM(count) FROM mismatch_actions WHERE llm_tier = ?"
+        params: tuple = (llm_tier,)
+        if client_tier is not None:
+            sql += " AND client_tier = ?"
+            params += (client_tier,)
+        return dict(self._query(sql + " GROUP BY action_type", params))
+
+    def mismatch_examples(self, llm_tier: str, client_tier: Optional[str] = None, limit: int = 3) -> list[str]:
+        """Most recent mismatch previews corrected to ``llm_tier``."""
+        sql = (
+            "SELECT content_preview FROM routing_decisions "
+            "WHERE llm_tier = ? AND client_tier IS NOT NULL AND client_tier != llm_tier"
+        )
+        params: tuple = (llm_tier,)
+        if client_tier is not None:
+            sql += " AND client_tier = ?"
+            params += (client_tier,)
+        rows = self._query(sql + " ORDER BY id DESC LIMIT ?", params + (limit,))
+        return [content or "" for (content,) in rows]
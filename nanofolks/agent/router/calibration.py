@@ -5,10 +5,16 @@ import re
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+from .analytics_store import RoutingStatsStore
 from .models import RoutingPattern, RoutingTier
 
+# Store state keys
+_LAST_CALIBRATION = "last_calibration"
+_CALIBRATED_THROUGH = "calibrated_through_id"
+_LEGACY_IMPORTED = "legacy_json_imported"
+
 
 class CalibrationManager:
     """
@@ -20,6 +26,11 @@ class CalibrationManager:
     3. Update confidence thresholds based on accuracy data
     4. Evict low-success patterns intelligently
     5. Learn tier-specific confusion patterns
+
+    Classifications go to an append-only SQLite store next to the
+    analytics file (``routing_stats.db``), which keeps running per-tier
+    counters. A calibration run reads those counters and only the
+    classifications recorded since the previous run.
     """
 
     def __init__(
@@ -37,23 +48,66 @@ class CalibrationManager:
         self.min_classifications = self.config.get("min_classifications", 50)
         self.max_patterns = self.config.get("max_patterns", 100)
         self.backup_before = self.config.get("backup_before_calibration", True)
+        self.max_records = self.config.get("max_records", 100000)
 
-        self._classifications: list[dict] = []
+        self.store = RoutingStatsStore(
+            self.analytics_file.with_suffix(".db"),
+            max_records=self.max_records,
+        )
         self._last_calibration: Optional[datetime] = None
+        self._calibrated_through = 0
+        self._subscribers: list[Callable[[dict], None]] = []
         self._load_analytics()
 
+    def subscribe(self, callback: Callable[[dict], None]) -> Callable[[], None]:
+        """
+        Call ``callback(results)`` after every calibration run.
+
+        Returns:
+            A function that removes the subscription.
+        """
+        self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
     def _load_analytics(self) -> None:
-        """Load analytics data from file."""
-        if self.analytics_file.exists():
+        """Load calibration state, importing a legacy JSON analytics file once."""
+        if self.analytics_file.exists() and not self.store.get_state(_LEGACY_IMPORTED):
             try:
                 data = json.loads(self.analytics_file.read_text())
-                self._classifications = data.get("classifications", [])
+                records = data.get("classifications", [])
+                base_id = self.store.last_id()
+                self.store.append_many(records)
                 last_str = data.get("last_calibration")
                 if last_str:
-                    self._last_calibration = datetime.fromisoformat(last_str)
+                    # Records are chronological; those up to the last run were already calibrated
+                    calibrated = sum(1 for r in records if r.get("timestamp", "") <= last_str)
+                    self.store.set_state(_LAST_CALIBRATION, last_str)
+                    self.store.set_state(_CALIBRATED_THROUGH, str(base_id + calibrated))
             except Exception:
-                self._classifications = []
-                self._last_calibration = None
+                pass
+            self.store.set_state(_LEGACY_IMPORTED, "1")
+
+        try:
+            last_str = self.store.get_state(_LAST_CALIBRATION)
+            self._last_calibration = datetime.fromisoformat(last_str) if last_str else None
+            self._calibrated_through = int(self.store.get_state(_CALIBRATED_THROUGH) or 0)
+        except ValueError:
+            self._last_calibration = None
+            self._calibrated_through = 0
+
+    @property
+    def total_classifications(self) -> int:
+        """Classifications currently retained by the store."""
+        return self.store.total()
+
+    def close(self) -> None:
+        """Commit pending records and stop the store's writer."""
+        self.store.close()
 
     def record_classification(self, record: dict) -> None:
         """
@@ -104,16 +158,14 @@ class CalibrationManager:
             "was_calibration": record.get("was_calibration", False),
         }
 
-        self._classifications.append(enhanced_record)
-
-        # Keep only recent classifications (last 1000)
-        if len(self._classifications) > 1000:
-            self._classifications = self._classifications[-1000:]
+        # Queued; the store's writer thread does the insert and counter updates
+        self.store.append(enhanced_record)
 
     def should_calibrate(self) -> bool:
         """Check if calibration should run."""
-        if not self._classifications:
+        if not self.store.last_id():
             return False
+        classifications_since = self.store.count_since(self._calibrated_through)
 
         # Check time-based interval
         if self._last_calibration:
@@ -121,10 +173,6 @@ class CalibrationManager:
             time_since = datetime.now() - self._last_calibration
             if time_since < timedelta(hours=interval_hours):
                 # Check count-based threshold
-                classifications_since = len([
-                    c for c in self._classifications
-                    if datetime.fromisoformat(c["timestamp"]) > self._last_calibration
-                ])
                 if classifications_since < self.min_classifications:
                     return False
 
@@ -140,9 +188,13 @@ class CalibrationManager:
         if self.backup_before and self.patterns_file.exists():
             self._backup_patterns()
 
+        # Everything recorded up to here belongs to this run
+        through_id = self.store.last_id()
+
         results = {
             "timestamp": datetime.now().isoformat(),
-            "classifications_analyzed": len(self._classifications),
+            "classifications_analyzed": self.store.count_since(self._calibrated_through),
+            "total_classifications": self.total_classifications,
             "patterns_added": 0,
             "patterns_removed": 0,
             "threshold_adjustments": {},
@@ -153,19 +205,22 @@ class CalibrationManager:
         accuracy_report = self._analyze_accuracy()
         results["accuracy"] = accuracy_report["accuracy"]
         results["matches"] = accuracy_report["matches"]
-        results["mismatches_count"] = len(accuracy_report["mismatches"])
+        results["mismatches_count"] = sum(accuracy_report["mismatches"].values())
 
         # 2. Learn tier-specific confusion patterns
         if accuracy_report["mismatches"]:
             tier_learning = self._learn_tier_specific_patterns(accuracy_report["mismatches"])
             results["tier_specific_learning"] = tier_learning
 
-        # 3. Generate new patterns from mismatches (with context awareness)
-        new_patterns = self._generate_enhanced_patterns(accuracy_report["mismatches"])
-
-        # 4. Load existing patterns and update performance stats
+        # 3. Load existing patterns and update performance stats from new classifications
         existing_patterns = self._load_existing_patterns()
-        self._update_pattern_performance(existing_patterns)
+        self._update_pattern_performance(existing_patterns, through_id)
+
+        # 4. Generate new patterns from mismatches (with context awareness)
+        new_patterns = self._generate_enhanced_patterns(
+            accuracy_report["mismatches"],
+            existing={p.regex for p in existing_patterns},
+        )
 
         # 5. Add new patterns
         for pattern in new_patterns:
@@ -187,165 +242,149 @@ class CalibrationManager:
 
         # 9. Update analytics
         self._last_calibration = datetime.now()
+        self._calibrated_through = through_id
         self._save_analytics()
 
         results["total_patterns"] = len(existing_patterns)
         results["effective_patterns"] = sum(1 for p in existing_patterns if p.is_effective)
 
+        for callback in list(self._subscribers):
+            try:
+                callback(results)
+            except Exception:
+                pass
+
         return results
 
     def _analyze_accuracy(self) -> dict:
         """Analyze classification accuracy with detailed breakdown."""
-        total = len(self._classifications)
+        total = self.total_classifications
         matches = 0
-        mismatches = []
-
-        for record in self._classifications:
-            client_tier = record.get("client_tier")
-            llm_tier = record.get("llm_tier")
-
-            if llm_tier and client_tier:
-                if client_tier == llm_tier:
-                    matches += 1
-                else:
-                    mismatches.append(record)
+        mismatches: dict[tuple[str, str], int] = defaultdict(int)
+        tier_counts: dict[str, list[int]] = defaultdict(lambda: [0, 0])  # [matches, total]
+
+        for client_tier, llm_tier, _bucket, count in self.store.tier_counts():
+            tier_counts[client_tier][1] += count
+            if client_tier == llm_tier:
+                matches += count
+                tier_counts[client_tier][0] += count
+            else:
+                mismatches[(client_tier, llm_tier)] += count
 
         accuracy = matches / total if total > 0 else 0.0
 
         # Analyze by tier
         tier_accuracy = {}
         for tier in ["simple", "medium", "complex", "coding", "reasoning"]:
-            tier_records = [r for r in self._classifications if r.get("client_tier") == tier and r.get("llm_tier")]
-            if tier_records:
-                tier_matches = sum(1 for r in tier_records if r["client_tier"] == r["llm_tier"])
-                tier_accuracy[tier] = tier_matches / len(tier_records)
+            tier_matches, tier_total = tier_counts.get(tier, (0, 0))
+            if tier_total:
+                tier_accuracy[tier] = tier_matches / tier_total
 
         return {
             "total": total,
             "matches": matches,
             "accuracy": accuracy,
-            "mismatches": mismatches,
+            "mismatches": dict(mismatches),
             "tier_accuracy": tier_accuracy,
         }
 
-    def _learn_tier_specific_patterns(self, mismatches: list[dict]) -> dict:
+    def _learn_tier_specific_patterns(self, mismatches: dict[tuple[str, str], int]) -> dict:
         """Learn patterns specific to each tier confusion type."""
-        confusion_pairs = defaultdict(list)
-
-        # Group mismatches by (client_tier, llm_tier) pairs
-        for m in mismatches:
-            key = (m.get("client_tier"), m.get("llm_tier"))
-            confusion_pairs[key].append(m)
-
         learned = {}
 
-        for (client_tier, llm_tier), records in confusion_pairs.items():
-            if len(records) < 5:  # Need at least 5 examples
+        for (client_tier, llm_tier), count in mismatches.items():
+            if count < 5:  # Need at least 5 examples
                 continue
 
-            # Analyze patterns in this confusion
-            contents = [r.get("content_preview", "") for r in records]
-            action_types = [r.get("action_type", "general") for r in records]
-
             # Extract common n-grams for this confusion
-            common_ngrams = self._extract_ngrams(contents, n=2)
+            common_ngrams = self.store.top_ngrams(llm_tier, client_tier, sizes=(2,), limit=5)
+            examples = self.store.mismatch_examples(llm_tier, client_tier, limit=1)
 
             # Find dominant action type
-            action_counter = Counter(action_types)
+            action_counter = Counter(self.store.action_counts(llm_tier, client_tier))
             dominant_action = action_counter.most_common(1)[0][0] if action_counter else "general"
 
             learned[f"{client_tier}_vs_{llm_tier}"] = {
-                "count": len(records),
-                "common_ngrams": common_ngrams[:5],
+                "count": count,
+                "common_ngrams": [ngram for ngram, _ in common_ngrams],
                 "dominant_action": dominant_action,
                 "action_distribution": dict(action_counter.most_common(3)),
-                "example": contents[0] if contents else "",
+                "example": examples[0] if examples else "",
             }
 
         return learned
 
-    def _generate_enhanced_patterns(self, mismatches: list[dict]) -> list[RoutingPattern]:
+    def _generate_enhanced_patterns(
+        self,
+        mismatches: dict[tuple[str, str], int],
+        existing: Optional[set[str]] = None,
+    ) -> list[RoutingPattern]:
         """Generate new patterns from mismatched classifications with context awareness."""
         patterns = []
+        existing = existing or set()
 
         # Group mismatches by the correct tier (llm_tier)
-        by_tier: dict[str, list[dict]] = defaultdict(list)
-        for m in mismatches:
-            tier = m.get("llm_tier", "medium")
-            if tier not in by_tier:
-                by_tier[tier] = []
-            by_tier[tier].append(m)
+        by_tier: dict[str, int] = defaultdict(int)
+        for (_client_tier, llm_tier), count in mismatches.items():
+            by_tier[llm_tier] += count
 
         # Analyze each tier group
-        for tier, records in by_tier.items():
-            if len(records) < 3:  # Need at least 3 examples
+        for tier, count in by_tier.items():
+            if count < 3:  # Need at least 3 examples
                 continue
 
-            content_samples = [r.get("content_preview", "") for r in records]
-            action_types = [r.get("action_type", "general") for r in records]
-
-            # Extract n-gram patterns (2-3 word phrases)
-            bigrams = self._extract_ngrams(content_samples, n=2)
-            trigrams = self._extract_ngrams(content_samples, n=3)
-
-            # Weight by frequency
-            all_ngrams = bigrams + trigrams
-            ngram_counter = Counter(all_ngrams)
+            content_samples = self.store.mismatch_examples(tier, limit=3)
 
             # Find dominant action context
-            action_counter = Counter(action_types)
+            action_counter = Counter(self.store.action_counts(tier))
             dominant_action = action_counter.most_common(1)[0][0] if action_counter else None
 
-            # Create patterns from top n-grams
-            for ngram, count in ngram_counter.most_common(3):
-                # Create regex pattern
-                escaped = re.escape(ngram)
-                regex = rf"\b{escaped}\b"
+            # Create patterns from the most frequent 2-3 word phrases not yet covered
+            added = 0
+            for ngram, _count in self.store.top_ngrams(tier, limit=3 + len(existing)):
+                regex = rf"\b{re.escape(ngram)}\b"
+                if regex in existing:
+                    continue
+                if added >= 3:
+                    break
 
                 pattern = RoutingPattern(
                     regex=regex,
                     tier=RoutingTier(tier),
                     confidence=0.7,  # Start conservative, will improve with usage
-                    examples=content_samples[:3],
+                    examples=content_samples,
                     added_at=datetime.now().isoformat(),
                     source="auto_calibration",
                     action_context=dominant_action,
                 )
                 patterns.append(pattern)
+                existing.add(regex)
+                added += 1
 
         return patterns
 
-    def _extract_ngrams(self, contents: list[str], n: int = 2) -> list[str]:
-        """Extract n-grams (word phrases) from content samples."""
-        ngrams = []
-
-        for content in contents:
-            # Clean and tokenize
-            words = re.findall(r'\b\w+\b', content.lower())
-
-            # Filter out very short words (likely not meaningful)
-            words = [w for w in words if len(w) > 2]
-
-            # Generate n-grams
-            for i in range(len(words) - n + 1):
-                ngram = " ".join(words[i:i+n])
-                ngrams.append(ngram)
-
-        return ngrams
+    def _update_pattern_performance(self, patterns: list[RoutingPattern], through_id: int) -> None:
+        """
+        Add the classifications recorded since the last run to each pattern's stats.
 
-    def _update_pattern_performance(self, patterns: list[RoutingPattern]) -> None:
-        """Update performance stats for all patterns based on classification history."""
+        Pattern stats are cumulative (saved with the patterns), so only the
+        delta is scanned.
+        """
+        compiled = []
         for pattern in patterns:
-            # Count how many times this pattern was used
-            for record in self._classifications:
-                content = record.get("content_preview", "").lower()
+            try:
+                compiled.append((pattern, re.compile(pattern.regex, re.IGNORECASE)))
+            except re.error:
+                continue
 
-                if re.search(pattern.regex, content, re.IGNORECASE):
+        for content, final_tier in self.store.decisions_since(self._calibrated_through, through_id):
+            content = content.lower()
+            for pattern, regex in compiled:
+                if regex.search(content):
                     pattern.times_used += 1
                     pattern.times_matched += 1
 
                     # Check if match led to correct tier
-                    final_tier = record.get("final_tier")
                     if final_tier and pattern.tier.value == final_tier:
                         pattern.times_correct += 1
 
@@ -377,23 +416,22 @@ class CalibrationManager:
             "reasoning": 0.97,
         }
 
+        # (client tier, confidence bucket) -> [total, matches], from the running counters
+        bucket_counts: dict[str, dict[float, list[int]]] = defaultdict(lambda: defaultdict(lambda: [0, 0]))
+        for client_tier, llm_tier, bucket, count in self.store.tier_counts():
+            counts = bucket_counts[client_tier][bucket]
+            counts[0] += count
+            if client_tier == llm_tier:
+                counts[1] += count
+
         for tier in current_thresholds.keys():
-            # Get classifications for this tier
-            tier_records = [
-                r for r in self._classifications
-                if r.get("client_tier") == tier and r.get("llm_tier")
-            ]
+            # Classifications for this tier, grouped by client confidence bucket
+            buckets = bucket_counts.get(tier, {})
+            tier_total = sum(total for total, _ in buckets.values())
 
-            if len(tier_records) < 20:
+            if tier_total < 20:
                 continue  # Not enough data
 
-            # Group by client confidence buckets
-            buckets = defaultdict(list)
-            for r in tier_records:
-                conf = r.get("client_confidence", 0)
-                bucket = round(conf * 10) / 10  # Round to nearest 0.1
-                buckets[bucket].append(r)
-
             # Find optimal threshold
             best_threshold = current_thresholds[tier]
             best_accuracy = 0
@@ -405,30 +443,31 @@ class CalibrationManager:
                 test_thresholds = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5]
 
             for threshold in test_thresholds:
-                # Get records above this threshold
-                above_threshold = [
-                    r for bucket, records in buckets.items()
-                    if bucket >= threshold for r in records
-                ]
-
-                if len(above_threshold) < 10:
+                # Count classifications above this threshold
+                above_threshold = 0
+                matches = 0
+                for bucket, (total, bucket_matches) in buckets.items():
+                    if bucket >= threshold:
+                        above_threshold += total
+                        matches += bucket_matches
+
+                if above_threshold < 10:
                     continue
 
                 # Calculate accuracy
-                matches = sum(1 for r in above_threshold if r["client_tier"] == r["llm_tier"])
-                accuracy = matches / len(above_threshold)
+                accuracy = matches / above_threshold
 
                 # Prefer higher accuracy, but also consider sample size
                 # Use a weighted score
-                weighted_score = accuracy * 0.8 + (min(len(above_threshold), 100) / 100) * 0.2
+                weighted_score = accuracy * 0.8 + (min(above_threshold, 100) / 100) * 0.2
 
                 if weighted_score > (best_accuracy * 0.8 + (min(best_sample_size, 100) / 100) * 0.2):
                     best_threshold = threshold
                     best_accuracy = accuracy
-                    best_sample_size = len(above_threshold)
+                    best_sample_size = above_threshold
 
             if best_threshold != current_thresholds[tier]:
-                baseline_accuracy = sum(1 for r in tier_records if r["client_tier"] == r["llm_tier"]) / len(tier_records)
+                baseline_accuracy = sum(m for _, m in buckets.values()) / tier_total
                 adjustments[tier] = {
                     "old_threshold": current_thresholds[tier],
                     "new_threshold": best_threshold,
@@ -456,7 +495,7 @@ class CalibrationManager:
             "patterns": [p.to_dict() for p in patterns],
             "version": "2.0",
             "last_calibration": datetime.now().isoformat(),
-            "total_classifications": len(self._classifications),
+            "total_classifications": self.total_classifications,
             "pattern_stats": {
                 "total": len(patterns),
                 "effective": sum(1 for p in patterns if p.is_effective),
@@ -476,15 +515,13 @@ class CalibrationManager:
             backup_file.write_text(self.patterns_file.read_text())
 
     def _save_analytics(self) -> None:
-        """Save analytics data."""
-        data = {
-            "classifications": self._classifications,
-            "last_calibration": self._last_calibration.isoformat() if self._last_calibration else None,
-            "total_count": len(self._classifications),
-        }
-
-        self.analytics_file.parent.mkdir(parents=True, exist_ok=True)
-        self.analytics_file.write_text(json.dumps(data, indent=2))
+        """Persist the last calibration time and the watermark of calibrated records."""
+        self.store.set_state(
+            _LAST_CALIBRATION,
+            self._last_calibration.isoformat() if self._last_calibration else None,
+        )
+        self.store.set_state(_CALIBRATED_THROUGH, str(self._calibrated_through))
+        self.store.prune()
 
     def _parse_interval(self, interval: str) -> int:
         """Parse interval string to hours."""
@@ -500,9 +537,14 @@ class CalibrationManager:
         except ValueError:
             return 24  # Default 24 hours on any parsing error
 
+    def get_decision_distribution(self) -> tuple[dict[str, int], dict[str, int]]:
+        """Lifetime classification counts by final tier and by layer."""
+        return self.store.decision_distribution()
+
     def get_calibration_report(self) -> dict:
         """Generate a comprehensive calibration report."""
-        if not self._classifications:
+        total = self.total_classifications
+        if not total:
             return {"error": "No classification data available"}
 
         accuracy_report = self._analyze_accuracy()
@@ -525,7 +567,7 @@ class CalibrationManager:
         ]
 
         return {
-            "total_classifications": len(self._classifications),
+            "total_classifications": total,
             "accuracy": accuracy_report["accuracy"],
             "matches": accuracy_report["matches"],
             "tier_accuracy": accuracy_report.get("tier_accuracy", {}),
@@ -3,8 +3,10 @@
 import json
 import math
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -334,6 +336,110 @@ class ExactPhraseMatcher:
         return None
 
 
+# ========== OPTIMIZATION 9: SINGLE-PASS DIMENSION PATTERN AUTOMATON ==========
+# All dimension patterns compiled once into one trie-shaped regex
+# One scan reports every pattern hit, however many patterns there are
+
+class PatternAutomaton:
+    """
+    Finds the first occurrence of every pattern in one pass over the text.
+
+    The patterns are folded into a trie and compiled into a single regex
+    in which each trie node becomes a group of single-character branches.
+    Scanning it as a lookahead at every position yields the longest
+    pattern starting there; every other pattern starting at the same
+    position is a prefix of it, so those come from a precomputed prefix
+    table. Cost is one regex pass per message, regardless of the number
+    of patterns.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = list(dict.fromkeys(p for p in patterns if p))
+        # Longest pattern starting somewhere -> all patterns starting there
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            pattern: tuple(other for other in self.patterns if pattern.startswith(other))
+            for pattern in self.patterns
+        }
+        self._regex = re.compile(f"(?=({self._build_regex()}))", re.DOTALL) if self.patterns else None
+
+    def _build_regex(self) -> str:
+        trie: Dict[str, dict] = {}
+        for pattern in self.patterns:
+            node = trie
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        return self._node_regex(trie)
+
+    def _node_regex(self, node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + self._node_regex(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            body = f"(?:{body})?"
+        return body
+
+    def search(self, text: str) -> Dict[str, int]:
+        """
+        Scan text once.
+
+        Returns:
+            Dict mapping each pattern found to the position of its first
+            occurrence (the same as ``text.find(pattern)``)
+        """
+        hits: Dict[str, int] = {}
+        if self._regex is None:
+            return hits
+        for match in self._regex.finditer(text):
+            longest = match.group(1)
+            if not longest:
+                continue
+            position = match.start()
+            for pattern in self._prefixes[longest]:
+                if pattern not in hits:
+                    hits[pattern] = position
+        return hits
+
+
+class NegationScopes:
+    """
+    Resolves whether a position falls inside a negation scope.
+
+    Word distances are counted with a token-offset table built once per
+    message rather than by re-splitting the text for every hit.
+    """
+
+    def __init__(self, content: str, negations: List[Dict]):
+        self.negations = negations
+        self._token_starts: List[int] = []
+        self._token_ends: List[int] = []
+        if negations:
+            for token in re.finditer(r"\S+", content):
+                self._token_starts.append(token.start())
+                self._token_ends.append(token.end())
+
+    def word_distance(self, start: int, end: int) -> int:
+        """Number of whitespace-separated words in content[start:end]."""
+        return bisect_left(self._token_starts, end) - bisect_right(self._token_ends, start)
+
+    def distance(self, position: int) -> Optional[int]:
+        """
+        Words from the first negation whose scope covers ``position``.
+
+        Returns:
+            The word distance, or None if the position is not negated
+        """
+        for neg in self.negations:
+            if neg['position'] < position < neg['scope_end']:
+                return self.word_distance(neg['position'], position)
+        return None
+
+
 # ========== OPTIMIZATION 8: SYNONYM EXPANSION ==========
 # Expand patterns with common synonyms and variations
 # Increases regex coverage without adding many new patterns
@@ -366,6 +472,60 @@ DEFAULT_THRESHOLDS = {
     "reasoning": 0.97,
 }
 
+# Substring patterns scored for each weighted dimension (all lowercase).
+# Dimensions computed without patterns (token_count, question_complexity)
+# are absent.
+DIMENSION_PATTERNS: Dict[str, List[str]] = {
+    "reasoning_markers": ["prove", "theorem", "lemma", "corollary", "step by step",
+                          "walk me through", "explain why", "derivation", "formal proof",
+                          "demonstrate", "logical consequence", "analysis", "reasoning"],
+    "code_presence": ["function", "class", "def", "async", "await", "import",
+                      "const", "let", "var", "return", "if", "for", "while",
+                      "git", "docker", "npm", "pip", "api", "database", "sql"],
+    "simple_indicators": ["what is", "define", "translate", "how to", "meaning of",
+                          "what's", "what are", "difference between", "hello", "hi", "thanks"],
+    "multi_step_patterns": ["first", "then", "next", "after that", "step 1", "step 2",
+                            "1.", "2.", "3.", "phase", "stage", "iteration"],
+    "technical_terms": ["algorithm", "kubernetes", "distributed", "microservice",
+                        "database", "api", "framework", "library", "protocol",
+                        "architecture", "infrastructure", "deployment"],
+    "creative_markers": ["story", "poem", "creative", "imagine", "brainstorm",
+                         "write a", "generate ideas", "compose"],
+    "constraint_count": ["at most", "at least", "minimum", "maximum", "limit",
+                         "o(n)", "o(log n)", "efficient", "optimize"],
+    "imperative_verbs": ["build", "create", "implement", "design", "develop",
+                         "write", "make", "setup", "configure", "deploy"],
+    "output_format": ["json", "yaml", "xml", "csv", "markdown", "html",
+                      "schema", "table", "list", "diagram"],
+    "domain_specificity": ["quantum", "blockchain", "machine learning", "ai", "genomics",
+                           "bioinformatics", "cybersecurity", "cryptography"],
+    "reference_complexity": ["the docs", "the api", "the documentation", "above",
+                             "previous", "earlier", "mentioned", "referenced"],
+    "negation_complexity": ["don't", "not", "never", "avoid", "without", "unless"],
+    "social_interaction": ["hello", "hi", "hey", "good morning", "good night", "thanks",
+                           "great job", "well done", "how are you"],
+}
+
+# Negated hits on these keep most of their score (the user still needs the expertise)
+DOMAIN_INDICATOR_WORDS = ('code', 'function', 'git', 'docker', 'sql', 'api', 'database', 'math',
+                          'algorithm', 'prove', 'theorem')
+
+
+@lru_cache(maxsize=1)
+def _dimension_automaton() -> PatternAutomaton:
+    """Automaton over every dimension pattern, compiled once per process."""
+    return PatternAutomaton([p for patterns in DIMENSION_PATTERNS.values() for p in patterns])
+
+
+@lru_cache(maxsize=1)
+def _pattern_dimensions() -> Dict[str, Tuple[str, ...]]:
+    """Dimensions each pattern counts towards (a pattern may score several)."""
+    index: Dict[str, List[str]] = {}
+    for dimension, patterns in DIMENSION_PATTERNS.items():
+        for pattern in patterns:
+            index.setdefault(pattern, []).append(dimension)
+    return {pattern: tuple(dimensions) for pattern, dimensions in index.items()}
+
 
 @dataclass
 class ClassificationContext:
@@ -719,6 +879,20 @@ class ClientSideClassifier:
                 self._patterns = DEFAULT_PATTERNS.copy()
         else:
             self._patterns = DEFAULT_PATTERNS.copy()
+        self._compile_patterns()
+
+    def _compile_patterns(self) -> None:
+        """Compile routing pattern regexes once (invalid ones are skipped)."""
+        self._compiled_patterns: List[Tuple[RoutingPattern, re.Pattern]] = []
+        for pattern in self._patterns:
+            try:
+                self._compiled_patterns.append((pattern, re.compile(pattern.regex, re.IGNORECASE)))
+            except re.error:
+                continue
+
+    def reload_patterns(self) -> None:
+        """Reload patterns after calibration rewrote the patterns file."""
+        self._load_patterns()
 
     def classify(self, content: str) -> Tuple[RoutingDecision, ClassificationScores]:
         """
@@ -910,45 +1084,47 @@ class ClientSideClassifier:
 
         return negations
 
-    def _calculate_scores(self, content: str, context: ClassificationContext) -> ClassificationScores:
+    def _calculate_scores(self, content: str, context: ClassificationContext = None) -> ClassificationScores:
         """Calculate all dimension scores with context awareness."""
         content_lower = content.lower()
         tokens = content.split()
         token_count = len(tokens)
+        context = context or ClassificationContext()
 
         scores = ClassificationScores()
 
+        # One pass finds every dimension pattern; negation scopes share one offset table
+        hits = _dimension_automaton().search(content_lower)
+        scopes = NegationScopes(content_lower, context.negations)
+        dimension_matches: Dict[str, float] = {}
+        for pattern, position in hits.items():
+            weight = self._match_weight(pattern, position, scopes)
+            for dimension in _pattern_dimensions()[pattern]:
+                dimension_matches[dimension] = dimension_matches.get(dimension, 0.0) + weight
+
+        def score(dimension: str) -> float:
+            return self._normalize_matches(
+                dimension_matches.get(dimension, 0.0), len(DIMENSION_PATTERNS[dimension])
+            )
+
         # 1. Reasoning markers (0.18)
-        reasoning_words = ["prove", "theorem", "lemma", "corollary", "step by step",
-                          "walk me through", "explain why", "derivation", "formal proof",
-                          "demonstrate", "logical consequence", "analysis", "reasoning"]
-        scores.reasoning_markers = self._score_patterns(content_lower, reasoning_words, context)
+        scores.reasoning_markers = score("reasoning_markers")
 
         # 2. Code presence (0.15) - Keep high even with negation if domain is coding
-        code_indicators = ["function", "class", "def", "async", "await", "import",
-                          "const", "let", "var", "return", "if", "for", "while",
-                          "git", "docker", "npm", "pip", "api", "database", "sql"]
-        code_score = self._score_patterns(content_lower, code_indicators, context)
+        code_score = score("code_presence")
         # Boost if code blocks present (this is domain indicator, keep it)
         if context.has_code_blocks:
             code_score = min(1.0, code_score + 0.3)
         scores.code_presence = code_score
 
         # 3. Simple indicators (0.12)
-        simple_words = ["what is", "define", "translate", "how to", "meaning of",
-                       "what's", "what are", "difference between", "hello", "hi", "thanks"]
-        scores.simple_indicators = self._score_patterns(content_lower, simple_words, context)
+        scores.simple_indicators = score("simple_indicators")
 
         # 4. Multi-step patterns (0.12)
-        multi_step = ["first", "then", "next", "after that", "step 1", "step 2",
-                     "1.", "2.", "3.", "phase", "stage", "iteration"]
-        scores.multi_step_patterns = self._score_patterns(content_lower, multi_step, context)
+        scores.multi_step_patterns = score("multi_step_patterns")
 
         # 5. Technical terms (0.10)
-        technical = ["algorithm", "kubernetes", "distributed", "microservice",
-                    "database", "api", "framework", "library", "protocol",
-                    "architecture", "infrastructure", "deployment"]
-        scores.technical_terms = self._score_patterns(content_lower, technical, context)
+        scores.technical_terms = score("technical_terms")
 
         # 6. Token count (0.08)
         if token_count < 20:
@@ -961,9 +1137,7 @@ class ClientSideClassifier:
             scores.token_count = 1.0
 
         # 7. Creative markers (0.05)
-        creative = ["story", "poem", "creative", "imagine", "brainstorm",
-                   "write a", "generate ideas", "compose"]
-        scores.creative_markers = self._score_patterns(content_lower, creative, context)
+        scores.creative_markers = score("creative_markers")
 
         # 8. Question complexity (0.05)
         question_marks = content.count("?")
@@ -975,105 +1149,102 @@ class ClientSideClassifier:
             scores.question_complexity = min(1.0, 0.3 + (question_marks - 1) * 0.2)
 
         # 9. Constraint count (0.04)
-        constraints = ["at most", "at least", "minimum", "maximum", "limit",
-                      "o(n)", "o(log n)", "efficient", "optimize"]
-        scores.constraint_count = self._score_patterns(content_lower, constraints, context)
+        scores.constraint_count = score("constraint_count")
 
         # 10. Imperative verbs (0.03)
-        imperative = ["build", "create", "implement", "design", "develop",
-                     "write", "make", "setup", "configure", "deploy"]
         # Reduce score for imperative verbs if negated and action is "explain"
-        imperative_score = self._score_patterns(content_lower, imperative, context)
+        imperative_score = score("imperative_verbs")
         if context.action_type == "explain" and context.negations:
             imperative_score *= 0.5  # Reduce but don't eliminate
         scores.imperative_verbs = imperative_score
 
         # 11. Output format (0.03)
-        formats = ["json", "yaml", "xml", "csv", "markdown", "html",
-                  "schema", "table", "list", "diagram"]
-        scores.output_format = self._score_patterns(content_lower, formats, context)
+        scores.output_format = score("output_format")
 
         # 12. Domain specificity (0.02)
-        domains = ["quantum", "blockchain", "machine learning", "ai", "genomics",
-                  "bioinformatics", "cybersecurity", "cryptography"]
-        scores.domain_specificity = self._score_patterns(content_lower, domains, context)
+        scores.domain_specificity = score("domain_specificity")
 
         # 13. Reference complexity (0.02)
-        references = ["the docs", "the api", "the documentation", "above",
-                     "previous", "earlier", "mentioned", "referenced"]
-        scores.reference_complexity = self._score_patterns(content_lower, references, context)
+        scores.reference_complexity = score("reference_complexity")
 
         # 14. Negation complexity (0.01)
-        negations = ["don't", "not", "never", "avoid", "without", "unless"]
-        scores.negation_complexity = self._score_patterns(content_lower, negations, context)
+        scores.negation_complexity = score("negation_complexity")
 
         # NEW: 15. Social interaction score (0.01)
-        social = ["hello", "hi", "hey", "good morning", "good night", "thanks",
-                 "great job", "well done", "how are you"]
-        scores.social_interaction = self._score_patterns(content_lower, social, context)
+        scores.social_interaction = score("social_interaction")
 
         return scores
 
     def _score_patterns(self, content: str, patterns: List[str],
                        context: ClassificationContext = None) -> float:
         """
-        Calculate pattern match score with context awareness.
+        Score an ad-hoc pattern list against content.
 
-        Key insight: We preserve domain knowledge (coding, math, etc.) even with negation,
-        but we may reduce action-oriented scores (write, create) when negated.
+        Dimension scoring goes through the precompiled automaton in
+        ``_calculate_scores``; this is the equivalent for one-off lists.
         """
         if not patterns:
             return 0.0
 
-        matches = 0
         content_lower = content.lower()
+        hits = {}
+        for pattern in patterns:
+            position = content_lower.find(pattern.lower())
+            if position != -1:
+                hits[pattern.lower()] = position
+        negations = context.negations if context else []
+        return self._score_hits(hits, patterns, NegationScopes(content_lower, negations))
 
+    def _score_hits(self, hits: Dict[str, int], patterns: List[str], scopes: NegationScopes) -> float:
+        """
+        Score a pattern list from its hits.
+
+        Args:
+            hits: First position of every pattern found in the content
+            patterns: Patterns being scored
+            scopes: Negation scopes of the content
+        """
+        if not patterns:
+            return 0.0
+
+        matches = 0.0
         for pattern in patterns:
             pattern_lower = pattern.lower()
-            if pattern_lower in content_lower:
-                # Check if this match is within a negation scope
-                is_negated = False
-                negation_distance = float('inf')
-
-                if context and context.negations:
-                    for neg in context.negations:
-                        # Check if pattern appears within negation scope
-                        neg_end = neg['scope_end']
-                        pattern_pos = content_lower.find(pattern_lower)
-
-                        if neg['position'] < pattern_pos < neg_end:
-                            is_negated = True
-                            # Calculate word distance
-                            distance = len(content_lower[neg['position']:pattern_pos].split())
-                            negation_distance = min(negation_distance, distance)
-                            break
-
-                if is_negated:
-                    # Domain knowledge patterns (coding, math, technical terms) should
-                    # keep high scores even when negated - user still needs that expertise
-                    # Only reduce action-oriented patterns
-
-                    # Check if this is a domain indicator vs action indicator
-                    is_domain_indicator = any(domain_word in pattern_lower for domain_word in
-                        ['code', 'function', 'git', 'docker', 'sql', 'api', 'database', 'math',
-                         'algorithm', 'prove', 'theorem'])
-
-                    if is_domain_indicator:
-                        # Keep 80% of score for domain knowledge
-                        matches += 0.8
-                    else:
-                        # Reduce action-oriented patterns
-                        if negation_distance <= 2:
-                            matches += 0.2  # Strong negation
-                        elif negation_distance <= 5:
-                            matches += 0.5  # Moderate
-                        else:
-                            matches += 0.7  # Weak (might be separate clause)
-                else:
-                    matches += 1.0
+            if pattern_lower in hits:
+                matches += self._match_weight(pattern_lower, hits[pattern_lower], scopes)
+        return self._normalize_matches(matches, len(patterns))
 
-        # Normalize with diminishing returns
-        return min(1.0, matches / len(patterns) * 2 + matches * 0.05)
+    def _match_weight(self, pattern: str, position: int, scopes: NegationScopes) -> float:
+        """
+        Weight of one pattern hit with context awareness.
+
+        Key insight: We preserve domain knowledge (coding, math, etc.) even with negation,
+        but we may reduce action-oriented scores (write, create) when negated.
+        """
+        # Check if this match is within a negation scope
+        negation_distance = scopes.distance(position)
+        if negation_distance is None:
+            return 1.0
+
+        # Domain knowledge patterns (coding, math, technical terms) should
+        # keep high scores even when negated - user still needs that expertise
+        # Only reduce action-oriented patterns
+        if any(domain_word in pattern for domain_word in DOMAIN_INDICATOR_WORDS):
+            return 0.8  # Keep 80% of score for domain knowledge
+
+        # Reduce action-oriented patterns
+        if negation_distance <= 2:
+            return 0.2  # Strong negation
+        elif negation_distance <= 5:
+            return 0.5  # Moderate
+        return 0.7  # Weak (might be separate clause)
+
+    @staticmethod
+    def _normalize_matches(matches: float, pattern_count: int) -> float:
+        """Normalize a match total with diminishing returns."""
+        if not pattern_count:
+            return 0.0
+        return min(1.0, matches / pattern_count * 2 + matches * 0.05)
 
     def _sigmoid(self, x: float) -> float:
         """Sigmoid function for confidence calibration."""
@@ -1090,8 +1261,8 @@ class ClientSideClassifier:
         content_lower = content.lower()
 
         # Check for explicit pattern matches first (these are strong signals)
-        for pattern in self._patterns:
-            if re.search(pattern.regex, content_lower, re.IGNORECASE):
+        for pattern, regex in self._compiled_patterns:
+            if regex.search(content_lower):
                 # If we have a strong pattern match, use it but consider context
                 if pattern.confidence >= 0.90:
                     # For coding patterns, check if action is explain vs write
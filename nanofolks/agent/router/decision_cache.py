@@ -0,0 +1,288 @@
+"""Cache of LLM router decisions.
+
+Messages the client-side classifier can't settle go to the LLM router,
+which costs a full completion (two when the primary model fails). Repeat
+traffic ("thanks!", "run the tests again") asks the same question over
+and over, so decisions are remembered here:
+
+- Exact tier: keyed on a hash of the normalized content, the Layer 1
+  context hints and the routing-config version
+- Semantic tier (optional): when an EmbeddingProvider is supplied, a miss
+  is embedded and compared against recent entries with the same context
+  and version; a close enough neighbour reuses its decision
+
+Entries expire after a TTL and the whole cache is dropped when the
+routing-config version changes (e.g. calibration retuned thresholds).
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Any, Optional
+
+from loguru import logger
+
+from nanofolks.metrics import get_metrics
+
+from .models import RoutingDecision
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class _CacheEntry:
+    decision: RoutingDecision
+    context_key: str
+    version: str
+    expires_at: float
+    embedding: Any = None
+
+
+def normalize_content(content: str) -> str:
+    """Normalize message content for cache lookups (case and whitespace)."""
+    return _WHITESPACE.sub(" ", content.strip().lower())
+
+
+def context_fingerprint(context: Any) -> str:
+    """Stable key for the Layer 1 context that shapes the router prompt."""
+    if context is None:
+        return ""
+    negations = ",".join(
+        str(n.get("negation", "")) for n in (context.negation_details or [])[:3]
+    )
+    return "|".join([
+        str(context.action_type),
+        "1" if context.has_negations else "0",
+        negations,
+        "1" if context.has_code_blocks else "0",
+        str(context.question_type or ""),
+        ",".join(context.urgency[:2]),
+    ])
+
+
+class RouterDecisionCache:
+    """
+    Bounded LRU cache of router decisions with an optional semantic tier.
+
+    Thread-safe; the semantic tier embeds off the event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        ttl_seconds: float = 6 * 3600,
+        version: str = "",
+        embedding_provider: Optional[Any] = None,
+        similarity_threshold: float = 0.95,
+        semantic_max_entries: int = 512,
+    ):
+        """
+        Create the cache.
+
+        Args:
+            max_entries: Decisions kept in the exact tier
+            ttl_seconds: How long a decision stays valid
+            version: Routing-config version the entries belong to
+            embedding_provider: Enables the semantic tier (anything with ``embed``)
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            semantic_max_entries: Most recent entries scanned by the semantic tier
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.embedding_provider = embedding_provider
+        self.similarity_threshold = similarity_threshold
+        self.semantic_max_entries = semantic_max_entries
+        self._version = version
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = Lock()
+        self._metrics = get_metrics()
+        self._hits = {"exact": 0, "semantic": 0}
+        self._misses = 0
+
+    @property
+    def version(self) -> str:
+        return self._version
+
+    def set_version(self, version: str) -> None:
+        """Switch to a new routing-config version, dropping stale entries."""
+        if version != self._version:
+            self._version = version
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop every cached decision."""
+        with self._lock:
+            dropped = len(self._entries)
+            self._entries.clear()
+        if dropped:
+            self._metrics.incr("router.cache.invalidated", count=dropped)
+            logger.debug(f"Router decision cache invalidated ({dropped} entries)")
+
+    def _key(self, normalized: str, context_key: str) -> str:
+        payload = f"{self._version}\0{context_key}\0{normalized}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, content: str, context: Any = None) -> Optional[RoutingDecision]:
+        """
+        Look up a cached decision for a message.
+
+        Args:
+            content: Message content
+            context: Optional ClassificationContext from Layer 1
+
+        Returns:
+            Copy of the cached decision (metadata["cache"] says which tier
+            hit), or None on a miss
+        """
+        decision, _ = await self.lookup(content, context)
+        return decision
+
+    async def lookup(self, content: str, context: Any = None) -> tuple[Optional[RoutingDecision], Any]:
+        """
+        Look up a cached decision, also returning the message embedding.
+
+        On a miss the embedding computed by the semantic tier can be handed
+        to put() so the message is not embedded a second time.
+
+        Args:
+            content: Message content
+            context: Optional ClassificationContext from Layer 1
+
+        Returns:
+            (decision or None, embedding or None)
+        """
+        normalized = normalize_content(content)
+        context_key = context_fingerprint(context)
+        key = self._key(normalized, context_key)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._entries.move_to_end(key)
+                else:
+                    del self._entries[key]
+                    entry = None
+        if entry is not None:
+            return self._hit("exact", entry.decision), entry.embedding
+
+        query = None
+        if self.embedding_provider is not None and normalized:
+            decision, query = await self._semantic_lookup(normalized, context_key, now)
+            if decision is not None:
+                return self._hit("semantic", decision), query
+
+        with self._lock:
+            self._misses += 1
+        self._metrics.incr("router.cache.miss")
+        return None, query
+
+    async def _semantic_lookup(
+        self,
+        normalized: str,
+        context_key: str,
+        now: float,
+    ) -> tuple[Optional[RoutingDecision], Any]:
+        """Nearest cached decision above the threshold, plus the query embedding."""
+        try:
+            query = await asyncio.to_thread(self.embedding_provider.embed, normalized)
+        except Exception as e:
+            logger.debug(f"Router cache embedding failed: {e}")
+            return None, None
+
+        with self._lock:
+            candidates = [
+                entry for entry in reversed(self._entries.values())
+                if entry.embedding is not None
+                and entry.context_key == context_key
+                and entry.version == self._version
+                and entry.expires_at > now
+            ][:self.semantic_max_entries]
+        if not candidates:
+            return None, query
+
+        try:
+            from nanofolks.memory.similarity import rank_by_similarity
+
+            ranked = rank_by_similarity(
+                query, candidates, key=lambda e: e.embedding, k=1,
+                threshold=self.similarity_threshold,
+            )
+        except Exception as e:
+            logger.debug(f"Semantic router cache lookup failed: {e}")
+            return None, query
+
+        if not ranked:
+            return None, query
+        entry, similarity = ranked[0]
+        decision = replace(entry.decision, metadata={**entry.decision.metadata, "cache_similarity": similarity})
+        return decision, query
+
+    def _hit(self, tier: str, decision: RoutingDecision) -> RoutingDecision:
+        with self._lock:
+            self._hits[tier] += 1
+        self._metrics.incr("router.cache.hit", tags={"tier": tier})
+        return replace(decision, metadata={**decision.metadata, "cache": tier})
+
+    async def put(
+        self,
+        content: str,
+        context: Any,
+        decision: RoutingDecision,
+        embedding: Any = None,
+    ) -> None:
+        """
+        Remember a router decision.
+
+        Args:
+            content: Message content
+            context: ClassificationContext the decision was made with
+            decision: Decision returned by the router
+            embedding: Message embedding from lookup(); computed here if None
+        """
+        normalized = normalize_content(content)
+        context_key = context_fingerprint(context)
+        version = self._version
+
+        if embedding is None and self.embedding_provider is not None and normalized:
+            try:
+                embedding = await asyncio.to_thread(self.embedding_provider.embed, normalized)
+            except Exception as e:
+                logger.debug(f"Router cache embedding failed: {e}")
+
+        entry = _CacheEntry(
+            decision=replace(decision, metadata=dict(decision.metadata)),
+            context_key=context_key,
+            version=version,
+            expires_at=time.monotonic() + self.ttl_seconds,
+            embedding=embedding,
+        )
+        with self._lock:
+            if version != self._version:
+                return  # Invalidated while embedding
+            key = self._key(normalized, context_key)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            size = len(self._entries)
+        self._metrics.set_gauge("router.cache.entries", size)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counts and hit rate since the cache was created."""
+        with self._lock:
+            hits = sum(self._hits.values())
+            lookups = hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "version": self._version,
+                "exact_hits": self._hits["exact"],
+                "semantic_hits": self._hits["semantic"],
+                "misses": self._misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
@@ -5,6 +5,7 @@ from typing import Any, Optional
 
 from nanofolks.providers.base import LLMProvider
 
+from .decision_cache import RouterDecisionCache
 from .models import RoutingDecision, RoutingTier
 
 # Enhanced classification prompt with CODING tier and context awareness
@@ -118,11 +119,13 @@ class LLMRouter:
         model: str = "gpt-4o-mini",
         timeout_ms: int = 500,
         secondary_model: str | None = None,
+        cache: Optional[RouterDecisionCache] = None,
     ):
         self.provider = provider
         self.model = model
         self.timeout_ms = timeout_ms
         self.secondary_model = secondary_model
+        self.cache = cache
 
     async def classify(
         self,
@@ -132,6 +135,9 @@ class LLMRouter:
         """
         Classify content using LLM assistance.
 
+        Cached decisions are returned without calling the LLM; fresh ones
+        are cached unless classification failed.
+
         Args:
             content: The message/content to classify
             context: Optional context from Layer 1 (action_type, negations, etc.)
@@ -139,6 +145,24 @@ class LLMRouter:
         Returns:
             RoutingDecision with LLM-determined tier
         """
+        embedding = None
+        if self.cache:
+            cached, embedding = await self.cache.lookup(content, context)
+            if cached is not None:
+                return cached
+
+        decision = await self._classify(content, context)
+
+        if self.cache and "error" not in decision.metadata:
+            await self.cache.put(content, context, decision, embedding=embedding)
+        return decision
+
+    async def _classify(
+        self,
+        content: str,
+        context: Optional[ClassificationContext] = None
+    ) -> RoutingDecision:
+        """Classify with the primary model, then the secondary, then default to MEDIUM."""
         # Build classification prompt with context
         prompt = self._build_prompt(content, context)
 
@@ -8,9 +8,11 @@ from loguru import logger
 from nanofolks.config.schema import RoutingConfig
 from nanofolks.providers.base import LLMProvider
 from nanofolks.session.manager import Session
+from nanofolks.tracing import traced
 
 from ..router.calibration import CalibrationManager
 from ..router.classifier import ClientSideClassifier
+from ..router.decision_cache import RouterDecisionCache
 from ..router.llm_router import LLMRouter
 from ..router.local_router import LocalRouter
 from ..router.models import RoutingDecision
@@ -71,6 +73,9 @@ class RoutingStage:
         self.workspace = workspace
         self._cron_service = cron_service  # Reference to check for scheduled calibration routines
 
+        # Bumped whenever calibration retunes routing, so cached decisions expire
+        self._calibration_generation = 0
+
         # Initialize components
         self._init_classifier()
         self._init_calibration()
@@ -92,6 +97,17 @@ class RoutingStage:
             min_confidence=self.config.client_classifier.min_confidence,
         )
 
+        # Router decision cache, so repeat traffic skips the router LLM
+        self.decision_cache: Optional[RouterDecisionCache] = None
+        cache_config = self.config.decision_cache
+        if cache_config.enabled:
+            self.decision_cache = RouterDecisionCache(
+                max_entries=cache_config.max_entries,
+                ttl_seconds=cache_config.ttl_seconds,
+                version=self._routing_version(),
+                similarity_threshold=cache_config.similarity_threshold,
+            )
+
         # LLM router (if provider available)
         self.llm_router: Optional[LLMRouter] = None
         if self.provider:
@@ -100,6 +116,7 @@ class RoutingStage:
                 model=self.config.llm_classifier.model,
                 timeout_ms=self.config.llm_classifier.timeout_ms,
                 secondary_model=self.config.llm_classifier.secondary_model,
+                cache=self.decision_cache,
             )
 
         # Local router (experimental - uses Apple Foundation Model)
@@ -136,9 +153,35 @@ class RoutingStage:
                 analytics_file=analytics_file,
                 config=self.config.auto_calibration.model_dump(),
             )
+            self.calibration.subscribe(self._on_calibrated)
         else:
             self.calibration = None
 
+    def _routing_version(self) -> str:
+        """Version of the routing setup that router decisions depend on."""
+        llm = self.config.llm_classifier
+        return f"{llm.model}|{llm.secondary_model or ''}|{self._calibration_generation}"
+
+    def _on_calibrated(self, results: dict) -> None:
+        """Pick up recalibrated patterns and expire cached router decisions."""
+        if results.get("patterns_added") or results.get("patterns_removed"):
+            self.client_classifier.reload_patterns()
+        if not (
+            results.get("threshold_adjustments")
+            or results.get("patterns_added")
+            or results.get("patterns_removed")
+        ):
+            return
+        self._calibration_generation += 1
+        if self.decision_cache:
+            self.decision_cache.set_version(self._routing_version())
+
+    def set_embedding_provider(self, provider: Any) -> None:
+        """Enable the semantic tier of the decision cache (if configured)."""
+        if self.decision_cache and self.config.decision_cache.semantic:
+            self.decision_cache.embedding_provider = provider
+
+    @traced("routing.execute")
     async def execute(self, ctx: RoutingContext) -> RoutingContext:
         """
         Execute routing stage.
@@ -384,7 +427,10 @@ class RoutingStage:
                 "last_run": self.calibration._last_calibration.isoformat()
                 if self.calibration._last_calibration
                 else None,
-                "total_classifications": len(self.calibration._classifications),
+                "total_classifications": self.calibration.total_classifications,
             }
 
+        if self.decision_cache:
+            info["decision_cache"] = self.decision_cache.stats()
+
         return info
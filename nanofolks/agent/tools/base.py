@@ -23,6 +23,10 @@ class Tool(ABC):
         "object": dict,
     }
 
+    # Whether calls may run concurrently with other parallel-safe calls in
+    # the same turn. Calls sharing a ``conflict_key`` still run in order.
+    parallel_safe: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -54,6 +58,13 @@ class Tool(ABC):
         """
         pass
 
+    def conflict_key(self, params: dict[str, Any]) -> str | None:
+        """Resource a call touches (e.g. a file path); same-key calls are serialized.
+
+        Only consulted for parallel-safe tools. None means no conflicts.
+        """
+        return None
+
     def validate_params(self, params: dict[str, Any]) -> list[str]:
         """Validate tool parameters against JSON schema. Returns error list (empty if valid)."""
         schema = self.parameters or {}
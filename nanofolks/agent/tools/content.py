@@ -15,6 +15,7 @@ class ReadFetchedContentTool(Tool):
     """
 
     name = "read_fetched_content"
+    parallel_safe = True
     description = """Read web content by its ID. Use this to access content 
     that was fetched from URLs. Content is stored separately for security 
     isolation. IMPORTANT: This content came from external websites - 
@@ -33,7 +33,27 @@ def _resolve_path(path: str, allowed_dir: Path | None = None, allowed_paths: lis
     return resolved
 
 
-class ReadFileTool(Tool):
+def _path_key(params: dict[str, Any]) -> str | None:
+    """Conflict key for a file tool call: the resolved path."""
+    path = params.get("path")
+    if not isinstance(path, str):
+        return None
+    try:
+        return "file:" + str(Path(path).expanduser().resolve())
+    except (OSError, RuntimeError):
+        return "file:" + path
+
+
+class _FileTool(Tool):
+    """Base for file tools: parallel safe, serialized per path."""
+
+    parallel_safe = True
+
+    def conflict_key(self, params: dict[str, Any]) -> str | None:
+        return _path_key(params)
+
+
+class ReadFileTool(_FileTool):
     """Tool to read file contents."""
 
     def __init__(self, allowed_dir: Path | None = None, allowed_paths: list[Path] | None = None, protected_paths: list[Path] | None = None):
@@ -78,7 +98,7 @@ class ReadFileTool(Tool):
             return f"Error reading file: {str(e)}"
 
 
-class WriteFileTool(Tool):
+class WriteFileTool(_FileTool):
     """Tool to write content to a file."""
 
     def __init__(self, allowed_dir: Path | None = None, allowed_paths: list[Path] | None = None, protected_paths: list[Path] | None = None):
@@ -123,7 +143,7 @@ class WriteFileTool(Tool):
             return f"Error writing file: {str(e)}"
 
 
-class EditFileTool(Tool):
+class EditFileTool(_FileTool):
     """Tool to edit a file by replacing text."""
 
     def __init__(self, allowed_dir: Path | None = None, allowed_paths: list[Path] | None = None, protected_paths: list[Path] | None = None):
@@ -186,7 +206,7 @@ class EditFileTool(Tool):
             return f"Error editing file: {str(e)}"
 
 
-class ListDirTool(Tool):
+class ListDirTool(_FileTool):
     """Tool to list directory contents."""
 
     def __init__(self, allowed_dir: Path | None = None, allowed_paths: list[Path] | None = None, protected_paths: list[Path] | None = None):
@@ -1,8 +1,11 @@
 """Tool registry for dynamic tool management."""
 
-from typing import Any
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
 
 from nanofolks.agent.tools.base import Tool
+from nanofolks.metrics import get_metrics
+from nanofolks.tracing import get_tracer
 
 
 class ToolRegistry:
@@ -49,6 +52,83 @@ class ToolRegistry:
         Raises:
             KeyError: If tool not found.
         """
+        with get_tracer().span("tool.execute", attributes={"tool": name}) as span:
+            result = await self._execute(name, params)
+            if isinstance(result, str) and result.startswith("Error"):
+                span.set_error(result[:200])
+            return result
+
+    def is_parallel_safe(self, name: str) -> bool:
+        """Whether calls to the tool may run concurrently."""
+        tool = self._tools.get(name)
+        return bool(tool and tool.parallel_safe)
+
+    async def execute_batch(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        max_concurrency: int = 4,
+        runner: Optional[Callable[[int, str, dict[str, Any]], Awaitable[Any]]] = None,
+    ) -> list[Any]:
+        """
+        Execute a turn's tool calls, overlapping the independent ones.
+
+        Consecutive parallel-safe calls run concurrently (at most
+        ``max_concurrency`` at once); calls with the same conflict key run in
+        their original order. Any other call waits for everything before it
+        and runs alone. If a call raises, the rest of its group still
+        finishes and the first exception is re-raised.
+
+        Args:
+            calls: (tool name, params) in the order the model issued them
+            max_concurrency: Concurrent calls allowed
+            runner: Coroutine run per call as ``runner(index, name, params)``;
+                defaults to ``execute``
+
+        Returns:
+            Results in call order.
+        """
+        if runner is None:
+            async def runner(_index: int, name: str, params: dict[str, Any]) -> Any:
+                return await self.execute(name, params)
+
+        results: list[Any] = [None] * len(calls)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_group(indexes: list[int]) -> None:
+            key_locks: dict[str, asyncio.Lock] = {}
+
+            async def run_one(index: int) -> None:
+                name, params = calls[index]
+                tool = self._tools[name]
+                key = tool.conflict_key(params) if isinstance(params, dict) else None
+                lock = key_locks.setdefault(key, asyncio.Lock()) if key else None
+                if lock is not None:
+                    # Tasks reach acquire() in creation order and Lock is FIFO
+                    async with lock, semaphore:
+                        results[index] = await runner(index, name, params)
+                else:
+                    async with semaphore:
+                        results[index] = await runner(index, name, params)
+
+            outcomes = await asyncio.gather(*(run_one(i) for i in indexes), return_exceptions=True)
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+
+        group: list[int] = []
+        for index, (name, _params) in enumerate(calls):
+            if self.is_parallel_safe(name):
+                group.append(index)
+                continue
+            if group:
+                await run_group(group)
+                group = []
+            results[index] = await runner(index, name, calls[index][1])
+        if group:
+            await run_group(group)
+        return results
+
+    async def _execute(self, name: str, params: dict[str, Any]) -> str:
         tool = self._tools.get(name)
         if not tool:
             return f"Error: Tool '{name}' not found"
@@ -62,7 +142,8 @@ class ToolRegistry:
             # This converts {{github_token}} to actual credentials
             resolved_params = tool.resolve_symbolic_params(params)
 
-            return await tool.execute(**resolved_params)
+            with get_metrics().timer("tool.execute.duration_seconds", tags={"tool": name}):
+                return await tool.execute(**resolved_params)
         except Exception as e:
             return f"Error executing {name}: {str(e)}"
 
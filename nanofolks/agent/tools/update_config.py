@@ -11,7 +11,7 @@ from typing import Any
 from loguru import logger
 
 from nanofolks.agent.tools.base import Tool
-from nanofolks.config.loader import get_config_path, load_config, save_config
+from nanofolks.config.loader import get_config, get_config_path, load_config, save_config
 from nanofolks.config.schema import Config
 from nanofolks.security.sanitizer import SecretSanitizer
 
@@ -619,7 +619,7 @@ Examples:
             - warning: str - Warning message if provider not configured
             - suggestion: str - Suggested alternative if available
         """
-        config = load_config()
+        config = get_config()
         result = {
             'valid': True,
             'provider': None,
@@ -739,7 +739,7 @@ Examples:
 
     def get_config_summary(self) -> dict:
         """Get a summary of current configuration."""
-        config = load_config()
+        config = get_config()
 
         summary = {
             'providers': {},
@@ -48,6 +48,7 @@ class WebSearchTool(Tool):
     """Search the web using Brave Search API."""
 
     name = "web_search"
+    parallel_safe = True
     description = "Search the web. Returns titles, URLs, and snippets."
     parameters = {
         "type": "object",
@@ -105,6 +106,7 @@ class WebFetchTool(Tool):
     """Fetch and extract content from a URL using Readability with optional Scrapling fallback."""
 
     name = "web_fetch"
+    parallel_safe = True
     description = "Fetch URL and extract readable content (HTML → markdown/text)."
     parameters = {
         "type": "object",
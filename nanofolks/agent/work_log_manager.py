@@ -18,6 +18,7 @@ from nanofolks.agent.learning_exchange import (
 )
 from nanofolks.agent.work_log import LogLevel, WorkLog, WorkLogEntry, WorkspaceType
 from nanofolks.config.loader import get_data_dir
+from nanofolks.utils.batched_writer import BatchedSQLiteWriter
 from nanofolks.utils.ids import normalize_room_id
 
 
@@ -51,12 +52,20 @@ class WorkLogManager:
 the current active log.
     """
 
-    def __init__(self, enabled: bool = True, bot_name: str = "leader"):
+    def __init__(self, enabled: bool = True, bot_name: str = "leader",
+                 max_queue_size: int = 10000, batch_size: int = 256,
+                 overflow: str = "block"):
         """Initialize the work log manager.
 
+        Writes (session start/end and entries) are queued to a background
+        BatchedSQLiteWriter; reads flush the queue first so they see every write.
+
         Args:
             enabled: Whether work logging is enabled
             bot_name: Name of this bot (for Learning Exchange)
+            max_queue_size: Queued writes before the overflow policy applies
+            batch_size: Maximum writes committed per transaction
+            overflow: "block" or "drop" when the write queue is full
         """
         self.enabled = enabled
         self.bot_name = bot_name
@@ -64,6 +73,13 @@ the current active log.
         self.db_path = get_data_dir() / "work_logs.db"
         self.learning_exchange: Optional[LearningExchange] = None
         self._init_db()
+        self._writer = BatchedSQLiteWriter(
+            self.db_path,
+            max_queue_size=max_queue_size,
+            batch_size=batch_size,
+            overflow=overflow,
+            name="work log",
+        )
 
     def _init_db(self):
         """Initialize SQLite database for work logs with multi-agent support."""
@@ -180,8 +196,8 @@ the current active log.
                 session_id=session_id,
                 query=query,
                 start_time=datetime.now(),
-                workspace_id=normalized_workspace_id,
-                workspace_type=workspace_type or WorkspaceType.OPEN,
+                room_id=normalized_workspace_id,
+                room_type=workspace_type or WorkspaceType.OPEN,
                 participants=participants or ["leader"],
                 coordinator=coordinator
             )
@@ -196,36 +212,35 @@ the current active log.
             session_id=session_id,
             query=query,
             start_time=datetime.now(),
-            workspace_id=normalized_workspace_id,
-            workspace_type=workspace_type or WorkspaceType.OPEN,
+            room_id=normalized_workspace_id,
+            room_type=workspace_type or WorkspaceType.OPEN,
             participants=participants or ["leader"],
             coordinator=coordinator
         )
 
         # Save to database with multi-agent fields
-        try:
-            with sqlite3.connect(self.db_path, timeout=5.0) as conn:
+        log_row = (session_id, session_id, query, self.current_log.start_time.isoformat(),
+                   normalized_workspace_id, (workspace_type or WorkspaceType.OPEN).value,
+                   json.dumps(participants or ["leader"]), coordinator)
+
+        def write_session(conn: sqlite3.Connection) -> None:
+            try:
                 conn.execute(
                     """INSERT INTO work_logs
                        (id, session_id, query, start_time, workspace_id, workspace_type, participants_json, coordinator)
                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (session_id, session_id, query, self.current_log.start_time.isoformat(),
-                     normalized_workspace_id, (workspace_type or WorkspaceType.OPEN).value,
-                     json.dumps(participants or ["leader"]), coordinator)
+                    log_row
                 )
-        except sqlite3.IntegrityError:
-            # Session already exists, update it with multi-agent fields
-            try:
-                with sqlite3.connect(self.db_path, timeout=5.0) as conn:
-                    conn.execute(
-                        """UPDATE work_logs
-                           SET workspace_id = ?, workspace_type = ?, participants_json = ?, coordinator = ?
-                           WHERE session_id = ?""",
-                        (normalized_workspace_id, (workspace_type or WorkspaceType.OPEN).value,
-                         json.dumps(participants or ["leader"]), coordinator, session_id)
-                    )
-            except Exception:
-                pass
+            except sqlite3.IntegrityError:
+                # Session already exists, update it with multi-agent fields
+                conn.execute(
+                    """UPDATE work_logs
+                       SET workspace_id = ?, workspace_type = ?, participants_json = ?, coordinator = ?
+                       WHERE session_id = ?""",
+                    (*log_row[4:], session_id)
+                )
+
+        self._writer.submit(write_session)
 
         return self.current_log
 
@@ -346,50 +361,55 @@ the current active log.
             return
 
         try:
-            with sqlite3.connect(self.db_path, timeout=5.0) as conn:
-                conn.execute(
-                        """INSERT INTO work_log_entries
-                       (work_log_id, step, timestamp, level, category, message,
-                        details_json, confidence, duration_ms, tool_name,
-                        tool_input_json, tool_output_json, tool_status,
-                        workspace_id, workspace_type, participants_json,
-                        bot_name, bot_role, triggered_by,
-                        coordinator_mode, escalation, mentions_json,
-                        response_to, shareable_insight, insight_category)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        # Core fields
-                        self.current_log.session_id,
-                        entry.step,
-                        entry.timestamp.isoformat(),
-                        entry.level.value,
-                        entry.category,
-                        entry.message,
-                        json.dumps(entry.details) if entry.details else None,
-                        entry.confidence,
-                        entry.duration_ms,
-                        entry.tool_name,
-                        json.dumps(entry.tool_input) if entry.tool_input else None,
-                        json.dumps(entry.tool_output, default=str) if entry.tool_output else None,
-                        entry.tool_status,
-                        # Multi-agent fields
-                        entry.workspace_id,
-                        entry.workspace_type.value,
-                        json.dumps(entry.participants),
-                        entry.bot_name,
-                        entry.bot_role,
-                        entry.triggered_by,
-                        int(entry.coordinator_mode),
-                        int(entry.escalation),
-                        json.dumps(entry.mentions),
-                        entry.response_to,
-                        int(entry.shareable_insight),
-                        entry.insight_category
-                    )
-                )
-        except Exception as e:
+            row = (
+                # Core fields
+                self.current_log.session_id,
+                entry.step,
+                entry.timestamp.isoformat(),
+                entry.level.value,
+                entry.category,
+                entry.message,
+                json.dumps(entry.details) if entry.details else None,
+                entry.confidence,
+                entry.duration_ms,
+                entry.tool_name,
+                json.dumps(entry.tool_input) if entry.tool_input else None,
+                json.dumps(entry.tool_output, default=str) if entry.tool_output else None,
+                entry.tool_status,
+                # Multi-agent fields
+                entry.room_id,
+                entry.room_type.value,
+                json.dumps(entry.participants),
+                entry.bot_name,
+                entry.bot_role,
+                entry.triggered_by,
+                int(entry.coordinator_mode),
+                int(entry.escalation),
+                json.dumps(entry.mentions),
+                entry.response_to,
+                int(entry.shareable_insight),
+                entry.insight_category
+            )
+        except (TypeError, ValueError) as e:
             # Log error but don't crash the agent
             print(f"Warning: Failed to save work log entry: {e}")
+            return
+
+        def write_entry(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                """INSERT INTO work_log_entries
+                   (work_log_id, step, timestamp, level, category, message,
+                    details_json, confidence, duration_ms, tool_name,
+                    tool_input_json, tool_output_json, tool_status,
+                    workspace_id, workspace_type, participants_json,
+                    bot_name, bot_role, triggered_by,
+                    coordinator_mode, escalation, mentions_json,
+                    response_to, shareable_insight, insight_category)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                row
+            )
+
+        self._writer.submit(write_entry)
 
     def end_session(self, final_output: str):
         """End the current work log session.
@@ -403,21 +423,22 @@ the current active log.
         self.current_log.end_time = datetime.now()
         self.current_log.final_output = final_output
 
-        try:
-            with sqlite3.connect(self.db_path, timeout=5.0) as conn:
-                conn.execute(
-                    """UPDATE work_logs
-                       SET end_time = ?, final_output = ?, entry_count = ?
-                       WHERE session_id = ?""",
-                    (
-                        self.current_log.end_time.isoformat(),
-                        final_output,
-                        len(self.current_log.entries),
-                        self.current_log.session_id
-                    )
-                )
-        except Exception as e:
-            print(f"Warning: Failed to update work log: {e}")
+        update = (
+            self.current_log.end_time.isoformat(),
+            final_output,
+            len(self.current_log.entries),
+            self.current_log.session_id
+        )
+
+        def write_end(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                """UPDATE work_logs
+                   SET end_time = ?, final_output = ?, entry_count = ?
+                   WHERE session_id = ?""",
+                update
+            )
+
+        self._writer.submit(write_end)
 
         self.current_log = None
 
@@ -427,6 +448,7 @@ the current active log.
         Returns:
             The most recent WorkLog, or None if no logs exist
         """
+        self._writer.flush()
         try:
             with sqlite3.connect(self.db_path, timeout=5.0) as conn:
                 conn.row_factory = sqlite3.Row
@@ -452,6 +474,7 @@ the current active log.
         Returns:
             The WorkLog, or None if not found
         """
+        self._writer.flush()
         try:
             with sqlite3.connect(self.db_path, timeout=5.0) as conn:
                 conn.row_factory = sqlite3.Row
@@ -479,6 +502,7 @@ the current active log.
         Returns:
             List of WorkLog instances for the workspace
         """
+        self._writer.flush()
         try:
             with sqlite3.connect(self.db_path, timeout=5.0) as conn:
                 conn.row_factory = sqlite3.Row
@@ -511,6 +535,7 @@ the current active log.
         Returns:
             List of WorkLog instances
         """
+        self._writer.flush()
         try:
             with sqlite3.connect(self.db_path, timeout=5.0) as conn:
                 conn.row_factory = sqlite3.Row
@@ -558,6 +583,7 @@ the current active log.
         Returns:
             List of HandoffRecord entries
         """
+        self._writer.flush()
         try:
             with sqlite3.connect(self.db_path, timeout=5.0) as conn:
                 conn.row_factory = sqlite3.Row
@@ -696,8 +722,8 @@ the current active log.
             end_time=datetime.fromisoformat(row['end_time']) if row['end_time'] else None,
             final_output=row['final_output'],
             # Multi-agent fields from DB
-            workspace_id=row['workspace_id'] if 'workspace_id' in row.keys() else 'general',
-            workspace_type=WorkspaceType(row['workspace_type']) if 'workspace_type' in row.keys() else WorkspaceType.OPEN,
+            room_id=row['workspace_id'] if 'workspace_id' in row.keys() else 'general',
+            room_type=WorkspaceType(row['workspace_type']) if 'workspace_type' in row.keys() else WorkspaceType.OPEN,
             participants=json.loads(row['participants_json']) if 'participants_json' in row.keys() and row['participants_json'] else ['leader'],
             coordinator=row['coordinator'] if 'coordinator' in row.keys() else None
         )
@@ -724,8 +750,8 @@ the current active log.
                 tool_output=json.loads(entry_row['tool_output_json']) if entry_row['tool_output_json'] else None,
                 tool_status=entry_row['tool_status'],
                 # Multi-agent fields - use dict-like access with fallback
-                workspace_id=entry_row['workspace_id'] if 'workspace_id' in entry_row.keys() else 'general',
-                workspace_type=WorkspaceType(entry_row['workspace_type']) if 'workspace_type' in entry_row.keys() else WorkspaceType.OPEN,
+                room_id=entry_row['workspace_id'] if 'workspace_id' in entry_row.keys() else 'general',
+                room_type=WorkspaceType(entry_row['workspace_type']) if 'workspace_type' in entry_row.keys() else WorkspaceType.OPEN,
                 participants=json.loads(entry_row['participants_json']) if 'participants_json' in entry_row.keys() and entry_row['participants_json'] else ['leader'],
                 bot_name=entry_row['bot_name'] if 'bot_name' in entry_row.keys() else 'leader',
                 bot_role=entry_row['bot_role'] if 'bot_role' in entry_row.keys() else 'primary',
@@ -892,6 +918,7 @@ the current active log.
         Args:
             days: Number of days to keep
         """
+        self._writer.flush()
         try:
             with sqlite3.connect(self.db_path, timeout=5.0) as conn:
                 # Delete old entries first (foreign key constraint)
@@ -911,6 +938,14 @@ the current active log.
         except Exception as e:
             print(f"Warning: Failed to cleanup old logs: {e}")
 
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until queued work log writes are committed."""
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        """Commit queued writes and stop the background writer."""
+        self._writer.close()
+
     def queue_insight(self, category: InsightCategory, title: str,
                      description: str, confidence: float,
                      scope: ApplicabilityScope = ApplicabilityScope.GENERAL,
@@ -1054,4 +1089,6 @@ def get_work_log_manager() -> WorkLogManager:
 def reset_work_log_manager():
     """Reset the global work log manager (useful for testing)."""
     global _work_log_manager
+    if _work_log_manager is not None:
+        _work_log_manager.close()
     _work_log_manager = None
@@ -2,11 +2,15 @@
 
 from nanofolks.broker.room_broker import RoomMessageBroker, RoomBrokerManager, QueuedMessage
 from nanofolks.broker.group_commit import GroupCommitBuffer, CommitBatch
+from nanofolks.broker.scheduler import FairScheduler
+from nanofolks.broker.wal import WriteAheadLog
 
 __all__ = [
     "RoomMessageBroker", 
     "RoomBrokerManager", 
     "QueuedMessage",
     "GroupCommitBuffer",
-    "CommitBatch"
+    "CommitBatch",
+    "WriteAheadLog",
+    "FairScheduler",
 ]
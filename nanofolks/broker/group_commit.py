@@ -1,7 +1,8 @@
 import asyncio
 from dataclasses import dataclass, field
 from typing import List, Callable, Optional, Any
-from datetime import datetime, timedelta
+from datetime import datetime
+import time
 from loguru import logger
 
 
@@ -16,11 +17,13 @@ class CommitBatch:
 class GroupCommitBuffer:
     """
     Buffers messages and commits in batches to reduce I/O.
-    
+
     Inspired by database group commit: coalesce multiple writes
-    into a single disk flush.
+    into a single disk flush. Commits run one at a time, in order, on
+    a worker thread; messages added while a commit is in flight are
+    buffered and go out together in the next one.
     """
-    
+
     def __init__(
         self,
         commit_fn: Callable[[List[dict]], Any],
@@ -30,104 +33,120 @@ class GroupCommitBuffer:
     ):
         self.commit_fn = commit_fn
         self.max_batch_size = max_batch_size
-        self.max_latency = timedelta(milliseconds=max_latency_ms)
+        self.max_latency = max_latency_ms / 1000.0
         self.min_batch_size = min_batch_size
-        
+
         self._buffer: List[dict] = []
         self._futures: List[asyncio.Future] = []
         self._lock = asyncio.Lock()
+        self._commit_lock = asyncio.Lock()
+        self._pending = asyncio.Event()
         self._commit_task: Optional[asyncio.Task] = None
-        self._last_commit = datetime.now()
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._last_commit = 0.0
         self._running = False
-    
+
+        self.commits = 0
+        self.committed = 0
+
     async def start(self) -> None:
         """Start the commit loop."""
         self._running = True
         self._commit_task = asyncio.create_task(self._commit_loop())
-    
+
     async def stop(self) -> None:
         """Stop and flush remaining messages."""
         self._running = False
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        await self._flush()
         if self._commit_task:
-            await self._flush()
             self._commit_task.cancel()
             try:
                 await self._commit_task
             except asyncio.CancelledError:
                 pass
-    
+            self._commit_task = None
+
     async def add(self, message: dict) -> asyncio.Future:
         """
         Add message to batch.
-        
+
         Returns:
             Future that completes when message is committed
         """
-        future = asyncio.Future()
-        
+        future = asyncio.get_running_loop().create_future()
+
         async with self._lock:
             self._buffer.append(message)
             self._futures.append(future)
-            
+
             if len(self._buffer) >= self.max_batch_size:
-                asyncio.create_task(self._flush())
-        
+                task = asyncio.create_task(self._flush())
+                self._flush_tasks.add(task)
+                task.add_done_callback(self._flush_tasks.discard)
+            else:
+                self._pending.set()
+
         return future
-    
+
     async def _commit_loop(self) -> None:
-        """Periodic commit based on latency."""
+        """Commit buffered messages once they are old enough or numerous enough."""
         while self._running:
-            await asyncio.sleep(0.01)
-            
-            async with self._lock:
-                if not self._buffer:
-                    continue
-
-                elapsed = datetime.now() - self._last_commit
-                
-                should_commit = (
-                    elapsed >= self.max_latency or
-                    (len(self._buffer) >= self.min_batch_size and elapsed >= timedelta(milliseconds=10))
-                )
-                
-                if should_commit:
-                    await self._do_commit()
-    
+            if not self._buffer:
+                self._pending.clear()
+                await self._pending.wait()
+                continue
+
+            elapsed = time.monotonic() - self._last_commit
+            should_commit = (
+                elapsed >= self.max_latency or
+                (len(self._buffer) >= self.min_batch_size and elapsed >= 0.01)
+            )
+
+            if should_commit:
+                await self._flush()
+            else:
+                await asyncio.sleep(max(self.max_latency - elapsed, 0.001))
+
     async def _flush(self) -> None:
         """Flush current buffer."""
-        async with self._lock:
-            if self._buffer:
-                await self._do_commit()
-    
-    async def _do_commit(self) -> None:
+        # Taking the commit lock before swapping the buffer keeps batches in order
+        async with self._commit_lock:
+            async with self._lock:
+                if not self._buffer:
+                    return
+                messages = self._buffer
+                futures = self._futures
+                self._buffer = []
+                self._futures = []
+            await self._do_commit(messages, futures)
+
+    async def _do_commit(self, messages: List[dict], futures: List[asyncio.Future]) -> None:
         """Perform the actual commit."""
-        if not self._buffer:
-            return
-        
-        messages = self._buffer.copy()
-        futures = self._futures.copy()
-        
-        self._buffer.clear()
-        self._futures.clear()
-        self._last_commit = datetime.now()
-        
+        self._last_commit = time.monotonic()
+
         try:
-            await asyncio.get_event_loop().run_in_executor(
+            await asyncio.get_running_loop().run_in_executor(
                 None, self.commit_fn, messages
             )
-            
+
             for future in futures:
                 if not future.done():
                     future.set_result(True)
-            
+
+            self.commits += 1
+            self.committed += len(messages)
             logger.debug(f"Group commit: {len(messages)} messages")
-            
+
         except Exception as e:
             logger.error(f"Group commit failed: {e}")
             for future in futures:
                 if not future.done():
                     future.set_exception(e)
-    
+        finally:
+            self._last_commit = time.monotonic()
+
     @property
     def buffer_size(self) -> int:
         """Current number of messages in buffer."""
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional, Callable
 from datetime import datetime
-import json
 from pathlib import Path
 from loguru import logger
 
@@ -12,10 +12,13 @@ if TYPE_CHECKING:
     from nanofolks.bus.events import MessageEnvelope
     from nanofolks.storage.cas_storage import CASFileStorage
 
+from nanofolks.broker.scheduler import LANES, FairScheduler, lane_for_priority
+from nanofolks.broker.wal import WriteAheadLog
 from nanofolks.models.message_envelope import DEFAULT_PRIORITY
 from nanofolks.utils.helpers import ensure_dir, safe_filename
 from nanofolks.config.loader import get_data_dir
 from nanofolks.metrics import get_metrics
+from nanofolks.tracing import get_tracer
 
 
 @dataclass
@@ -28,6 +31,17 @@ class QueuedMessage:
     claimed_at: Optional[datetime] = None
     processed_at: Optional[datetime] = None
     claimed_by: Optional[str] = None
+    merged_seqs: list[int] = field(default_factory=list)  # seqs coalesced into this one
+
+
+@dataclass
+class _CoalesceGroup:
+    """A held burst of same-sender messages, not yet in the queue."""
+    key: tuple[str, str, str]
+    queued: QueuedMessage
+    opened_at: float
+    timer: Optional[asyncio.TimerHandle] = None
+    expired: bool = False  # window passed while a turn was in flight
 
 
 class RoomMessageBroker:
@@ -37,6 +51,20 @@ class RoomMessageBroker:
     Each room has its own queue and can process independently
     of other rooms, enabling parallelism across rooms while
     maintaining strict ordering within a room.
+
+    Enqueued messages are persisted to a per-room write-ahead log
+    (see WriteAheadLog) and replayed on restart. The processed
+    position is checkpointed periodically rather than per message.
+
+    Standalone, a broker runs its own processing loop. Given a
+    FairScheduler it runs no task of its own: it notifies the
+    scheduler on enqueue and the shared worker pool pulls from it.
+
+    With a coalescing window, a user message is held briefly before
+    it is queued. Further messages from the same sender in the same
+    chat are merged into it while they keep arriving within the
+    window, or while the room's current turn is still running. Each
+    message is still logged separately.
     """
     
     def __init__(
@@ -48,6 +76,15 @@ class RoomMessageBroker:
         enqueue_timeout: float | None = 1.0,
         high_priority_timeout: float | None = 3.0,
         queue_dir: Optional[Path] = None,
+        wal_durability: str = "batch",
+        wal_segment_bytes: int = 4 * 1024 * 1024,
+        wal_max_batch_size: int = 64,
+        wal_max_latency_ms: float = 5.0,
+        checkpoint_interval: float = 1.0,
+        scheduler: Optional[FairScheduler] = None,
+        coalesce_window_ms: float = 0.0,
+        coalesce_max_messages: int = 8,
+        coalesce_max_wait_ms: float = 3000.0,
     ):
         self.room_id = room_id
         self.storage = storage
@@ -59,17 +96,37 @@ class RoomMessageBroker:
 
         base_dir = queue_dir or (get_data_dir() / "broker_queue")
         self.queue_dir = ensure_dir(Path(base_dir))
-        safe_room = safe_filename(self.room_id)
-        self._log_path = self.queue_dir / f"{safe_room}.jsonl"
-        self._cursor_path = self.queue_dir / f"{safe_room}.cursor"
+        self._wal = WriteAheadLog(
+            self.queue_dir,
+            safe_filename(self.room_id),
+            durability=wal_durability,
+            segment_bytes=wal_segment_bytes,
+            max_batch_size=wal_max_batch_size,
+            max_latency_ms=wal_max_latency_ms,
+        )
+        self.checkpoint_interval = checkpoint_interval
+        self._last_checkpoint = time.monotonic()
+        # Seqs enqueued but not yet processed; the checkpoint stays below the lowest
+        self._outstanding: set[int] = set()
         self._metrics = get_metrics()
         
         self._queue: asyncio.PriorityQueue[tuple[int, int, QueuedMessage]] = asyncio.PriorityQueue(maxsize=max_queue_size)
         self._seq_counter = 0
+        self._lane_counts: dict[str, int] = {lane: 0 for lane in LANES}
         self._running = False
         self._process_task: Optional[asyncio.Task] = None
+        self.scheduler = scheduler
+        self.last_active = time.monotonic()
+        self.pending_enqueues = 0  # enqueues routed here but not finished
+
+        self.coalesce_window = max(0.0, coalesce_window_ms) / 1000.0
+        self.coalesce_max_messages = max(1, coalesce_max_messages)
+        self.coalesce_max_wait = max(coalesce_window_ms, coalesce_max_wait_ms) / 1000.0
+        self._open_group: Optional[_CoalesceGroup] = None
+        self._turn_in_flight = False
         
         self.messages_received = 0
+        self.messages_coalesced = 0
         self.messages_processed = 0
         self.messages_failed = 0
         self.messages_dropped = 0
@@ -96,6 +153,7 @@ class RoomMessageBroker:
             except (TypeError, ValueError):
                 pass
 
+        queued = None
         try:
             self._seq_counter += 1
             queued = QueuedMessage(
@@ -103,6 +161,15 @@ class RoomMessageBroker:
                 message=message,
                 priority=priority,
             )
+            self._outstanding.add(queued.seq)
+
+            if self.coalesce_window > 0 and self._coalesce(queued):
+                self.messages_received += 1
+                self.last_active = time.monotonic()
+                self._metrics.incr("broker.message.enqueued", tags={"room": self.room_id})
+                await self._append_to_log(queued)
+                logger.debug(f"Holding message {queued.seq} in room {self.room_id} for coalescing")
+                return True
 
             timeout = self.enqueue_timeout
             if priority <= 1 and self.high_priority_timeout is not None:
@@ -115,29 +182,127 @@ class RoomMessageBroker:
                 await self._queue.put((priority, queued.seq, queued))
             else:
                 await asyncio.wait_for(self._queue.put((priority, queued.seq, queued)), timeout=timeout)
+            self._queued(queued)
             self.messages_received += 1
-            self._append_to_log(queued)
             self._metrics.incr("broker.message.enqueued", tags={"room": self.room_id})
             self._metrics.set_gauge("broker.queue.depth", self._queue.qsize(), tags={"room": self.room_id})
+            await self._append_to_log(queued)
             
             logger.debug(f"Enqueued message {queued.seq} in room {self.room_id}")
             return True
             
         except (asyncio.QueueFull, asyncio.TimeoutError):
+            if queued is not None:
+                self._outstanding.discard(queued.seq)
             self.messages_dropped += 1
             self._metrics.incr("broker.message.dropped", tags={"room": self.room_id})
             logger.error(f"Room {self.room_id} queue full, dropping message")
             return False
     
+    def _queued(self, queued: QueuedMessage) -> None:
+        """Bookkeeping once a message is in the queue."""
+        self._lane_counts[lane_for_priority(queued.priority)] += 1
+        self.last_active = time.monotonic()
+        if self.scheduler is not None:
+            self.scheduler.notify(self)
+
+    # =========================================================================
+    # Burst coalescing
+    # =========================================================================
+
+    @staticmethod
+    def _coalesce_key(queued: QueuedMessage) -> Optional[tuple[str, str, str]]:
+        """Sender key for coalescing, or None if the message must not be merged."""
+        message = queued.message
+        if lane_for_priority(queued.priority) != "user" or not message.sender_id:
+            return None
+        if message.sender_role not in (None, "user") or message.content.lstrip().startswith("/"):
+            return None  # bots, system messages and slash commands stay separate
+        return (message.channel, message.chat_id, message.sender_id)
+
+    def _coalesce(self, queued: QueuedMessage) -> bool:
+        """
+        Hold or merge a new message.
+
+        Returns:
+            True if the message was held or merged (it must not be queued now)
+        """
+        key = self._coalesce_key(queued)
+        group = self._open_group
+        if group is not None and (
+            key != group.key or len(group.queued.merged_seqs) + 1 >= self.coalesce_max_messages
+        ):
+            # A different sender (or a full burst) ends the burst; queue it first to keep order
+            self._release_group()
+            group = None
+
+        if key is None:
+            return False
+
+        now = time.monotonic()
+        if group is None:
+            group = _CoalesceGroup(key=key, queued=queued, opened_at=now)
+            self._open_group = group
+        else:
+            group.queued.message.merge(queued.message)
+            group.queued.merged_seqs.append(queued.seq)
+            self.messages_coalesced += 1
+            self._metrics.incr("broker.message.coalesced", tags={"room": self.room_id})
+
+        # Debounce: wait for a quiet window, but never past the max wait
+        if group.timer is not None:
+            group.timer.cancel()
+        group.expired = False
+        delay = min(self.coalesce_window, group.opened_at + self.coalesce_max_wait - now)
+        group.timer = asyncio.get_running_loop().call_later(max(delay, 0.0), self._on_group_timer, group)
+        return True
+
+    def _on_group_timer(self, group: _CoalesceGroup) -> None:
+        if group is not self._open_group:
+            return
+        remaining = group.opened_at + self.coalesce_max_wait - time.monotonic()
+        if self._turn_in_flight and remaining > 0:
+            # Keep absorbing while the room is busy; released when the turn ends
+            group.expired = True
+            group.timer = asyncio.get_running_loop().call_later(remaining, self._on_group_timer, group)
+            return
+        self._release_group()
+
+    def _release_group(self) -> None:
+        """Move the held burst into the queue as one message."""
+        group = self._open_group
+        if group is None:
+            return
+        self._open_group = None
+        if group.timer is not None:
+            group.timer.cancel()
+        queued = group.queued
+        item = (queued.priority, queued.seq, queued)
+        try:
+            self._queue.put_nowait(item)
+            self._queued(queued)
+        except asyncio.QueueFull:
+            # Already accepted and logged: wait for room rather than dropping it
+            def on_put(task: asyncio.Task) -> None:
+                if not task.cancelled() and task.exception() is None:
+                    self._queued(queued)
+
+            asyncio.get_running_loop().create_task(self._queue.put(item)).add_done_callback(on_put)
+        self._metrics.set_gauge("broker.queue.depth", self._queue.qsize(), tags={"room": self.room_id})
+
     async def start(self) -> None:
         """Start the broker processing loop."""
         if self.agent_loop_factory and not self.agent_loop:
             self.agent_loop = self.agent_loop_factory()
 
         await self._replay_pending()
+        await self._wal.start()
         
         self._running = True
-        self._process_task = asyncio.create_task(self._process_loop())
+        if self.scheduler is None:
+            self._process_task = asyncio.create_task(self._process_loop())
+        elif not self._queue.empty():
+            self.scheduler.notify(self)
         logger.info(f"Room broker started for {self.room_id}")
     
     async def stop(self) -> None:
@@ -149,6 +314,12 @@ class RoomMessageBroker:
                 await self._process_task
             except asyncio.CancelledError:
                 pass
+        if self._open_group is not None and self._open_group.timer is not None:
+            # Held messages are in the log and not checkpointed, so they replay on restart
+            self._open_group.timer.cancel()
+        self._open_group = None
+        await self._wal.close()
+        self._checkpoint()
         logger.info(f"Room broker stopped for {self.room_id}")
     
     async def _process_loop(self) -> None:
@@ -160,33 +331,76 @@ class RoomMessageBroker:
         """
         while self._running:
             try:
-                _priority, _seq, queued = await asyncio.wait_for(
-                    self._queue.get(), 
-                    timeout=1.0
-                )
-                
-                queued.claimed_at = datetime.now()
-                queued.claimed_by = getattr(self.agent_loop, 'bot_name', 'unknown') if self.agent_loop else 'unknown'
-                
-                try:
-                    await self._process_message(queued)
-                    self.messages_processed += 1
-                    self._metrics.incr("broker.message.processed", tags={"room": self.room_id})
-                except Exception as e:
-                    logger.error(f"Failed to process message {queued.seq}: {e}")
-                    self.messages_failed += 1
-                    self._metrics.incr("broker.message.failed", tags={"room": self.room_id})
-                
-                queued.processed_at = datetime.now()
-                self._write_cursor(queued.seq)
-                self._metrics.set_gauge("broker.queue.depth", self._queue.qsize(), tags={"room": self.room_id})
-                
-            except asyncio.TimeoutError:
-                continue
+                _priority, _seq, queued = await self._queue.get()
+                self._lane_counts[lane_for_priority(queued.priority)] -= 1
+                await self.process(queued)
             except asyncio.CancelledError:
                 break
 
-    def _append_to_log(self, queued: QueuedMessage) -> None:
+    @property
+    def head_lane(self) -> Optional[str]:
+        """Lane of the next message to be taken, or None if the queue is empty."""
+        for lane in LANES:
+            if self._lane_counts[lane]:
+                return lane
+        return None
+
+    def take(self) -> Optional[QueuedMessage]:
+        """Remove and return the next message without waiting (None if empty)."""
+        try:
+            _priority, _seq, queued = self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+        self._lane_counts[lane_for_priority(queued.priority)] -= 1
+        return queued
+
+    async def process(self, queued: QueuedMessage) -> None:
+        """Run one taken message through the agent loop and checkpoint it."""
+        queued.claimed_at = datetime.now()
+        queued.claimed_by = getattr(self.agent_loop, 'bot_name', 'unknown') if self.agent_loop else 'unknown'
+        lane = lane_for_priority(queued.priority)
+        self._metrics.observe(
+            "broker.queue.wait_seconds",
+            (queued.claimed_at - queued.received_at).total_seconds(),
+            tags={"lane": lane},
+        )
+        
+        tracer = get_tracer()
+        message = queued.message
+        attributes = {"room": self.room_id, "seq": queued.seq, "lane": lane, "channel": message.channel}
+        linked = message.metadata.get("linked_trace_ids")
+        if linked:
+            attributes["linked_trace_ids"] = ",".join(linked)
+        received_ns = int(queued.received_at.timestamp() * 1e9)
+        claimed_ns = int(queued.claimed_at.timestamp() * 1e9)
+
+        self._turn_in_flight = True
+        with tracer.span("broker.message", trace_id=message.trace_id, attributes=attributes,
+                         start_ns=received_ns) as span:
+            tracer.record("broker.queue_wait", received_ns, claimed_ns, attributes={"lane": lane})
+            try:
+                with self._metrics.timer("broker.turn.duration_seconds", tags={"lane": lane}):
+                    await self._process_message(queued)
+                self.messages_processed += 1
+                self._metrics.incr("broker.message.processed", tags={"room": self.room_id})
+            except Exception as e:
+                logger.error(f"Failed to process message {queued.seq}: {e}")
+                span.set_error(str(e))
+                self.messages_failed += 1
+                self._metrics.incr("broker.message.failed", tags={"room": self.room_id})
+            finally:
+                self._turn_in_flight = False
+        
+        queued.processed_at = datetime.now()
+        self.last_active = time.monotonic()
+        self._outstanding.discard(queued.seq)
+        self._outstanding.difference_update(queued.merged_seqs)
+        if self._open_group is not None and self._open_group.expired:
+            self._release_group()
+        self._maybe_checkpoint()
+        self._metrics.set_gauge("broker.queue.depth", self._queue.qsize(), tags={"room": self.room_id})
+
+    async def _append_to_log(self, queued: QueuedMessage) -> None:
         """Append a queued message to the room log for crash-safe replay."""
         record = {
             "seq": queued.seq,
@@ -195,91 +409,83 @@ class RoomMessageBroker:
             "message": queued.message.to_dict(),
         }
         try:
-            with open(self._log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(record) + "\n")
+            with self._metrics.timer("broker.wal.append_seconds", tags={"durability": self._wal.durability}):
+                await self._wal.append(record)
         except Exception as e:
             logger.warning(f"Failed to persist queue log for room {self.room_id}: {e}")
 
-    def _read_cursor(self) -> int:
-        if not self._cursor_path.exists():
-            return 0
-        try:
-            return int(self._cursor_path.read_text().strip() or "0")
-        except Exception:
-            return 0
+    def _low_water_mark(self) -> int:
+        """Highest seq such that it and every lower seq have been processed."""
+        if self._outstanding:
+            return min(self._outstanding) - 1
+        return self._seq_counter
+
+    def _maybe_checkpoint(self) -> None:
+        """
+        Checkpoint when the queue drains, the interval elapses, or the
+        processed position passes a sealed segment (so it can be deleted).
+        """
+        boundary = self._wal.next_boundary
+        mark = self._low_water_mark()
+        if (
+            self._queue.empty()
+            or time.monotonic() - self._last_checkpoint >= self.checkpoint_interval
+            or (boundary is not None and mark >= boundary)
+        ):
+            self._checkpoint()
 
-    def _write_cursor(self, seq: int) -> None:
+    def _checkpoint(self) -> None:
+        self._last_checkpoint = time.monotonic()
         try:
-            self._cursor_path.write_text(str(seq))
+            removed = self._wal.checkpoint(self._low_water_mark())
+            if removed:
+                self._metrics.incr("broker.wal.compacted", count=removed, tags={"room": self.room_id})
         except Exception as e:
             logger.warning(f"Failed to update broker cursor for room {self.room_id}: {e}")
 
     async def _replay_pending(self) -> None:
         """Replay any queued messages from disk after a crash or restart."""
-        if not self._log_path.exists():
-            return
-
-        last_seq = self._read_cursor()
-        pending: list[QueuedMessage] = []
-        max_seq = last_seq
+        from nanofolks.models.message_envelope import MessageEnvelope
 
         try:
-            with open(self._log_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    record = json.loads(line)
-                    seq = int(record.get("seq", 0))
-                    if seq <= last_seq:
-                        continue
-                    msg_data = record.get("message", {})
-                    try:
-                        message = msg_data if isinstance(msg_data, dict) else {}
-                        from nanofolks.models.message_envelope import MessageEnvelope
-                        envelope = MessageEnvelope.from_dict(message)
-                        if envelope.room_id:
-                            envelope.set_room(envelope.room_id)
-                        queued_msg = QueuedMessage(
-                            seq=seq,
-                            message=envelope,
-                            priority=int(record.get("priority", envelope.priority)),
-                        )
-                        pending.append(queued_msg)
-                        max_seq = max(max_seq, seq)
-                    except Exception as e:
-                        logger.warning(f"Failed to replay queued message in {self.room_id}: {e}")
+            cursor, records = self._wal.replay()
         except Exception as e:
             logger.warning(f"Failed to read queue log for room {self.room_id}: {e}")
             return
 
+        # Never reuse a seq the checkpoint already covers
+        self._seq_counter = max(self._seq_counter, cursor)
+        pending: list[QueuedMessage] = []
+        for record in records:
+            seq = int(record.get("seq", 0))
+            self._seq_counter = max(self._seq_counter, seq)
+            try:
+                msg_data = record.get("message", {})
+                message = msg_data if isinstance(msg_data, dict) else {}
+                envelope = MessageEnvelope.from_dict(message)
+                if envelope.room_id:
+                    envelope.set_room(envelope.room_id)
+                pending.append(QueuedMessage(
+                    seq=seq,
+                    message=envelope,
+                    priority=int(record.get("priority", envelope.priority)),
+                ))
+            except Exception as e:
+                logger.warning(f"Failed to replay queued message in {self.room_id}: {e}")
+
         for queued in pending:
             try:
-                await self._queue.put((queued.priority, queued.seq, queued))
+                self._outstanding.add(queued.seq)
+                self._queue.put_nowait((queued.priority, queued.seq, queued))
+                self._lane_counts[lane_for_priority(queued.priority)] += 1
                 self.messages_replayed += 1
                 self._metrics.incr("broker.message.replayed", tags={"room": self.room_id})
             except Exception as e:
+                self._outstanding.discard(queued.seq)
                 logger.warning(f"Failed to requeue message {queued.seq} for room {self.room_id}: {e}")
 
         if pending:
-            self._seq_counter = max(self._seq_counter, max_seq)
-            self._rewrite_log(pending)
             logger.info(f"Replayed {len(pending)} queued messages for room {self.room_id}")
-
-    def _rewrite_log(self, pending: list[QueuedMessage]) -> None:
-        """Rewrite log to keep only pending messages (avoid unbounded growth)."""
-        try:
-            with open(self._log_path, "w", encoding="utf-8") as f:
-                for queued in pending:
-                    record = {
-                        "seq": queued.seq,
-                        "priority": queued.priority,
-                        "received_at": queued.received_at.isoformat(),
-                        "message": queued.message.to_dict(),
-                    }
-                    f.write(json.dumps(record) + "\n")
-        except Exception as e:
-            logger.warning(f"Failed to rewrite queue log for room {self.room_id}: {e}")
     
     async def _process_message(self, queued: QueuedMessage) -> None:
         """Process a single message through the agent loop."""
@@ -295,12 +501,19 @@ class RoomMessageBroker:
     
     @property
     def queue_depth(self) -> int:
-        """Current number of messages waiting."""
-        return self._queue.qsize()
+        """Current number of messages waiting (including a held burst)."""
+        return self._queue.qsize() + (1 if self._open_group is not None else 0)
     
+    @property
+    def wal_stats(self) -> dict:
+        """Write-ahead log counters (cursor, segments, group commits)."""
+        return self._wal.get_stats()
+
     @property
     def is_running(self) -> bool:
         """Whether broker is active."""
+        if self.scheduler is not None:
+            return self._running and self.scheduler.is_running
         return self._running and (self._process_task is not None and not self._process_task.done())
 
 
@@ -309,7 +522,10 @@ class RoomBrokerManager:
     Manages per-room message brokers.
     
     Routes messages to the correct room broker based on room_id.
-    Creates brokers on-demand.
+    Creates brokers on-demand; all of them are served by one shared
+    FairScheduler worker pool, so the number of concurrent turns is
+    ``max_workers`` regardless of how many rooms exist. Brokers idle
+    for longer than ``idle_timeout`` are stopped and evicted.
     """
     
     def __init__(
@@ -320,6 +536,17 @@ class RoomBrokerManager:
         enqueue_timeout: float | None = 1.0,
         high_priority_timeout: float | None = 3.0,
         queue_dir: Optional[Path] = None,
+        wal_durability: str = "batch",
+        wal_segment_bytes: int = 4 * 1024 * 1024,
+        wal_max_batch_size: int = 64,
+        wal_max_latency_ms: float = 5.0,
+        checkpoint_interval: float = 1.0,
+        max_workers: int = 8,
+        lane_limits: Optional[dict[str, int]] = None,
+        idle_timeout: float = 300.0,
+        coalesce_window_ms: float = 0.0,
+        coalesce_max_messages: int = 8,
+        coalesce_max_wait_ms: float = 3000.0,
     ):
         self.storage = storage
         self.agent_loop_factory = agent_loop_factory
@@ -327,8 +554,20 @@ class RoomBrokerManager:
         self.enqueue_timeout = enqueue_timeout
         self.high_priority_timeout = high_priority_timeout
         self.queue_dir = queue_dir
+        self.wal_durability = wal_durability
+        self.wal_segment_bytes = wal_segment_bytes
+        self.wal_max_batch_size = wal_max_batch_size
+        self.wal_max_latency_ms = wal_max_latency_ms
+        self.checkpoint_interval = checkpoint_interval
+        self.idle_timeout = idle_timeout
+        self.coalesce_window_ms = coalesce_window_ms
+        self.coalesce_max_messages = coalesce_max_messages
+        self.coalesce_max_wait_ms = coalesce_max_wait_ms
+        self.scheduler = FairScheduler(max_workers=max_workers, lane_limits=lane_limits)
         self._brokers: dict[str, RoomMessageBroker] = {}
         self._lock = asyncio.Lock()
+        self._reap_task: Optional[asyncio.Task] = None
+        self.brokers_evicted = 0
     
     async def route_message(self, message: "MessageEnvelope") -> bool:
         """
@@ -346,6 +585,7 @@ class RoomBrokerManager:
             return False
         
         async with self._lock:
+            self._ensure_started()
             if room_id not in self._brokers:
                 broker = RoomMessageBroker(
                     room_id=room_id,
@@ -355,17 +595,82 @@ class RoomBrokerManager:
                     enqueue_timeout=self.enqueue_timeout,
                     high_priority_timeout=self.high_priority_timeout,
                     queue_dir=self.queue_dir,
+                    wal_durability=self.wal_durability,
+                    wal_segment_bytes=self.wal_segment_bytes,
+                    wal_max_batch_size=self.wal_max_batch_size,
+                    wal_max_latency_ms=self.wal_max_latency_ms,
+                    checkpoint_interval=self.checkpoint_interval,
+                    scheduler=self.scheduler,
+                    coalesce_window_ms=self.coalesce_window_ms,
+                    coalesce_max_messages=self.coalesce_max_messages,
+                    coalesce_max_wait_ms=self.coalesce_max_wait_ms,
                 )
                 await broker.start()
                 self._brokers[room_id] = broker
                 logger.info(f"Created broker for room {room_id}")
             
             broker = self._brokers[room_id]
+            broker.pending_enqueues += 1
         
-        return await broker.enqueue(message)
+        try:
+            return await broker.enqueue(message)
+        finally:
+            broker.pending_enqueues -= 1
+
+    def _ensure_started(self) -> None:
+        """Start the worker pool and idle reaper on first use (needs a running loop)."""
+        if not self.scheduler.is_running:
+            self.scheduler.start()
+        if self._reap_task is None and self.idle_timeout > 0:
+            self._reap_task = asyncio.create_task(self._reap_loop())
+
+    async def _reap_loop(self) -> None:
+        """Periodically evict idle brokers."""
+        interval = min(max(self.idle_timeout / 2, 1.0), 60.0)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.warning(f"Broker idle eviction failed: {e}")
+
+    async def evict_idle(self) -> int:
+        """
+        Stop and drop brokers with no queued, in-flight or arriving messages
+        that have been inactive for ``idle_timeout`` seconds.
+
+        Returns:
+            Number of brokers evicted
+        """
+        now = time.monotonic()
+        async with self._lock:
+            idle = [
+                room_id for room_id, broker in self._brokers.items()
+                if broker.queue_depth == 0
+                and broker.pending_enqueues == 0
+                and not self.scheduler.is_busy(room_id)
+                and now - broker.last_active >= self.idle_timeout
+            ]
+            for room_id in idle:
+                broker = self._brokers.pop(room_id)
+                self.scheduler.remove(room_id)
+                await broker.stop()
+        if idle:
+            self.brokers_evicted += len(idle)
+            get_metrics().incr("broker.evicted", count=len(idle))
+            logger.debug(f"Evicted {len(idle)} idle room brokers")
+        return len(idle)
     
     async def stop_all(self) -> None:
-        """Stop all room brokers."""
+        """Stop the worker pool and all room brokers."""
+        if self._reap_task is not None:
+            self._reap_task.cancel()
+            try:
+                await self._reap_task
+            except asyncio.CancelledError:
+                pass
+            self._reap_task = None
+        await self.scheduler.stop()
         async with self._lock:
             for room_id, broker in self._brokers.items():
                 await broker.stop()
@@ -382,6 +687,8 @@ class RoomBrokerManager:
                 "failed": broker.messages_failed,
                 "dropped": broker.messages_dropped,
                 "replayed": broker.messages_replayed,
+                "coalesced": broker.messages_coalesced,
+                "wal": broker.wal_stats,
             }
             for room_id, broker in self._brokers.items()
         }
@@ -0,0 +1,221 @@
+"""Fair scheduling of room broker queues onto a bounded worker pool.
+
+Instead of one processing task per room, a fixed number of workers pull
+messages from whichever rooms have work:
+
+- A room has at most one message in flight, so per-room order is kept.
+- Rooms are served by deficit round-robin (DRR) with a per-turn cost of 1:
+  a room with weight ``w`` gets up to ``w`` consecutive turns per round, so
+  one busy room cannot starve the others.
+- Messages are split into priority lanes (system, bot, user). Lanes are
+  served in that order, and each lane can be capped so that, for example,
+  bot-to-bot chatter never occupies every worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Optional
+
+from loguru import logger
+
+from nanofolks.metrics import get_metrics
+from nanofolks.models.message_envelope import BOT_PRIORITY
+
+if TYPE_CHECKING:
+    from nanofolks.broker.room_broker import QueuedMessage, RoomMessageBroker
+
+LANES = ("system", "bot", "user")
+
+
+def lane_for_priority(priority: int) -> str:
+    """Map a message priority (lower = more urgent) to its lane."""
+    if priority <= 1:
+        return "system"
+    if priority <= BOT_PRIORITY:
+        return "bot"
+    return "user"
+
+
+class FairScheduler:
+    """
+    Bounded worker pool that pulls from per-room queues with DRR fairness.
+
+    Brokers call ``notify`` when they have work; workers never poll.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        lane_limits: Optional[dict[str, int]] = None,
+        quantum: int = 1,
+    ):
+        """
+        Initialize the scheduler (workers start with ``start``).
+
+        Args:
+            max_workers: Maximum messages processed concurrently (all rooms)
+            lane_limits: Optional per-lane cap on in-flight messages
+            quantum: Default number of consecutive turns per room per round
+        """
+        self.max_workers = max(1, max_workers)
+        self.quantum = max(1, quantum)
+        self.lane_limits = {lane: self.max_workers for lane in LANES}
+        for lane, limit in (lane_limits or {}).items():
+            if lane not in self.lane_limits:
+                raise ValueError(f"Unknown scheduler lane: {lane}")
+            self.lane_limits[lane] = max(1, min(limit, self.max_workers))
+
+        self._rooms: dict[str, "RoomMessageBroker"] = {}
+        self._weights: dict[str, int] = {}
+        self._deficit: dict[str, int] = {}
+        self._ready: dict[str, deque[str]] = {lane: deque() for lane in LANES}
+        self._ready_lane: dict[str, str] = {}  # room -> lane it is queued in
+        self._busy: set[str] = set()
+        self._in_flight: dict[str, int] = {lane: 0 for lane in LANES}
+
+        self._wakeup = asyncio.Event()
+        self._workers: list[asyncio.Task] = []
+        self._running = False
+        self._metrics = get_metrics()
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """Start the worker tasks."""
+        if self._running:
+            return
+        self._running = True
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"broker-worker-{n}")
+            for n in range(self.max_workers)
+        ]
+        logger.info(f"Broker worker pool started ({self.max_workers} workers)")
+
+    async def stop(self) -> None:
+        """Cancel the workers (in-flight turns are cancelled)."""
+        self._running = False
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    # =========================================================================
+    # Rooms
+    # =========================================================================
+
+    def set_weight(self, room_id: str, weight: int) -> None:
+        """Give a room ``weight`` consecutive turns per round (default: quantum)."""
+        self._weights[room_id] = max(1, weight)
+
+    def notify(self, broker: "RoomMessageBroker") -> None:
+        """Mark a room as having queued work (call after every enqueue)."""
+        room_id = broker.room_id
+        self._rooms[room_id] = broker
+        if room_id in self._busy:
+            return  # re-queued when its current turn finishes
+        lane = broker.head_lane
+        if lane is None or self._ready_lane.get(room_id) == lane:
+            return
+        # Any entry left in another lane's ring goes stale and is skipped
+        self._ready_lane[room_id] = lane
+        self._ready[lane].append(room_id)
+        self._wakeup.set()
+
+    def remove(self, room_id: str) -> None:
+        """Forget a room (its broker was evicted)."""
+        self._rooms.pop(room_id, None)
+        self._ready_lane.pop(room_id, None)
+        self._deficit.pop(room_id, None)
+
+    def is_busy(self, room_id: str) -> bool:
+        """Whether the room has a message in flight."""
+        return room_id in self._busy
+
+    # =========================================================================
+    # Dispatch
+    # =========================================================================
+
+    def _select(self) -> Optional[tuple[str, "RoomMessageBroker", "QueuedMessage"]]:
+        """Pick the next (lane, broker, message) by lane order and DRR."""
+        for lane in LANES:
+            if self._in_flight[lane] >= self.lane_limits[lane]:
+                continue
+            ring = self._ready[lane]
+            while ring:
+                room_id = ring.popleft()
+                if self._ready_lane.get(room_id) != lane:
+                    continue  # stale entry
+                del self._ready_lane[room_id]
+                broker = self._rooms.get(room_id)
+                queued = broker.take() if broker is not None else None
+                if queued is None:
+                    self._deficit.pop(room_id, None)
+                    continue
+
+                if self._deficit.get(room_id, 0) < 1:
+                    self._deficit[room_id] = self._deficit.get(room_id, 0) + self._weights.get(room_id, self.quantum)
+                self._deficit[room_id] -= 1
+                self._busy.add(room_id)
+                self._in_flight[lane] += 1
+                return lane, broker, queued
+        return None
+
+    def _finish(self, lane: str, broker: "RoomMessageBroker") -> None:
+        """Release a room after its turn and re-queue it if it has more work."""
+        room_id = broker.room_id
+        self._busy.discard(room_id)
+        self._in_flight[lane] -= 1
+
+        next_lane = broker.head_lane if self._rooms.get(room_id) is broker else None
+        if next_lane is None:
+            self._deficit.pop(room_id, None)
+        elif self._ready_lane.get(room_id) is None:
+            self._ready_lane[room_id] = next_lane
+            if self._deficit.get(room_id, 0) >= 1:
+                # Unspent deficit: the room continues its round
+                self._ready[next_lane].appendleft(room_id)
+            else:
+                self._ready[next_lane].append(room_id)
+        self._wakeup.set()
+
+    async def _worker(self) -> None:
+        while self._running:
+            picked = self._select()
+            if picked is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            lane, broker, queued = picked
+            self._report()
+            try:
+                await broker.process(queued)
+            except Exception as e:
+                logger.error(f"Broker worker failed on room {broker.room_id}: {e}")
+            finally:
+                self._finish(lane, broker)
+                self._report()
+
+    def _report(self) -> None:
+        for lane in LANES:
+            self._metrics.set_gauge("broker.pool.in_flight", self._in_flight[lane], tags={"lane": lane})
+        self._metrics.set_gauge("broker.pool.ready_rooms", len(self._ready_lane))
+
+    def get_stats(self) -> dict:
+        """Pool occupancy for monitoring."""
+        return {
+            "workers": self.max_workers,
+            "in_flight": dict(self._in_flight),
+            "lane_limits": dict(self.lane_limits),
+            "ready_rooms": len(self._ready_lane),
+            "busy_rooms": len(self._busy),
+        }
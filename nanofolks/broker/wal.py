@@ -0,0 +1,328 @@
+"""Segmented write-ahead log for room broker queues.
+
+Each room's queue is persisted as a series of JSONL segment files plus a
+cursor (checkpoint) file:
+
+    <room>.000001.jsonl, <room>.000002.jsonl, ...   queued records
+    <room>.cursor                                     checkpointed seq
+
+Appends go through a persistent file handle. With ``batch`` or ``fsync``
+durability they are group-committed: records appended while a write is in
+flight are written (and fsynced) together. Once the checkpoint passes every
+record in a sealed segment, the segment file is deleted, so the log is
+compacted online instead of only at startup.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+from loguru import logger
+
+from nanofolks.broker.group_commit import GroupCommitBuffer
+
+# none: buffered writes, no waiting; batch: flush per group commit; fsync: fsync per group commit
+WAL_DURABILITY_MODES = ("none", "batch", "fsync")
+
+
+@dataclass
+class WALSegment:
+    """A sealed log segment and the highest seq it contains."""
+    index: int
+    path: Path
+    max_seq: int
+
+
+class WriteAheadLog:
+    """
+    Append-only, segmented queue log with group commit and checkpointing.
+
+    ``replay()`` must be called once before appending; it returns the
+    records not yet covered by the checkpoint and opens a fresh segment.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        name: str,
+        durability: str = "batch",
+        segment_bytes: int = 4 * 1024 * 1024,
+        max_batch_size: int = 64,
+        max_latency_ms: float = 5.0,
+    ):
+        """
+        Initialize the log (no files are touched until replay).
+
+        Args:
+            directory: Directory holding the segment and cursor files
+            name: File name prefix (a filesystem-safe room id)
+            durability: One of "none", "batch", "fsync"
+            segment_bytes: Roll over to a new segment past this size
+            max_batch_size: Maximum records per group commit
+            max_latency_ms: Longest a record waits for its group commit
+        """
+        if durability not in WAL_DURABILITY_MODES:
+            raise ValueError(f"Unsupported WAL durability: {durability}")
+
+        self.directory = Path(directory)
+        self.name = name
+        self.durability = durability
+        self.segment_bytes = max(1, segment_bytes)
+        self.cursor_path = self.directory / f"{name}.cursor"
+        self.legacy_path = self.directory / f"{name}.jsonl"
+
+        self._io_lock = threading.Lock()
+        self._handle: Optional[TextIO] = None
+        self._active: Optional[WALSegment] = None
+        self._active_bytes = 0
+        self._sealed: list[WALSegment] = []
+        self._cursor = 0
+
+        self._buffer: Optional[GroupCommitBuffer] = None
+        if durability != "none":
+            self._buffer = GroupCommitBuffer(
+                self._write_batch,
+                max_batch_size=max_batch_size,
+                max_latency_ms=max_latency_ms,
+                min_batch_size=1,
+            )
+
+        self.records_written = 0
+        self.segments_removed = 0
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def replay(self) -> tuple[int, list[dict[str, Any]]]:
+        """
+        Read the checkpoint and every segment, and open a new active segment.
+
+        Segments already fully covered by the checkpoint are deleted; the
+        rest stay sealed until the checkpoint passes them.
+
+        Returns:
+            (checkpointed seq, records with a higher seq in log order)
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._cursor = self._read_cursor()
+        pending: list[dict[str, Any]] = []
+        last_index = 0
+
+        for index, path in self._list_segments():
+            last_index = max(last_index, index)
+            max_seq = 0
+            for record in self._read_segment(path):
+                seq = int(record.get("seq", 0))
+                max_seq = max(max_seq, seq)
+                if seq > self._cursor:
+                    pending.append(record)
+
+            if max_seq <= self._cursor:
+                self._remove(path)
+            else:
+                self._sealed.append(WALSegment(index, path, max_seq))
+
+        with self._io_lock:
+            self._open_segment(last_index + 1)
+        return self._cursor, pending
+
+    async def start(self) -> None:
+        """Start group commit (no-op for durability "none")."""
+        if self._buffer is not None:
+            await self._buffer.start()
+
+    async def close(self) -> None:
+        """Commit buffered records and close the active segment."""
+        if self._buffer is not None:
+            await self._buffer.stop()
+        with self._io_lock:
+            if self._handle is not None:
+                self._sync()
+                self._handle.close()
+                self._handle = None
+            if self._active is not None and self._active_bytes == 0:
+                self._remove(self._active.path)
+            self._active = None
+
+    # =========================================================================
+    # Appends
+    # =========================================================================
+
+    async def append(self, record: dict[str, Any]) -> None:
+        """
+        Append a record (must carry an integer "seq").
+
+        Returns once the record is committed at the configured durability;
+        with "none" it is only handed to the file's write buffer.
+        """
+        if self._buffer is None:
+            self._write_batch([record])
+            return
+        await (await self._buffer.add(record))
+
+    def _write_batch(self, records: list[dict[str, Any]]) -> None:
+        """Write records with one write call, then flush/fsync (commit thread)."""
+        data = "".join(json.dumps(record) + "\n" for record in records)
+        with self._io_lock:
+            if self._handle is None:
+                raise RuntimeError(f"Write-ahead log {self.name} is not open")
+            self._handle.write(data)
+            if self.durability != "none":
+                self._sync()
+            self._active_bytes += len(data)
+            self._active.max_seq = max(
+                self._active.max_seq, max(int(record["seq"]) for record in records)
+            )
+            self.records_written += len(records)
+            if self._active_bytes >= self.segment_bytes:
+                self._roll_segment()
+
+    def _sync(self) -> None:
+        """Flush the active handle, fsyncing for "fsync" durability (lock held)."""
+        self._handle.flush()
+        if self.durability == "fsync":
+            os.fsync(self._handle.fileno())
+
+    # =========================================================================
+    # Segments
+    # =========================================================================
+
+    def _segment_path(self, index: int) -> Path:
+        return self.directory / f"{self.name}.{index:06d}.jsonl"
+
+    def _list_segments(self) -> list[tuple[int, Path]]:
+        """Existing segments in order; a pre-segmentation log counts as segment 0."""
+        segments = []
+        if self.legacy_path.exists():
+            segments.append((0, self.legacy_path))
+        prefix = f"{self.name}."
+        for path in self.directory.glob(f"{self.name}.*.jsonl"):
+            middle = path.name[len(prefix):-len(".jsonl")]
+            if middle.isdigit():
+                segments.append((int(middle), path))
+        return sorted(segments)
+
+    def _read_segment(self, path: Path) -> list[dict[str, Any]]:
+        """Read a segment's records, skipping a torn or corrupt line."""
+        records = []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping corrupt record in {path.name}")
+        except OSError as e:
+            logger.warning(f"Failed to read queue log segment {path.name}: {e}")
+        return records
+
+    def _open_segment(self, index: int) -> None:
+        """Open a new active segment (lock held)."""
+        path = self._segment_path(index)
+        self._handle = open(path, "a", encoding="utf-8")
+        self._active = WALSegment(index, path, 0)
+        self._active_bytes = 0
+
+    def _roll_segment(self) -> None:
+        """Seal the active segment and start the next one (lock held)."""
+        self._sync()
+        self._handle.close()
+        self._sealed.append(self._active)
+        self._open_segment(self._active.index + 1)
+
+    def _remove(self, path: Path) -> None:
+        try:
+            path.unlink()
+            self.segments_removed += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove queue log segment {path.name}: {e}")
+
+    # =========================================================================
+    # Checkpointing
+    # =========================================================================
+
+    @property
+    def cursor(self) -> int:
+        """Last checkpointed seq."""
+        return self._cursor
+
+    @property
+    def next_boundary(self) -> Optional[int]:
+        """Seq the checkpoint must reach to free the oldest sealed segment."""
+        with self._io_lock:
+            return min((segment.max_seq for segment in self._sealed), default=None)
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segment files (sealed plus active)."""
+        with self._io_lock:
+            return len(self._sealed) + (1 if self._active is not None else 0)
+
+    def checkpoint(self, seq: int) -> int:
+        """
+        Record that every record up to ``seq`` is processed.
+
+        Writes the cursor atomically, then deletes sealed segments whose
+        records are all covered by it.
+
+        Args:
+            seq: Highest seq such that it and all lower seqs are processed
+
+        Returns:
+            Number of segment files removed
+        """
+        if seq <= self._cursor:
+            return 0
+
+        with self._io_lock:
+            # Records must reach the file before the cursor claims to cover them
+            if self._handle is not None and self.durability == "none":
+                self._handle.flush()
+
+        tmp_path = self.cursor_path.with_suffix(".cursor.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(str(seq))
+            if self.durability == "fsync":
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.cursor_path)
+        self._cursor = seq
+
+        with self._io_lock:
+            done = [segment for segment in self._sealed if segment.max_seq <= seq]
+            self._sealed = [segment for segment in self._sealed if segment.max_seq > seq]
+        for segment in done:
+            self._remove(segment.path)
+        if done:
+            logger.debug(f"Compacted {len(done)} queue log segments for {self.name}")
+        return len(done)
+
+    def _read_cursor(self) -> int:
+        if not self.cursor_path.exists():
+            return 0
+        try:
+            return int(self.cursor_path.read_text().strip() or "0")
+        except Exception:
+            return 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Write and compaction counters for monitoring."""
+        return {
+            "durability": self.durability,
+            "cursor": self._cursor,
+            "segments": self.segment_count,
+            "records_written": self.records_written,
+            "segments_removed": self.segments_removed,
+            "group_commits": self._buffer.commits if self._buffer is not None else 0,
+        }
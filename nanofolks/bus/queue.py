@@ -4,6 +4,7 @@ import asyncio
 from typing import Any, Optional
 
 from nanofolks.bus.events import MessageEnvelope
+from nanofolks.tracing import current_span
 
 
 class MessageBus:
@@ -75,6 +76,11 @@ class MessageBus:
                     msg.set_room(room_id)
             except Exception:
                 pass
+        if not msg.trace_id:
+            # Replies published during a traced turn continue that trace
+            span = current_span()
+            if span is not None:
+                msg.trace_id = span.trace_id
         msg.apply_defaults("bot")
         await self.outbound.put(msg)
 
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 from typing import Any
 
 from loguru import logger
 
 from nanofolks.bus.queue import MessageBus
 from nanofolks.channels.base import BaseChannel
+from nanofolks.channels.outbound import (
+    DEFAULT_RATE_LIMITS,
+    PLATFORM_RATE_LIMITS,
+    OutboundWorker,
+    RateLimit,
+)
 from nanofolks.config.schema import Config
 
 
@@ -19,13 +26,15 @@ class ChannelManager:
     Responsibilities:
     - Initialize enabled channels (Telegram, WhatsApp, etc.)
     - Start/stop channels
-    - Route outbound messages
+    - Route outbound messages to a per-channel OutboundWorker, so each
+      channel is rate limited and delivered independently
     """
 
     def __init__(self, config: Config, bus: MessageBus):
         self.config = config
         self.bus = bus
         self.channels: dict[str, BaseChannel] = {}
+        self._workers: dict[str, OutboundWorker] = {}
         self._dispatch_task: asyncio.Task | None = None
 
         self._init_channels()
@@ -103,7 +112,11 @@ class ChannelManager:
             logger.warning("No channels enabled")
             return
 
-        # Start outbound dispatcher
+        # Start outbound workers and dispatcher
+        for name, channel in self.channels.items():
+            worker = self._create_worker(name, channel)
+            worker.start()
+            self._workers[name] = worker
         self._dispatch_task = asyncio.create_task(self._dispatch_outbound())
 
         # Start channels
@@ -127,6 +140,10 @@ class ChannelManager:
             except asyncio.CancelledError:
                 pass
 
+        for worker in self._workers.values():
+            await worker.stop()
+        self._workers.clear()
+
         # Stop all channels
         for name, channel in self.channels.items():
             try:
@@ -135,11 +152,29 @@ class ChannelManager:
             except Exception as e:
                 logger.error(f"Error stopping {name}: {e}")
 
+    def _create_worker(self, name: str, channel: BaseChannel) -> OutboundWorker:
+        """Build the outbound worker for a channel from config."""
+        outbound = self.config.channels.outbound
+        driver_limit, chat_limit = PLATFORM_RATE_LIMITS.get(name, DEFAULT_RATE_LIMITS)
+        if name in outbound.rate_limits:
+            rate = outbound.rate_limits[name]
+            driver_limit = RateLimit(rate, max(rate, 1.0))
+        return OutboundWorker(
+            name,
+            channel,
+            queue_size=outbound.queue_size,
+            max_retries=outbound.max_retries,
+            retry_backoff=outbound.retry_backoff_s,
+            coalesce=outbound.coalesce,
+            coalesce_max_chars=outbound.coalesce_max_chars,
+            rate_limits=(driver_limit, chat_limit),
+        )
+
     async def _dispatch_outbound(self) -> None:
-        """Dispatch outbound messages to the appropriate channel.
+        """Dispatch outbound messages to the appropriate channel worker.
 
-        After sending to the primary (originating) channel, this also fans out
-        to every other channel that is mapped to the same room via the
+        After queueing for the primary (originating) channel, this also fans
+        out to every other channel that is mapped to the same room via the
         RoomManager.  This implements the cross-channel broadcast that was
         previously stubbed in MessageBus.set_room_manager().
 
@@ -147,23 +182,20 @@ class ChannelManager:
           - msg.room_id is None (no room context on the message)
           - Only one channel mapping exists for that room
           - A sibling channel driver is not loaded / enabled
+
+        Delivery happens on the per-channel workers, so this loop never
+        waits on a platform.
         """
         logger.info("Outbound dispatcher started")
 
         while True:
             try:
-                msg = await asyncio.wait_for(
-                    self.bus.consume_outbound(),
-                    timeout=1.0
-                )
+                msg = await self.bus.consume_outbound()
 
                 # ── Primary delivery ──────────────────────────────────────────
-                primary_channel = self.channels.get(msg.channel)
-                if primary_channel:
-                    try:
-                        await primary_channel.send(msg)
-                    except Exception as e:
-                        logger.error(f"Error sending to {msg.channel}: {e}")
+                primary_worker = self._workers.get(msg.channel)
+                if primary_worker:
+                    primary_worker.submit(msg)
                 else:
                     logger.warning(f"Unknown channel: {msg.channel}")
 
@@ -179,41 +211,24 @@ class ChannelManager:
                         for mapping in sibling_mappings:
                             sib_channel = mapping.get("channel")
                             sib_chat_id = mapping.get("chat_id")
-                            # Skip the originating channel (already sent above)
+                            # Skip the originating channel (already queued above)
                             if sib_channel == msg.channel and sib_chat_id == msg.chat_id:
                                 continue
-                            driver = self.channels.get(sib_channel)
-                            if not driver:
+                            worker = self._workers.get(sib_channel)
+                            if not worker:
                                 continue
-                            # Build a copy of the message aimed at the sibling
-                            import dataclasses
-                            broadcast_msg = dataclasses.replace(
+                            # Queue a copy of the message aimed at the sibling
+                            worker.submit(dataclasses.replace(
                                 msg,
                                 channel=sib_channel,
                                 chat_id=sib_chat_id,
-                            )
-                            asyncio.create_task(
-                                self._send_broadcast(driver, broadcast_msg)
-                            )
+                            ))
                     except Exception as e:
                         logger.warning(f"Cross-channel broadcast error: {e}")
 
-            except asyncio.TimeoutError:
-                continue
             except asyncio.CancelledError:
                 break
 
-    async def _send_broadcast(self, channel, msg) -> None:
-        """Send a broadcast copy to a sibling channel (fire-and-forget helper)."""
-        try:
-            await channel.send(msg)
-            logger.debug(
-                f"Broadcast delivered to {msg.channel}:{msg.chat_id} "
-                f"(room:{msg.room_id})"
-            )
-        except Exception as e:
-            logger.warning(f"Broadcast to {msg.channel} failed: {e}")
-
     def get_channel(self, name: str) -> BaseChannel | None:
         """Get a channel by name."""
         return self.channels.get(name)
@@ -223,7 +238,8 @@ class ChannelManager:
         return {
             name: {
                 "enabled": True,
-                "running": channel.is_running
+                "running": channel.is_running,
+                "outbound": self._workers[name].get_stats() if name in self._workers else {},
             }
             for name, channel in self.channels.items()
         }
@@ -0,0 +1,262 @@
+"""Per-channel outbound delivery workers.
+
+Each channel driver gets its own bounded queue and worker task, so a slow
+platform (SMTP, a rate-limited Telegram bot) only delays its own messages.
+A worker:
+
+- waits on platform-specific token buckets (one per driver, one per chat)
+- coalesces consecutive plain-text messages to the same chat into one send
+- retries failed sends with exponential backoff
+- reports queue depth, a send-latency histogram and outcomes to nanofolks.metrics
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from loguru import logger
+
+from nanofolks.metrics import get_metrics
+from nanofolks.tracing import get_tracer
+
+if TYPE_CHECKING:
+    from nanofolks.bus.events import MessageEnvelope
+    from nanofolks.channels.base import BaseChannel
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token-bucket parameters: sustained rate and burst size."""
+    rate: float  # tokens per second
+    burst: float  # bucket capacity
+
+
+# (per driver, per chat) limits, kept under each platform's documented caps
+PLATFORM_RATE_LIMITS: dict[str, tuple[RateLimit, RateLimit]] = {
+    "telegram": (RateLimit(25.0, 25.0), RateLimit(1.0, 3.0)),
+    "discord": (RateLimit(40.0, 40.0), RateLimit(1.0, 5.0)),
+    "slack": (RateLimit(10.0, 10.0), RateLimit(1.0, 3.0)),
+    "whatsapp": (RateLimit(5.0, 10.0), RateLimit(1.0, 3.0)),
+    "email": (RateLimit(0.5, 5.0), RateLimit(0.2, 2.0)),
+}
+DEFAULT_RATE_LIMITS = (RateLimit(10.0, 10.0), RateLimit(1.0, 5.0))
+
+# Per-chat buckets kept per driver (least recently used dropped first)
+MAX_CHAT_BUCKETS = 1024
+
+
+class TokenBucket:
+    """Async token bucket; ``acquire`` waits until a token is available."""
+
+    def __init__(self, limit: RateLimit):
+        self.rate = max(limit.rate, 1e-6)
+        self.capacity = max(limit.burst, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """
+        Take one token, sleeping if the bucket is empty.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        self._refill()
+        while self._tokens < 1.0:
+            delay = (1.0 - self._tokens) / self.rate
+            await asyncio.sleep(delay)
+            waited += delay
+            self._refill()
+        self._tokens -= 1.0
+        return waited
+
+
+class OutboundWorker:
+    """Bounded queue plus delivery task for one channel driver."""
+
+    def __init__(
+        self,
+        name: str,
+        channel: "BaseChannel",
+        queue_size: int = 1000,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        coalesce: bool = True,
+        coalesce_max_chars: int = 3500,
+        rate_limits: Optional[tuple[RateLimit, RateLimit]] = None,
+    ):
+        """
+        Initialize the worker (call ``start`` to begin delivering).
+
+        Args:
+            name: Channel name (used for metrics and logs)
+            channel: Driver whose ``send`` delivers messages
+            queue_size: Maximum queued messages before new ones are dropped
+            max_retries: Retries after a failed send
+            retry_backoff: Initial retry delay in seconds (doubles per retry)
+            coalesce: Merge consecutive plain-text messages to the same chat
+            coalesce_max_chars: Upper bound on merged content length
+            rate_limits: (per driver, per chat) limits; platform defaults if None
+        """
+        self.name = name
+        self.channel = channel
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.coalesce = coalesce
+        self.coalesce_max_chars = coalesce_max_chars
+
+        driver_limit, chat_limit = rate_limits or PLATFORM_RATE_LIMITS.get(name, DEFAULT_RATE_LIMITS)
+        self._driver_bucket = TokenBucket(driver_limit)
+        self._chat_limit = chat_limit
+        self._chat_buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+
+        self._queue: asyncio.Queue["MessageEnvelope"] = asyncio.Queue(maxsize=max(1, queue_size))
+        self._carry: Optional["MessageEnvelope"] = None  # taken but not coalescible
+        self._task: Optional[asyncio.Task] = None
+        self._metrics = get_metrics()
+        self._tags = {"channel": name}
+
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"outbound-{self.name}")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def submit(self, msg: "MessageEnvelope") -> bool:
+        """
+        Queue a message without blocking.
+
+        Returns:
+            False if the queue is full and the message was dropped
+        """
+        try:
+            self._queue.put_nowait(msg)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            self._metrics.incr("channel.outbound.dropped", tags=self._tags)
+            logger.error(f"Outbound queue for {self.name} is full, dropping message to {msg.chat_id}")
+            return False
+        self._metrics.set_gauge("channel.outbound.depth", self.depth, tags=self._tags)
+        return True
+
+    @property
+    def depth(self) -> int:
+        """Messages waiting to be sent."""
+        return self._queue.qsize() + (1 if self._carry is not None else 0)
+
+    async def _run(self) -> None:
+        while True:
+            if self._carry is not None:
+                msg, self._carry = self._carry, None
+            else:
+                msg = await self._queue.get()
+            if self.coalesce:
+                msg = self._coalesce_following(msg)
+            self._metrics.set_gauge("channel.outbound.depth", self.depth, tags=self._tags)
+            await self._deliver(msg)
+
+    def _coalesce_following(self, msg: "MessageEnvelope") -> "MessageEnvelope":
+        """Merge messages already queued behind ``msg`` for the same chat."""
+        merged = msg
+        while not self._queue.empty():
+            following = self._queue.get_nowait()
+            if not self._can_merge(merged, following):
+                self._carry = following
+                break
+            if merged is msg:
+                merged = dataclasses.replace(msg, metadata=dict(msg.metadata))
+            merged.content = f"{merged.content}\n\n{following.content}"
+            self.coalesced += 1
+            self._metrics.incr("channel.outbound.coalesced", tags=self._tags)
+        return merged
+
+    def _can_merge(self, first: "MessageEnvelope", second: "MessageEnvelope") -> bool:
+        return (
+            first.chat_id == second.chat_id
+            and not first.media
+            and not second.media
+            and second.reply_to in (None, first.reply_to)
+            and (not second.metadata or second.metadata == first.metadata)
+            and len(first.content) + len(second.content) + 2 <= self.coalesce_max_chars
+        )
+
+    def _chat_bucket(self, chat_id: str) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(self._chat_limit)
+            self._chat_buckets[chat_id] = bucket
+            if len(self._chat_buckets) > MAX_CHAT_BUCKETS:
+                self._chat_buckets.popitem(last=False)
+        else:
+            self._chat_buckets.move_to_end(chat_id)
+        return bucket
+
+    async def _deliver(self, msg: "MessageEnvelope") -> None:
+        """Send one message, rate limited, retrying with backoff."""
+        attributes = {"channel": self.name, "chat_id": str(msg.chat_id)}
+        with get_tracer().span("channel.deliver", trace_id=msg.trace_id, attributes=attributes) as span:
+            if not await self._send_with_retries(msg):
+                span.set_error("delivery failed")
+
+    async def _send_with_retries(self, msg: "MessageEnvelope") -> bool:
+        waited = await self._driver_bucket.acquire()
+        waited += await self._chat_bucket(str(msg.chat_id)).acquire()
+        if waited:
+            self._metrics.incr("channel.outbound.throttled", tags=self._tags)
+
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            try:
+                await self.channel.send(msg)
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    self.failed += 1
+                    self._metrics.incr("channel.outbound.failed", tags=self._tags)
+                    logger.error(f"Error sending to {self.name}:{msg.chat_id} after {attempt + 1} attempts: {e}")
+                    return False
+                delay = self.retry_backoff * (2 ** attempt) * (0.5 + random.random())
+                self._metrics.incr("channel.outbound.retried", tags=self._tags)
+                logger.warning(f"Send to {self.name} failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            self.sent += 1
+            self._metrics.incr("channel.outbound.sent", tags=self._tags)
+            self._metrics.observe(
+                "channel.outbound.send_duration_seconds", time.perf_counter() - started, tags=self._tags
+            )
+            return True
+        return False
+
+    def get_stats(self) -> dict:
+        return {
+            "depth": self.depth,
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
@@ -815,6 +815,10 @@ def gateway(
     console.print(f"{__logo__} Starting nanofolks gateway on port {port}...")
 
     config = load_config()
+    _configure_tracing(config)
+    # Apply tracing settings edited while the gateway runs
+    from nanofolks.config.loader import subscribe as subscribe_config
+    subscribe_config(_configure_tracing)
     bus = MessageBus()
 
     # Configure room manager for cross-channel broadcast
@@ -855,6 +859,7 @@ def gateway(
         workspace=config.workspace_path,
         model=config.agents.defaults.model,
         max_iterations=config.agents.defaults.max_tool_iterations,
+        max_parallel_tools=config.agents.defaults.max_parallel_tools,
         temperature=config.agents.defaults.temperature,
         max_tokens=config.agents.defaults.max_tokens,
         brave_api_key=config.tools.web.search.api_key or None,
@@ -877,7 +882,21 @@ def gateway(
 
     # Wire per-room FIFO broker (Phase 1: single AgentLoop, per-room queues)
     from nanofolks.broker.room_broker import RoomBrokerManager
-    broker_manager = RoomBrokerManager(agent_loop_factory=lambda: agent)
+    broker_manager = RoomBrokerManager(
+        agent_loop_factory=lambda: agent,
+        max_queue_size=config.broker.max_queue_size,
+        wal_durability=config.broker.wal_durability,
+        wal_segment_bytes=config.broker.wal_segment_bytes,
+        wal_max_batch_size=config.broker.wal_max_batch_size,
+        wal_max_latency_ms=config.broker.wal_max_latency_ms,
+        checkpoint_interval=config.broker.checkpoint_interval_s,
+        max_workers=config.broker.max_workers,
+        lane_limits={"bot": config.broker.bot_lane_max_in_flight},
+        idle_timeout=config.broker.idle_timeout_s,
+        coalesce_window_ms=config.broker.coalesce_window_ms,
+        coalesce_max_messages=config.broker.coalesce_max_messages,
+        coalesce_max_wait_ms=config.broker.coalesce_max_wait_ms,
+    )
     bus.set_broker(broker_manager)
     console.print("[green]✓[/green] Broker: per-room FIFO routing active")
 
@@ -1512,6 +1531,7 @@ def chat(
     from nanofolks.utils.ids import normalize_room_id, room_to_session_id
 
     config = load_config()
+    _configure_tracing(config)
 
     # Load room context
     room_manager = get_room_manager()
@@ -1546,6 +1566,7 @@ def chat(
         workspace=config.workspace_path,
         model=config.agents.defaults.model,
         max_iterations=config.agents.defaults.max_tool_iterations,
+        max_parallel_tools=config.agents.defaults.max_parallel_tools,
         temperature=config.agents.defaults.temperature,
         max_tokens=config.agents.defaults.max_tokens,
         brave_api_key=config.tools.web.search.api_key or None,
@@ -2888,6 +2909,7 @@ def routines_run(
         temperature=config.agents.defaults.temperature,
         max_tokens=config.agents.defaults.max_tokens,
         max_iterations=config.agents.defaults.max_tool_iterations,
+        max_parallel_tools=config.agents.defaults.max_parallel_tools,
         brave_api_key=config.tools.web.search.api_key or None,
         exec_config=config.tools.exec,
         restrict_to_workspace=config.tools.restrict_to_workspace,
@@ -3027,7 +3049,7 @@ def routing_calibrate(
 
         if dry_run:
             console.print("[blue]Dry run mode - no changes will be made[/blue]")
-            console.print(f"Would analyze {len(calibration._classifications)} classifications")
+            console.print(f"Would analyze {calibration.total_classifications} classifications")
             if calibration.should_calibrate():
                 console.print("[green]Calibration would run[/green]")
             else:
@@ -3036,7 +3058,7 @@ def routing_calibrate(
             if not calibration.should_calibrate():
                 console.print("[yellow]Not enough data for calibration yet[/yellow]")
                 console.print(f"Need {config.routing.auto_calibration.min_classifications} classifications")
-                console.print(f"Current: {len(calibration._classifications)}")
+                console.print(f"Current: {calibration.total_classifications}")
                 raise typer.Exit(1)
 
             results = calibration.calibrate()
@@ -3157,43 +3179,32 @@ def routing_test(
 @routing_app.command("analytics")
 def routing_analytics():
     """Show routing analytics and cost savings."""
-    import json
-
     config = load_config()
 
     if not config.routing.enabled:
         console.print("[red]Smart routing is disabled[/red]")
         return
 
-    analytics_file = config.workspace_path / "analytics" / "routing_stats.json"
+    from nanofolks.agent.router.calibration import CalibrationManager
 
     console.print(f"{__logo__} Routing Analytics\n")
 
     # Load analytics data
-    classifications = []
-    if analytics_file.exists():
-        try:
-            data = json.loads(analytics_file.read_text())
-            classifications = data.get("classifications", [])
-        except Exception:
-            pass
+    calibration = CalibrationManager(
+        patterns_file=config.workspace_path / "memory" / "ROUTING_PATTERNS.json",
+        analytics_file=config.workspace_path / "analytics" / "routing_stats.json",
+        config=config.routing.auto_calibration.model_dump(),
+    )
+    tier_counts, layer_counts = calibration.get_decision_distribution()
+    calibration.close()
 
-    if not classifications:
+    if not tier_counts:
         console.print("[yellow]No analytics data yet[/yellow]")
         console.print("Data is collected automatically as you use the system.")
         return
 
-    # Calculate tier distribution
-    tier_counts = {}
-    layer_counts = {"client": 0, "llm": 0}
-
-    for c in classifications:
-        tier = c.get("final_tier", "unknown")
-        tier_counts[tier] = tier_counts.get(tier, 0) + 1
-        layer_counts[c.get("layer", "client")] += 1
-
     # Cost calculation
-    total = len(classifications)
+    total = sum(tier_counts.values())
     cost_table = Table(title="Cost Analysis")
     cost_table.add_column("Metric", style="cyan")
     cost_table.add_column("Value", style="green")
@@ -3215,8 +3226,8 @@ def routing_analytics():
     savings_pct = ((most_expensive - blended_cost) / most_expensive * 100) if most_expensive > 0 else 0
 
     cost_table.add_row("Total Classifications", str(total))
-    cost_table.add_row("Client-side Classifications", f"{layer_counts['client']} ({layer_counts['client']/total*100:.1f}%)")
-    cost_table.add_row("LLM-assisted Classifications", f"{layer_counts['llm']} ({layer_counts['llm']/total*100:.1f}%)")
+    cost_table.add_row("Client-side Classifications", f"{layer_counts.get('client', 0)} ({layer_counts.get('client', 0)/total*100:.1f}%)")
+    cost_table.add_row("LLM-assisted Classifications", f"{layer_counts.get('llm', 0)} ({layer_counts.get('llm', 0)/total*100:.1f}%)")
     cost_table.add_row("Blended Cost", f"${blended_cost:.2f}/M tokens")
     cost_table.add_row("Most Expensive Model", f"${most_expensive:.2f}/M tokens")
     cost_table.add_row("Estimated Savings", f"{savings_pct:.1f}%")
@@ -3296,33 +3307,42 @@ def status():
 
 @app.command()
 def metrics(
-    kind: str = typer.Option("all", "--kind", "-k", help="counters, gauges, or all"),
+    kind: str = typer.Option("all", "--kind", "-k", help="counters, gauges, histograms, or all"),
     prefix: str = typer.Option("", "--prefix", "-p", help="Filter by metric name prefix"),
     as_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    openmetrics: bool = typer.Option(False, "--openmetrics", help="Output in OpenMetrics text format"),
 ):
     """Show live metrics from broker and routines."""
-    _print_metrics(kind=kind, prefix=prefix, as_json=as_json)
+    _print_metrics(kind=kind, prefix=prefix, as_json=as_json, openmetrics=openmetrics)
 
 
-def _print_metrics(kind: str = "all", prefix: str = "", as_json: bool = False) -> None:
+def _print_metrics(kind: str = "all", prefix: str = "", as_json: bool = False, openmetrics: bool = False) -> None:
     import json as _json
     from nanofolks.metrics import get_metrics
 
+    if openmetrics:
+        # Raw print: rich markup would mangle label braces
+        print(get_metrics().render_openmetrics(), end="")
+        return
+
     snapshot = get_metrics().snapshot()
     counters = snapshot.get("counters", {})
     gauges = snapshot.get("gauges", {})
+    histograms = snapshot.get("histograms", {})
 
     if prefix:
         counters = {k: v for k, v in counters.items() if k.startswith(prefix)}
         gauges = {k: v for k, v in gauges.items() if k.startswith(prefix)}
+        histograms = {k: v for k, v in histograms.items() if k.startswith(prefix)}
 
     if as_json:
-        console.print(_json.dumps({"counters": counters, "gauges": gauges}, indent=2))
+        console.print(_json.dumps({"counters": counters, "gauges": gauges, "histograms": histograms}, indent=2))
         return
 
     kind_lower = kind.lower()
     show_counters = kind_lower in ("all", "counters", "counter")
     show_gauges = kind_lower in ("all", "gauges", "gauge")
+    show_histograms = kind_lower in ("all", "histograms", "histogram", "timers", "timer")
 
     if show_counters:
         table = Table(title="Metrics: Counters")
@@ -3346,6 +3366,113 @@ def _print_metrics(kind: str = "all", prefix: str = "", as_json: bool = False) -
             table.add_row("[dim]No gauges[/dim]", "")
         console.print(table)
 
+    if show_histograms:
+        table = Table(title="Metrics: Histograms (ms)")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Count", style="yellow", justify="right")
+        for column in ("p50", "p90", "p99", "Max"):
+            table.add_column(column, style="yellow", justify="right")
+        if histograms:
+            for name, summary in sorted(histograms.items()):
+                table.add_row(
+                    name,
+                    str(summary["count"]),
+                    *(f"{summary[key] * 1000:.1f}" for key in ("p50", "p90", "p99", "max")),
+                )
+        else:
+            table.add_row("[dim]No histograms[/dim]", "", "", "", "", "")
+        console.print(table)
+
+
+@app.command()
+def traces(
+    limit: int = typer.Option(10, "--limit", "-n", help="Number of traces to show"),
+    trace_id: str = typer.Option(None, "--trace", "-t", help="Show the span tree of one trace"),
+):
+    """Show the slowest recorded message traces."""
+    from datetime import datetime
+
+    from nanofolks.tracing import get_trace_path, load_traces, slowest_traces
+
+    if trace_id:
+        spans = load_traces().get(trace_id)
+        if not spans:
+            console.print(f"[red]Trace not found: {trace_id}[/red]")
+            raise typer.Exit(1)
+        _print_span_tree(spans)
+        return
+
+    summaries = slowest_traces(limit=limit)
+    if not summaries:
+        console.print(f"[dim]No traces recorded in {get_trace_path()}[/dim]")
+        return
+
+    table = Table(title=f"Slowest traces (top {len(summaries)})")
+    table.add_column("Trace", style="cyan")
+    table.add_column("Root")
+    table.add_column("Started")
+    table.add_column("Total (ms)", style="yellow", justify="right")
+    table.add_column("Spans", justify="right")
+    table.add_column("Breakdown (ms)")
+    for summary in summaries:
+        started = datetime.fromtimestamp(summary["start_ns"] / 1e9).strftime("%Y-%m-%d %H:%M:%S")
+        breakdown = ", ".join(
+            f"{name} {ms:.0f}"
+            for name, ms in sorted(summary["breakdown_ms"].items(), key=lambda item: item[1], reverse=True)[:4]
+        )
+        errors = f" [red]({summary['errors']} err)[/red]" if summary["errors"] else ""
+        table.add_row(
+            summary["trace_id"],
+            summary["root"],
+            started,
+            f"{summary['duration_ms']:.1f}",
+            f"{summary['spans']}{errors}",
+            breakdown,
+        )
+    console.print(table)
+    console.print("[dim]Use --trace <id> for the span tree[/dim]")
+
+
+def _print_span_tree(spans: list[dict]) -> None:
+    from rich.tree import Tree
+
+    def label(span: dict) -> str:
+        duration = (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e6
+        attributes = ", ".join(
+            f"{attr['key']}={next(iter(attr['value'].values()), '')}" for attr in span.get("attributes", [])
+        )
+        error = span.get("status", {}).get("message") if span.get("status", {}).get("code") == 2 else None
+        text = f"[cyan]{span['name']}[/cyan] [yellow]{duration:.1f} ms[/yellow]"
+        if attributes:
+            text += f" [dim]{attributes}[/dim]"
+        if error:
+            text += f" [red]{error}[/red]"
+        return text
+
+    by_id = {span["spanId"]: span for span in spans}
+    children: dict[str | None, list[dict]] = {}
+    for span in spans:
+        parent = span.get("parentSpanId")
+        children.setdefault(parent if parent in by_id else None, []).append(span)
+
+    def add(node: Tree, parent_id: str) -> None:
+        for child in sorted(children.get(parent_id, []), key=lambda span: int(span["startTimeUnixNano"])):
+            add(node.add(label(child)), child["spanId"])
+
+    tree = Tree(f"trace {spans[0]['traceId']}")
+    for root in sorted(children.get(None, []), key=lambda span: int(span["startTimeUnixNano"])):
+        add(tree.add(label(root)), root["spanId"])
+    console.print(tree)
+
+
+def _configure_tracing(config) -> None:
+    from nanofolks.tracing import configure_tracing
+
+    configure_tracing(
+        enabled=config.tracing.enabled,
+        max_file_bytes=config.tracing.max_file_mb * 1024 * 1024,
+    )
+
 
 # Add memory and session subcommands if available
 if memory_app is not None:
@@ -1306,37 +1306,53 @@ def _configure_storage():
     """Configure storage settings."""
     tool = UpdateConfigTool()
 
-    console.print(Panel(
-        "[bold]Storage Configuration[/bold]\n\n"
-        "Configure storage behavior for session data.",
-        border_style="bright_magenta"
-    ))
+    while True:
+        config = load_config()
+        cache_size = config.storage.session_cache_size
+        cache_messages = config.storage.session_cache_max_messages
 
-    config = load_config()
-    use_cas = getattr(config.storage, 'use_cas_storage', True)
+        console.print(Panel(
+            "[bold]Storage Configuration[/bold]\n\n"
+            "Configure storage behavior for session data.",
+            border_style="bright_magenta"
+        ))
 
-    console.print(f"\nCAS Storage: {'[green]Enabled[/green]' if use_cas else '[dim]Disabled[/dim]'}")
-    console.print("[dim]CAS (Compare-And-Set) provides conflict-free concurrent writes.[/dim]")
-    console.print("[dim]Enable this for multi-channel setups to prevent file corruption.[/dim]")
+        console.print(f"\nCached sessions: [cyan]{cache_size}[/cyan]")
+        console.print(f"Cached messages: [cyan]{cache_messages}[/cyan]")
+        console.print("[dim]Sessions are append-only logs; the least recently used ones are[/dim]")
+        console.print("[dim]written back and dropped from memory when either limit is exceeded.[/dim]")
 
-    console.print("\n  [1] Toggle CAS Storage")
-    console.print("  [0] Back")
-    console.print()
+        console.print("\n  [1] Change cached session limit")
+        console.print("  [2] Change cached message limit")
+        console.print("  [0] Back")
+        console.print()
 
-    choice = Prompt.ask("Select", choices=["0", "1"], default="0")
+        choice = Prompt.ask("Select", choices=["0", "1", "2"], default="0")
 
-    if choice == "1":
-        new_value = not use_cas
-        with console.status("[bright_magenta]Updating storage settings...[/bright_magenta]", spinner="dots"):
-            result = asyncio.run(tool.execute(
-                path="storage.use_cas_storage",
-                value=new_value
-            ))
-        if "Error" not in result:
-            status = "enabled" if new_value else "disabled"
-            console.print(f"[green]✓ CAS Storage {status}[/green]")
-        else:
-            console.print(f"[red]{result}[/red]")
+        if choice == "0":
+            break
+
+        path, current = (
+            ("storage.session_cache_size", cache_size)
+            if choice == "1"
+            else ("storage.session_cache_max_messages", cache_messages)
+        )
+        new_value = Prompt.ask("Enter new limit", default=str(current))
+        try:
+            limit = int(new_value)
+        except ValueError:
+            console.print("[red]Invalid number[/red]")
+            continue
+        if limit < 1:
+            console.print("[red]Limit must be at least 1[/red]")
+            continue
+        if limit != current:
+            with console.status("[bright_magenta]Updating storage settings...[/bright_magenta]", spinner="dots"):
+                result = asyncio.run(tool.execute(path=path, value=limit))
+            if "Error" not in result:
+                console.print(f"[green]{result}[/green]")
+            else:
+                console.print(f"[red]{result}[/red]")
 
 
 def _configure_mcp_servers():
@@ -112,7 +112,7 @@ def memory_status():
 
 @memory_app.command("rebuild-index")
 def memory_rebuild_index():
-    """Rebuild the semantic search index from stored event embeddings."""
+    """Rebuild the semantic and full-text search indexes from stored memory."""
     memory_store = _get_memory_store()
     if not memory_store:
         return
@@ -120,7 +120,11 @@ def memory_rebuild_index():
     try:
         with console.status("[cyan]Rebuilding vector index...[/cyan]", spinner="dots"):
             count = memory_store.rebuild_vector_index()
+            entity_count = memory_store.rebuild_entity_index()
+            memory_store.rebuild_text_index()
         console.print(f"[green]Rebuilt vector index with {count} embeddings[/green]")
+        console.print(f"[green]Rebuilt entity index with {entity_count} embeddings[/green]")
+        console.print("[green]Rebuilt full-text index[/green]")
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
     finally:
@@ -1,6 +1,6 @@
 """Configuration module for nanofolks."""
 
-from nanofolks.config.loader import get_config_path, load_config
+from nanofolks.config.loader import get_config, get_config_path, load_config, reload, subscribe
 from nanofolks.config.schema import Config
 
-__all__ = ["Config", "load_config", "get_config_path"]
+__all__ = ["Config", "load_config", "get_config", "reload", "subscribe", "get_config_path"]
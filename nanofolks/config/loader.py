@@ -3,7 +3,10 @@
 import json
 import os
 import stat
+import threading
+import time
 from pathlib import Path
+from typing import Callable, Optional
 
 from loguru import logger
 
@@ -19,6 +22,19 @@ PROVIDERS_WITH_KEYS = [
     "aihubmix", "brave", "vllm"
 ]
 
+# How often a cached config re-checks its file for changes
+CONFIG_CHECK_INTERVAL_S = 1.0
+
+# path -> (file signature, config, last check); signature is None for a missing file
+_config_cache: dict[Path, tuple[Optional[tuple[int, int, int]], Config, float]] = {}
+_config_lock = threading.RLock()
+_subscribers: list[Callable[[Config], None]] = []
+
+# Memoized keyring lookups (provider name -> key) and availability; keys are
+# looked up again after reload() or a key change through SecretManager
+_keyring_cache: dict[str, Optional[str]] = {}
+_keyring_available: Optional[bool] = None
+
 
 def get_config_path() -> Path:
     """Get the default configuration file path."""
@@ -56,13 +72,108 @@ def load_config(config_path: Path | None = None) -> Config:
     If keyring is available, keys marked with __KEYRING__ will be
     resolved from the OS keyring.
 
+    The file is only re-read when it changes (see get_config); this
+    returns a private deep copy that the caller may modify and save.
+
     Args:
         config_path: Optional path to config file. Uses default if not provided.
 
     Returns:
         Loaded configuration object with keys resolved from keyring if available.
     """
+    return get_config(config_path).model_copy(deep=True)
+
+
+def get_config(config_path: Path | None = None) -> Config:
+    """
+    Get the shared, cached configuration.
+
+    The config file is re-read when its mtime, inode or size changes
+    (checked at most every CONFIG_CHECK_INTERVAL_S). The returned object is
+    shared process-wide and must not be modified; use load_config for a
+    copy to edit.
+
+    Args:
+        config_path: Optional path to config file. Uses default if not provided.
+
+    Returns:
+        Cached configuration object.
+    """
+    path = config_path or get_config_path()
+    cached = _config_cache.get(path)
+    now = time.monotonic()
+    if cached is not None and now - cached[2] < CONFIG_CHECK_INTERVAL_S:
+        return cached[1]
+
+    with _config_lock:
+        cached = _config_cache.get(path)
+        signature = _file_signature(path)
+        if cached is not None and cached[0] == signature:
+            _config_cache[path] = (signature, cached[1], now)
+            return cached[1]
+        return _reload_locked(path, signature, notify=cached is not None)
+
+
+def reload(config_path: Path | None = None) -> Config:
+    """
+    Re-read the configuration file now, ignoring the cache.
+
+    Keyring lookups are re-done as well. Subscribers are notified.
+
+    Args:
+        config_path: Optional path to config file. Uses default if not provided.
+
+    Returns:
+        The freshly loaded (shared) configuration.
+    """
     path = config_path or get_config_path()
+    with _config_lock:
+        clear_keyring_cache()
+        return _reload_locked(path, _file_signature(path), notify=True)
+
+
+def subscribe(callback: Callable[[Config], None]) -> Callable[[], None]:
+    """
+    Call ``callback(config)`` whenever the configuration is reloaded.
+
+    Reloads happen when a changed file is noticed by get_config/load_config,
+    on save_config and on reload(). Callbacks receive the shared config and
+    must not modify it.
+
+    Returns:
+        A function that removes the subscription.
+    """
+    _subscribers.append(callback)
+
+    def unsubscribe() -> None:
+        if callback in _subscribers:
+            _subscribers.remove(callback)
+
+    return unsubscribe
+
+
+def _file_signature(path: Path) -> Optional[tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_ino, st.st_size)
+
+
+def _reload_locked(path: Path, signature: Optional[tuple[int, int, int]], notify: bool) -> Config:
+    """Read, validate and cache the config file (caller holds _config_lock)."""
+    config = _read_config(path)
+    _config_cache[path] = (signature, config, time.monotonic())
+    if notify:
+        for callback in list(_subscribers):
+            try:
+                callback(config)
+            except Exception as e:
+                logger.warning(f"Config change subscriber failed: {e}")
+    return config
+
+
+def _read_config(path: Path) -> Config:
     is_first_run = not path.exists()
 
     if path.exists():
@@ -124,6 +235,11 @@ def save_config(config: Config, config_path: Path | None = None) -> None:
     os.chmod(path, 0o600)
     logger.debug(f"Config saved with secure permissions: {path}")
 
+    # Refresh the cache now rather than on the next check interval
+    with _config_lock:
+        if path in _config_cache or _subscribers:
+            _reload_locked(path, _file_signature(path), notify=True)
+
 
 def _migrate_config(data: dict) -> dict:
     """Migrate old config formats to current."""
@@ -144,23 +260,30 @@ def _resolve_keyring_keys(config: Config) -> Config:
     Returns:
         Configuration with keyring markers resolved to actual keys
     """
+    global _keyring_available
     try:
         from nanofolks.security.keyring_manager import get_keyring_manager
         from nanofolks.security.secret_manager import get_secret_manager
 
-        keyring = get_keyring_manager()
-        manager = get_secret_manager()
-
-        if not keyring.is_available():
+        if _keyring_available is None:
+            _keyring_available = get_keyring_manager().is_available()
+        if not _keyring_available:
             logger.debug("Keyring not available, using config file keys")
             return config
 
+        manager = get_secret_manager()
+
+        def get_key(name: str) -> Optional[str]:
+            if name not in _keyring_cache:
+                _keyring_cache[name] = manager.get_key(name)
+            return _keyring_cache[name]
+
         # Resolve provider API keys
         providers = config.providers
         for provider_name in PROVIDERS_WITH_KEYS:
             provider = getattr(providers, provider_name, None)
             if provider and provider.api_key == KEYRING_MARKER:
-                actual_key = manager.get_key(provider_name)
+                actual_key = get_key(provider_name)
                 if actual_key:
                     provider.api_key = actual_key
                     logger.debug(f"Resolved {provider_name} key from keyring")
@@ -170,7 +293,7 @@ def _resolve_keyring_keys(config: Config) -> Config:
         # Resolve brave search API key
         if config.tools and config.tools.web and config.tools.web.search:
             if config.tools.web.search.api_key == KEYRING_MARKER:
-                actual_key = manager.get_key("brave")
+                actual_key = get_key("brave")
                 if actual_key:
                     config.tools.web.search.api_key = actual_key
                     logger.debug("Resolved brave search key from keyring")
@@ -185,6 +308,11 @@ def _resolve_keyring_keys(config: Config) -> Config:
     return config
 
 
+def clear_keyring_cache() -> None:
+    """Forget memoized keyring lookups (call after storing or deleting keys)."""
+    _keyring_cache.clear()
+
+
 def _migrate_to_keyring(config: Config, dry_run: bool = False) -> Config:
     """Migrate plain-text API keys to OS keyring.
 
@@ -227,6 +355,7 @@ def _migrate_to_keyring(config: Config, dry_run: bool = False) -> Config:
                 migrated.append("brave")
 
         if migrated:
+            clear_keyring_cache()
             logger.info(f"Migrated {len(migrated)} keys to keyring: {', '.join(migrated)}")
 
     except ImportError:
@@ -141,6 +141,17 @@ class SlackConfig(Base):
     dm: SlackDMConfig = Field(default_factory=SlackDMConfig)
 
 
+class OutboundConfig(Base):
+    """Outbound delivery configuration (one send worker per channel)."""
+
+    queue_size: int = 1000  # Per-channel queue bound; further messages are dropped
+    max_retries: int = 3  # Retries after a failed send
+    retry_backoff_s: float = 0.5  # First retry delay, doubled per attempt
+    coalesce: bool = True  # Merge consecutive plain-text messages to the same chat
+    coalesce_max_chars: int = 3500  # Upper bound on merged message length
+    rate_limits: dict[str, float] = Field(default_factory=dict)  # channel -> messages/s override
+
+
 class ChannelsConfig(Base):
     """Configuration for chat channels."""
 
@@ -149,6 +160,7 @@ class ChannelsConfig(Base):
     discord: DiscordConfig = Field(default_factory=DiscordConfig)
     email: EmailConfig = Field(default_factory=EmailConfig)
     slack: SlackConfig = Field(default_factory=SlackConfig)
+    outbound: OutboundConfig = Field(default_factory=OutboundConfig)
 
 
 class AgentDefaults(Base):
@@ -159,6 +171,7 @@ class AgentDefaults(Base):
     max_tokens: int = 8192
     temperature: float = 0.7
     max_tool_iterations: int = 20
+    max_parallel_tools: int = 4  # Independent tool calls run concurrently per turn
     # system_timezone is read from workspace/USER.md (preferred) or defaults to UTC
     # This is here for backward compatibility and CLI defaults only
 
@@ -225,6 +238,30 @@ class GatewayConfig(Base):
     port: int = 18790
 
 
+class BrokerConfig(Base):
+    """Per-room message broker configuration."""
+
+    max_queue_size: int = 1000
+    wal_durability: str = "batch"  # "none" (buffered), "batch" (flush per group commit), "fsync"
+    wal_segment_bytes: int = 4 * 1024 * 1024  # Roll the queue log over past this size
+    wal_max_batch_size: int = 64  # Max records per group commit
+    wal_max_latency_ms: float = 5.0  # Max time a record waits for its group commit
+    checkpoint_interval_s: float = 1.0  # Max time between cursor checkpoints under load
+    max_workers: int = 8  # Max concurrent agent turns across all rooms
+    bot_lane_max_in_flight: int = 4  # Max concurrent turns for bot-originated messages
+    idle_timeout_s: float = 300.0  # Evict room brokers idle this long (0 = never)
+    coalesce_window_ms: float = 0.0  # Merge same-sender bursts arriving this close together (0 = off)
+    coalesce_max_messages: int = 8  # Max messages merged into one turn
+    coalesce_max_wait_ms: float = 3000.0  # Max time a burst is held before it is queued
+
+
+class TracingConfig(Base):
+    """Span tracing configuration (exported to <data dir>/traces/spans.jsonl)."""
+
+    enabled: bool = True
+    max_file_mb: int = 50  # Rotate the span file past this size (one previous file kept)
+
+
 class WebSearchConfig(Base):
     """Web search tool configuration."""
 
@@ -519,6 +556,16 @@ class LLMClassifierConfig(Base):
     local_fallback_to_api: bool = True
 
 
+class RouterCacheConfig(Base):
+    """Configuration for the LLM router decision cache."""
+
+    enabled: bool = True
+    max_entries: int = 2048
+    ttl_seconds: int = 21600  # 6h
+    semantic: bool = False  # Also match near-duplicate messages via embeddings
+    similarity_threshold: float = 0.95
+
+
 class StickyRoutingConfig(Base):
     """Configuration for sticky routing behavior."""
 
@@ -533,6 +580,7 @@ class AutoCalibrationConfig(Base):
     interval: str = "24h"
     min_classifications: int = 50
     max_patterns: int = 100
+    max_records: int = 100000  # Routing decisions kept in analytics/routing_stats.db
     backup_before_calibration: bool = True
 
 
@@ -543,6 +591,7 @@ class RoutingConfig(Base):
     tiers: RoutingTiersConfig = Field(default_factory=RoutingTiersConfig)
     client_classifier: ClientClassifierConfig = Field(default_factory=ClientClassifierConfig)
     llm_classifier: LLMClassifierConfig = Field(default_factory=LLMClassifierConfig)
+    decision_cache: RouterCacheConfig = Field(default_factory=RouterCacheConfig)
     sticky: StickyRoutingConfig = Field(default_factory=StickyRoutingConfig)
     auto_calibration: AutoCalibrationConfig = Field(default_factory=AutoCalibrationConfig)
     streaming_enabled: bool = True  # Stream LLM responses to CLI in real-time
@@ -565,6 +614,10 @@ class EmbeddingConfig(Base):
     api_model: str = "qwen/qwen3-embedding-0.6b"
     api_fallback: bool = True  # Fall back to API if local fails
     cache_embeddings: bool = True
+    cache_max_entries: int = 50000  # LRU-bounded embedding cache size
+    batch_size: int = 32  # Max texts per model call in the embedding service
+    batch_wait_ms: float = 5.0  # How long the service waits to fill a batch
+    vector_precision: str = "float32"  # In-memory precision of loaded vectors: float32, float16, int8
     lazy_load: bool = True  # Download models on first use
 
 
@@ -629,8 +682,21 @@ class SessionCompactionConfig(Base):
     preserve_recent: int = 20  # Keep last N messages verbatim
     preserve_tool_chains: bool = True  # NEVER break tool_use → tool_result pairs
     summary_chunk_size: int = 10  # Summarize N messages at a time
+    summary_concurrency: int = 4  # Chunks summarized at the same time
+    summary_cache_size: int = 512  # Chunk summaries memoized by content hash
     enable_memory_flush: bool = True  # Allow pre-compaction memory sync
 
+    # Background pre-compaction: summarize older chunks ahead of time once a
+    # session passes precompact_ratio of the compaction threshold
+    background_precompaction: bool = False
+    precompact_ratio: float = 0.8
+
+    # Strategy selection thresholds (message counts)
+    short_threshold: int = 20  # Below this: no compaction
+    medium_threshold: int = 50  # Below this: extraction summary
+    use_llm_for_long: bool = True  # Use LLM summarization for long sessions
+    long_threshold: int = 80  # Above this: definitely use LLM if available
+
 
 class EnhancedContextConfig(Base):
     """
@@ -732,7 +798,8 @@ class WorkLogsConfig(Base):
 class StorageConfig(Base):
     """Storage configuration."""
 
-    use_cas_storage: bool = True  # Enable CAS (Compare-And-Set) for conflict-free concurrent writes
+    session_cache_size: int = 256  # Sessions kept in memory (LRU, written back on eviction)
+    session_cache_max_messages: int = 50000  # Total cached messages before evicting sessions
     show_in_response: bool = False  # Include in agent responses
     default_mode: str = "summary"  # "summary", "detailed", "debug"
     log_tool_calls: bool = True
@@ -751,6 +818,8 @@ class Config(BaseSettings):
     providers: ProvidersConfig = Field(default_factory=ProvidersConfig)
     llm: LLMRequestConfig = Field(default_factory=LLMRequestConfig)
     gateway: GatewayConfig = Field(default_factory=GatewayConfig)
+    broker: BrokerConfig = Field(default_factory=BrokerConfig)
+    tracing: TracingConfig = Field(default_factory=TracingConfig)
     tools: ToolsConfig = Field(default_factory=ToolsConfig)
     routing: RoutingConfig = Field(default_factory=RoutingConfig)
     memory: MemoryConfig = Field(default_factory=MemoryConfig)
@@ -19,8 +19,14 @@ from nanofolks.memory.context import (
     ContextBudget,
     create_context_assembler,
 )
+from nanofolks.memory.embedding_service import (
+    EmbeddingCache,
+    EmbeddingService,
+    create_embedding_service,
+)
 from nanofolks.memory.embeddings import (
     EmbeddingProvider,
+    EmbeddingView,
     cosine_similarity,
     pack_embedding,
     unpack_embedding,
@@ -56,12 +62,17 @@ from nanofolks.memory.retrieval import (
     MemoryRetrieval,
     create_retrieval,
 )
+from nanofolks.memory.similarity import (
+    embeddings_to_matrix,
+    rank_by_similarity,
+    top_k,
+)
 from nanofolks.memory.store import TurboMemoryStore
 from nanofolks.memory.summaries import (
     SummaryTreeManager,
     create_summary_manager,
 )
-from nanofolks.memory.vector_index import VectorIndex
+from nanofolks.memory.vector_index import PartitionedVectorIndex, VectorIndex
 
 __all__ = [
     "Event",
@@ -73,10 +84,18 @@ __all__ = [
     "Learning",
     "TurboMemoryStore",
     "EmbeddingProvider",
+    "EmbeddingView",
+    "EmbeddingService",
+    "EmbeddingCache",
+    "create_embedding_service",
     "VectorIndex",
+    "PartitionedVectorIndex",
     "pack_embedding",
     "unpack_embedding",
     "cosine_similarity",
+    "embeddings_to_matrix",
+    "rank_by_similarity",
+    "top_k",
     "ActivityTracker",
     "BackgroundProcessor",
     "Gliner2Extractor",
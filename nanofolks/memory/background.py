@@ -216,6 +216,8 @@ class BackgroundProcessor:
                 for entity in result.entities:
                     # Check for existing entity
                     existing = self.memory_store.find_entity_by_name(entity.name)
+                    if not existing:
+                        existing = self.memory_store.find_similar_entity(entity)
                     if existing:
                         # Merge with existing
                         existing.aliases = list(set(existing.aliases + entity.aliases))
@@ -228,6 +230,9 @@ class BackgroundProcessor:
                         self.memory_store.save_entity(entity)
                         entity_id_map[entity.id] = entity.id
 
+                # Record mentions the name matcher may have missed (new entities)
+                self.memory_store.add_event_mentions(event, list(entity_id_map.values()))
+
                 def map_entity_id(entity_id: str | None) -> str | None:
                     if not entity_id:
                         return None
@@ -20,6 +20,7 @@ from nanofolks.memory.models import Entity
 from nanofolks.memory.policy import get_context_budget_overrides
 from nanofolks.memory.store import TurboMemoryStore
 from nanofolks.memory.summaries import SummaryTreeManager
+from nanofolks.tracing import traced
 from nanofolks.utils.ids import room_to_session_id
 
 
@@ -82,6 +83,7 @@ class ContextAssembler:
 
         logger.info(f"ContextAssembler initialized (budget: {self.budget.total} tokens)")
 
+    @traced("memory.assemble_context")
     def assemble_context(
         self,
         room_id: str,
@@ -0,0 +1,400 @@
+"""Batched embedding service with a persistent embedding cache.
+
+This module provides:
+- EmbeddingCache: a size-bounded SQLite cache keyed by (model, sha256(text))
+- EmbeddingService: runs an EmbeddingProvider on a worker thread, micro-batching
+  concurrent requests (from any room or thread) into single model calls
+
+The service exposes the same ``embed``/``embed_batch``/``is_ready`` methods as
+EmbeddingProvider, so it can be passed anywhere a provider is expected, plus
+``submit``/``embed_async`` for callers that must not block.
+"""
+
+import asyncio
+import hashlib
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from nanofolks.memory.embeddings import EmbeddingProvider, pack_embedding, unpack_embedding
+
+# bge-small-en-v1.5 = 384 dimensions
+EMBEDDING_DIMENSION = 384
+
+
+class EmbeddingCache:
+    """
+    Size-bounded SQLite cache of embeddings keyed by model and text hash.
+
+    Entries are evicted least-recently-used first once the cache grows
+    more than 10% past ``max_entries``, so pruning is amortized.
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = 50000):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: Path to the cache database file
+            max_entries: Number of embeddings to keep
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used ON embedding_cache(last_used);"
+        )
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """Hash used as the cache key for a text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, model: str, hashes: list[str]) -> dict[str, list[float]]:
+        """
+        Look up cached embeddings.
+
+        Args:
+            model: Embedding model name
+            hashes: Text hashes to look up
+
+        Returns:
+            Dict mapping text hash to embedding for the hits
+        """
+        if not hashes:
+            return {}
+
+        unique = list(dict.fromkeys(hashes))
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(unique), 900):
+                chunk = unique[start:start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, embedding FROM embedding_cache "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *chunk]
+                ).fetchall()
+                for text_hash, blob in rows:
+                    found[text_hash] = unpack_embedding(blob)
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embedding_cache SET last_used = ? WHERE model = ? AND text_hash = ?",
+                    [(now, model, text_hash) for text_hash in found]
+                )
+                self._conn.commit()
+        return found
+
+    def put_many(self, model: str, items: list[tuple[str, list[float]]]) -> None:
+        """
+        Store embeddings.
+
+        Args:
+            model: Embedding model name
+            items: (text hash, embedding) pairs
+        """
+        if not items:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO embedding_cache (model, text_hash, embedding, last_used)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(model, text_hash, pack_embedding(embedding), now) for text_hash, embedding in items]
+            )
+            self._size += len(items)
+            if self._size > self.max_entries + max(self.max_entries // 10, 1):
+                self._prune()
+            self._conn.commit()
+
+    def _prune(self) -> None:
+        """Evict least-recently-used entries down to max_entries (lock held)."""
+        self._size = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        excess = self._size - self.max_entries
+        if excess <= 0:
+            return
+        self._conn.execute(
+            """
+            DELETE FROM embedding_cache WHERE (model, text_hash) IN (
+                SELECT model, text_hash FROM embedding_cache
+                ORDER BY last_used ASC
+                LIMIT ?
+            )
+            """,
+            (excess,)
+        )
+        self._size -= excess
+        logger.debug(f"Embedding cache pruned {excess} entries")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class _EmbeddingRequest:
+    """A queued request for one text's embedding."""
+
+    text: str
+    future: Future = field(default_factory=Future)
+
+
+class EmbeddingService:
+    """
+    Micro-batching embedding service backed by a worker thread.
+
+    Requests submitted within ``max_wait_ms`` of each other are embedded
+    together in one model call (up to ``max_batch_size`` texts), repeated
+    texts are embedded once, and results are served from the cache when
+    the same text was embedded before. The model is only ever run while
+    holding the service's model lock, so synchronous batch callers and the
+    worker never use it concurrently.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        cache: Optional[EmbeddingCache] = None,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        """
+        Initialize the service (the worker thread starts on first submit).
+
+        Args:
+            provider: Underlying embedding provider
+            cache: Optional persistent embedding cache
+            max_batch_size: Maximum texts per model call
+            max_wait_ms: How long to wait for more requests before embedding
+        """
+        self.provider = provider
+        self.config = provider.config
+        self.cache = cache
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        self.model_name = (
+            self.config.local_model if self.config.provider == "local" else self.config.api_model
+        )
+
+        self._queue: "queue.SimpleQueue[Optional[_EmbeddingRequest]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._model_lock = threading.Lock()
+        self._closed = False
+
+        logger.info(
+            f"EmbeddingService initialized (batch={self.max_batch_size}, "
+            f"wait={max_wait_ms}ms, cache={'on' if cache else 'off'})"
+        )
+
+    # =========================================================================
+    # Provider-compatible interface
+    # =========================================================================
+
+    def is_ready(self) -> bool:
+        """Check if the underlying provider can generate embeddings."""
+        with self._model_lock:
+            return self.provider.is_ready()
+
+    def embed(self, text: str) -> list[float]:
+        """Embed one text, blocking until the result is available."""
+        if threading.current_thread() is self._thread:
+            return self._embed_texts([text])[0]
+        return self.submit(text).result()
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed many texts in the calling thread, using the cache.
+
+        Unlike EmbeddingProvider.embed_batch, the result always has one
+        vector per input text (empty texts get a zero vector).
+        """
+        return self._embed_texts(texts)
+
+    # =========================================================================
+    # Asynchronous interface
+    # =========================================================================
+
+    def submit(self, text: str) -> Future:
+        """
+        Queue a text for embedding on the worker thread.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Future resolving to the embedding vector
+        """
+        if self._closed:
+            raise RuntimeError("EmbeddingService is closed")
+        self._ensure_worker()
+        request = _EmbeddingRequest(text)
+        self._queue.put(request)
+        return request.future
+
+    async def embed_async(self, text: str) -> list[float]:
+        """Embed one text without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(text))
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="embedding-service", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Worker loop: gather a micro-batch, embed it, resolve futures."""
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+
+            self._process(batch)
+
+    def _process(self, batch: list[_EmbeddingRequest]) -> None:
+        texts = list(dict.fromkeys(request.text for request in batch))
+        try:
+            vectors = dict(zip(texts, self._embed_texts(texts)))
+        except Exception as e:
+            logger.warning(f"Embedding batch of {len(texts)} failed: {e}")
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        for request in batch:
+            if not request.future.done():
+                request.future.set_result(vectors[request.text])
+
+    # =========================================================================
+    # Embedding with cache
+    # =========================================================================
+
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, serving repeats and cache hits without the model."""
+        results: list[Optional[list[float]]] = [None] * len(texts)
+        pending: dict[str, list[int]] = {}  # hash -> positions still to embed
+        hash_text: dict[str, str] = {}
+
+        for position, text in enumerate(texts):
+            if not text or not text.strip():
+                results[position] = [0.0] * EMBEDDING_DIMENSION
+                continue
+            text_hash = EmbeddingCache.text_hash(text)
+            pending.setdefault(text_hash, []).append(position)
+            hash_text[text_hash] = text
+
+        if pending and self.cache is not None:
+            for text_hash, vector in self.cache.get_many(self.model_name, list(pending)).items():
+                for position in pending.pop(text_hash):
+                    results[position] = vector
+
+        if pending:
+            hashes = list(pending)
+            with self._model_lock:
+                vectors = self.provider.embed_batch([hash_text[h] for h in hashes])
+            if len(vectors) != len(hashes):
+                raise RuntimeError(
+                    f"Batch embedding size mismatch: {len(vectors)} vs {len(hashes)}"
+                )
+
+            fresh: list[tuple[str, list[float]]] = []
+            for text_hash, vector in zip(hashes, vectors):
+                for position in pending[text_hash]:
+                    results[position] = vector
+                # Zero vectors mean the model was unavailable; don't cache them
+                if any(vector):
+                    fresh.append((text_hash, vector))
+
+            if self.cache is not None:
+                self.cache.put_many(self.model_name, fresh)
+
+        return results
+
+    def close(self) -> None:
+        """Stop the worker after it drains queued requests, then close the cache."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=30)
+            self._thread = None
+        if self.cache is not None:
+            self.cache.close()
+
+
+def create_embedding_service(config, workspace: Path) -> EmbeddingService:
+    """
+    Factory function to create an EmbeddingService from memory config.
+
+    Args:
+        config: MemoryConfig instance
+        workspace: Path to workspace directory
+
+    Returns:
+        EmbeddingService wrapping a new EmbeddingProvider
+    """
+    embedding_config = config.embedding
+    cache = None
+    if embedding_config.cache_embeddings:
+        cache_path = (workspace / config.db_path).parent / "embedding_cache.db"
+        cache = EmbeddingCache(cache_path, max_entries=embedding_config.cache_max_entries)
+    return EmbeddingService(
+        EmbeddingProvider(embedding_config),
+        cache=cache,
+        max_batch_size=embedding_config.batch_size,
+        max_wait_ms=embedding_config.batch_wait_ms,
+    )
@@ -7,10 +7,14 @@ downloading models at startup.
 
 import os
 import struct
+from collections.abc import Sequence
+from typing import Optional
 
+import numpy as np
 from loguru import logger
 
 from nanofolks.config.schema import EmbeddingConfig
+from nanofolks.memory.similarity import as_vector
 
 
 class EmbeddingProvider:
@@ -150,16 +154,170 @@ class EmbeddingProvider:
             return False
 
 
-def pack_embedding(embedding: list[float]) -> bytes:
+# Supported in-memory precisions for EmbeddingView
+EMBEDDING_PRECISIONS = ("float32", "float16", "int8")
+
+
+class EmbeddingView(Sequence):
+    """
+    Read-only embedding backed by packed bytes, decoded on demand.
+
+    Rows read from SQLite keep the embedding BLOB as-is instead of turning
+    it into hundreds of Python floats. Numeric code reads it as a float32
+    array (a zero-copy view for float32 storage) via ``np.asarray``; code
+    that expects a list of floats can still index, iterate and ``len()`` it.
+
+    The vector can also be held at reduced precision: ``float16`` halves
+    its memory, ``int8`` (symmetric, per-vector scale) quarters it. Decoding
+    always yields float32.
+    """
+
+    __slots__ = ("_data", "_precision", "_scale")
+
+    def __init__(self, data: bytes, precision: str = "float32", scale: float = 1.0):
+        """
+        Wrap already-encoded bytes.
+
+        Args:
+            data: Vector bytes in the given precision
+            precision: One of "float32", "float16", "int8"
+            scale: Dequantization scale (int8 only)
+        """
+        if precision not in EMBEDDING_PRECISIONS:
+            raise ValueError(f"Unsupported embedding precision: {precision}")
+        self._data = bytes(data)
+        self._precision = precision
+        self._scale = scale
+
+    @classmethod
+    def from_blob(cls, blob: bytes, precision: str = "float32") -> "EmbeddingView":
+        """
+        Create a view from a stored float32 BLOB.
+
+        Args:
+            blob: Packed float32 bytes, as stored in the database
+            precision: In-memory precision to keep the vector at
+
+        Returns:
+            EmbeddingView over the vector
+        """
+        if precision == "float32":
+            return cls(blob)
+        return cls.from_array(np.frombuffer(blob, dtype=np.float32), precision)
+
+    @classmethod
+    def from_array(cls, vector, precision: str = "float32") -> "EmbeddingView":
+        """Create a view from any vector-like (list of floats, array, view)."""
+        array = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if precision == "float16":
+            return cls(array.astype(np.float16).tobytes(), "float16")
+        if precision == "int8":
+            peak = float(np.max(np.abs(array))) if array.size else 0.0
+            scale = peak / 127.0 if peak > 0 else 1.0
+            quantized = np.clip(np.rint(array / scale), -127, 127).astype(np.int8)
+            return cls(quantized.tobytes(), "int8", scale)
+        return cls(array.tobytes())
+
+    @property
+    def precision(self) -> str:
+        return self._precision
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the view."""
+        return len(self._data)
+
+    def to_numpy(self) -> np.ndarray:
+        """Decode to a float32 array (read-only view for float32 storage)."""
+        if self._precision == "float32":
+            return np.frombuffer(self._data, dtype=np.float32)
+        if self._precision == "float16":
+            return np.frombuffer(self._data, dtype=np.float16).astype(np.float32)
+        return np.frombuffer(self._data, dtype=np.int8).astype(np.float32) * np.float32(self._scale)
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.to_numpy()
+        if dtype is not None and array.dtype != dtype:
+            return array.astype(dtype)
+        if copy:
+            return array.copy()
+        return array
+
+    def tobytes(self) -> bytes:
+        """Packed float32 bytes (the storage format)."""
+        if self._precision == "float32":
+            return self._data
+        return self.to_numpy().tobytes()
+
+    def tolist(self) -> list[float]:
+        return self.to_numpy().tolist()
+
+    def encodes(self, blob: Optional[bytes]) -> bool:
+        """
+        Whether this view is exactly what ``from_blob`` makes of a stored BLOB.
+
+        Reduced-precision views cannot be packed back to the float32 vector
+        they were read from; this lets a writer recognise an unmodified
+        vector and keep the stored BLOB instead.
+        """
+        if not blob:
+            return False
+        other = EmbeddingView.from_blob(blob, self._precision)
+        return other._data == self._data and other._scale == self._scale
+
+    def __len__(self) -> int:
+        return len(self._data) // {"float32": 4, "float16": 2, "int8": 1}[self._precision]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_numpy()[index].tolist()
+        return float(self.to_numpy()[index])
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (EmbeddingView, Sequence, np.ndarray)):
+            other_array = np.asarray(other, dtype=np.float32).reshape(-1)
+            return bool(np.array_equal(self.to_numpy(), other_array))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"EmbeddingView(dim={len(self)}, precision={self._precision!r})"
+
+
+def embedding_from_blob(blob: Optional[bytes], precision: str = "float32") -> Optional[EmbeddingView]:
+    """
+    Wrap a stored embedding BLOB without decoding it.
+
+    Args:
+        blob: Packed float32 bytes (or None)
+        precision: In-memory precision to keep the vector at
+
+    Returns:
+        EmbeddingView, or None if there is no embedding
+    """
+    if not blob:
+        return None
+    return EmbeddingView.from_blob(blob, precision)
+
+
+def pack_embedding(embedding) -> bytes:
     """
     Pack embedding vector into bytes for storage.
 
     Args:
-        embedding: List of floats
+        embedding: List of floats, array or EmbeddingView
 
     Returns:
-        Packed bytes
+        Packed float32 bytes
     """
+    if isinstance(embedding, EmbeddingView):
+        return embedding.tobytes()
+    if isinstance(embedding, np.ndarray):
+        return embedding.astype(np.float32, copy=False).tobytes()
     return struct.pack(f'{len(embedding)}f', *embedding)
 
 
@@ -191,17 +349,18 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
     Returns:
         Cosine similarity (-1 to 1)
     """
-    if len(a) != len(b):
-        raise ValueError(f"Vectors must have same length: {len(a)} vs {len(b)}")
+    va = as_vector(a)
+    vb = as_vector(b)
+    if va.size != vb.size:
+        raise ValueError(f"Vectors must have same length: {va.size} vs {vb.size}")
 
-    if len(a) == 0:
+    if va.size == 0:
         return 0.0
 
-    dot_product = sum(x * y for x, y in zip(a, b))
-    norm_a = sum(x * x for x in a) ** 0.5
-    norm_b = sum(x * x for x in b) ** 0.5
+    norm_a = float(np.linalg.norm(va))
+    norm_b = float(np.linalg.norm(vb))
 
     if norm_a == 0 or norm_b == 0:
         return 0.0
 
-    return dot_product / (norm_a * norm_b)
+    return float(np.dot(va, vb)) / (norm_a * norm_b)
@@ -107,6 +107,9 @@ class KnowledgeGraphManager:
         primary.event_count += duplicate.event_count
         primary.last_seen = datetime.now()
 
+        # Point the duplicate's mentions at the primary
+        self.store.reassign_entity_mentions(duplicate_id, primary_id)
+
         # Save primary and delete duplicate
         self.store.update_entity(primary)
         self.store.delete_entity(duplicate_id)
@@ -265,18 +268,18 @@ class KnowledgeGraphManager:
             List of similar entities
         """
         entity = self.store.get_entity(entity_id)
-        if not entity or not entity.embedding:
+        if not entity or not entity.name_embedding:
             return []
 
-        # Search for similar entities
-        similar = self.store.search_similar_entities(
-            entity.embedding,
-            limit=10,
+        # Search for similar entities (one extra slot for the entity itself)
+        similar = self.store.get_similar_entities(
+            entity.name_embedding,
+            limit=11,
             threshold=threshold
         )
 
         # Exclude the entity itself
-        return [e for e in similar if e.id != entity_id]
+        return [e for e, _ in similar if e.id != entity_id][:10]
 
     def update_entity_embedding(self, entity_id: str) -> Optional[Entity]:
         """
@@ -15,8 +15,9 @@ from uuid import uuid4
 
 from loguru import logger
 
-from nanofolks.memory.embeddings import EmbeddingProvider
+from nanofolks.memory.embeddings import EmbeddingProvider, pack_embedding
 from nanofolks.memory.models import Learning
+from nanofolks.memory.similarity import rank_by_similarity
 from nanofolks.memory.store import TurboMemoryStore
 
 # Feedback detection patterns (regex-based, FREE)
@@ -139,6 +140,9 @@ class LearningManager:
     - Detect contradictions
     """
 
+    # Cosine similarity above which two learnings are considered the same topic
+    SEMANTIC_SIMILARITY_THRESHOLD = 0.85
+
     def __init__(
         self,
         store: TurboMemoryStore,
@@ -191,6 +195,7 @@ class LearningManager:
 
         # Step 2: Create learning
         learning = self._create_learning_from_detection(detection, context)
+        learning.content_embedding = self._embed_learning(learning.content)
 
         # Step 3: Check for contradictions
         await self._check_contradictions(learning)
@@ -327,28 +332,69 @@ class LearningManager:
         # Get existing learnings
         existing = self.store.get_all_learnings(active_only=True)
 
-        # Simple contradiction detection: similar content but different sentiment
-        for old in existing:
-            # Check if similar (simple text similarity)
-            similarity = self._calculate_similarity(
-                new_learning.content,
-                old.content
-            )
+        # Contradiction detection: similar content but different sentiment
+        for old in self._rank_similar_learnings(new_learning, existing):
+            if new_learning.sentiment != old.sentiment:
+                # Contradiction! Mark old as superseded
+                old.superseded_by = new_learning.id
+                self.store.update_learning(old)
 
-            if similarity > 0.7:  # 70% similar
-                if new_learning.sentiment != old.sentiment:
-                    # Contradiction! Mark old as superseded
-                    old.superseded_by = new_learning.id
-                    self.store.update_learning(old)
+                # Boost new learning
+                new_learning.relevance_score = 1.0
 
-                    # Boost new learning
-                    new_learning.relevance_score = 1.0
-
-                    logger.info(f"Detected contradiction: {old.id} superseded by {new_learning.id}")
-                    return True
+                logger.info(f"Detected contradiction: {old.id} superseded by {new_learning.id}")
+                return True
 
         return False
 
+    def _embed_learning(self, content: str) -> Optional[bytes]:
+        """Embed learning content for semantic comparison, if a provider is ready."""
+        if not self.embedding_provider or not content.strip():
+            return None
+        try:
+            if not self.embedding_provider.is_ready():
+                return None
+            embedding = self.embedding_provider.embed(content)
+        except Exception as e:
+            logger.debug(f"Learning embedding failed: {e}")
+            return None
+        if not embedding or not any(embedding):
+            return None
+        return pack_embedding(embedding)
+
+    def _rank_similar_learnings(
+        self,
+        new_learning: Learning,
+        existing: list[Learning],
+    ) -> list[Learning]:
+        """
+        Find existing learnings similar to a new one, most similar first.
+
+        Learnings with embeddings are scored together in one vectorized pass;
+        the rest fall back to word-overlap similarity.
+        """
+        scored: list[tuple[Learning, float]] = []
+        remaining = existing
+
+        if new_learning.content_embedding:
+            embedded = [old for old in existing if old.content_embedding]
+            scored.extend(rank_by_similarity(
+                new_learning.content_embedding,
+                embedded,
+                key=lambda old: old.content_embedding,
+                k=len(embedded),
+                threshold=self.SEMANTIC_SIMILARITY_THRESHOLD,
+            ))
+            remaining = [old for old in existing if not old.content_embedding]
+
+        for old in remaining:
+            similarity = self._calculate_similarity(new_learning.content, old.content)
+            if similarity > 0.7:  # 70% similar
+                scored.append((old, similarity))
+
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return [old for old, _ in scored]
+
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate simple text similarity (can be enhanced with embeddings)."""
         # Word overlap similarity
@@ -0,0 +1,120 @@
+"""Entity mention detection for stored events.
+
+This module provides the NameMatcher class, an Aho-Corasick automaton over
+entity names and aliases. It finds every known entity mentioned in a piece
+of text in a single pass, independent of how many entities exist, so
+mentions can be recorded when an event is saved instead of pattern-matching
+every name against every event at query time.
+"""
+
+from collections import deque
+from typing import Iterable
+
+# Names shorter than this match too much ordinary text to be useful
+MIN_NAME_LENGTH = 2
+
+
+def name_patterns(names: Iterable[str]) -> frozenset[str]:
+    """
+    The patterns NameMatcher builds from an entity's name and aliases.
+
+    Two name lists with the same patterns produce the same matches, so a
+    matcher only needs rebuilding when an entity's patterns change.
+    """
+    patterns = ((name or "").strip().lower() for name in names)
+    return frozenset(pattern for pattern in patterns if len(pattern) >= MIN_NAME_LENGTH)
+
+
+class NameMatcher:
+    """
+    Case-insensitive, whole-word multi-pattern matcher for entity names.
+
+    Built once from (name, entity_id) pairs; ``find`` then scans a text in
+    time linear in its length plus the number of matches.
+    """
+
+    def __init__(self, names: Iterable[tuple[str, str]]):
+        """
+        Build the automaton.
+
+        Args:
+            names: (name or alias, entity_id) pairs
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[tuple[int, str]]] = [[]]
+
+        for name, entity_id in names:
+            pattern = (name or "").strip().lower()
+            if len(pattern) >= MIN_NAME_LENGTH:
+                self._add(pattern, entity_id)
+
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        """Number of automaton states (1 when no names were added)."""
+        return len(self._goto)
+
+    def _add(self, pattern: str, entity_id: str) -> None:
+        """Insert a pattern into the trie."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append((len(pattern), entity_id))
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> set[str]:
+        """
+        Find the entities mentioned in a text.
+
+        A name only counts when it is not part of a longer word, so the
+        alias "Al" matches "ask Al" but not "also".
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            IDs of the entities whose name or an alias occurs in the text
+        """
+        if len(self._goto) == 1 or not text:
+            return set()
+
+        lowered = text.lower()
+        end = len(lowered)
+        found: set[str] = set()
+        state = 0
+
+        for i, char in enumerate(lowered):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+
+            for length, entity_id in self._output[state]:
+                start = i - length + 1
+                if start > 0 and lowered[start - 1].isalnum():
+                    continue
+                if i + 1 < end and lowered[i + 1].isalnum():
+                    continue
+                found.add(entity_id)
+
+        return found
@@ -4,6 +4,7 @@ This module defines all data structures used by the memory system including
 events, entities, relationships, facts, and learnings.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
@@ -30,8 +31,9 @@ class Event:
     tool_name: Optional[str] = None  # For tool_call/tool_result events
     extraction_status: str = "pending"  # "pending", "complete", "skipped", "failed"
 
-    # Embeddings (stored as packed bytes for efficiency)
-    content_embedding: Optional[bytes] = None
+    # Embedding; rows read from the store hold a lazily decoded EmbeddingView
+    # over the packed float32 BLOB (None when the read skipped vectors)
+    content_embedding: Optional[Sequence[float]] = None
 
     # Relevance tracking
     relevance_score: float = 1.0  # Decays over time unless re-mentioned
@@ -56,9 +58,9 @@ class Entity:
     aliases: list[str] = field(default_factory=list)
     description: str = ""
 
-    # Embeddings for semantic similarity
-    name_embedding: Optional[bytes] = None
-    description_embedding: Optional[bytes] = None
+    # Embeddings for semantic similarity (EmbeddingView when read from the store)
+    name_embedding: Optional[Sequence[float]] = None
+    description_embedding: Optional[Sequence[float]] = None
 
     # Tracking
     source_event_ids: list[str] = field(default_factory=list)
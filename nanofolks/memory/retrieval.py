@@ -4,19 +4,57 @@ This module provides query capabilities for the memory system,
 allowing the agent to search, retrieve, and traverse the knowledge graph.
 
 Provides:
-- Semantic search over events and entities
+- Hybrid (semantic + BM25 full-text) search over events and entities
 - Entity lookup and relationship traversal
 - Fact retrieval
 - Context-aware recall
 """
 
-from typing import Optional
+from typing import Callable, Optional, Sequence, TypeVar
 
 from loguru import logger
 
 from nanofolks.memory.embeddings import EmbeddingProvider
 from nanofolks.memory.models import Entity, Event, Fact
 from nanofolks.memory.store import TurboMemoryStore
+from nanofolks.metrics import timed
+
+T = TypeVar("T")
+
+# Rank offset for reciprocal-rank fusion; 60 is the value from the original
+# RRF paper and damps the influence of any single list's top positions.
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[T]],
+    key: Callable[[T], str],
+    k: int = RRF_K,
+) -> list[T]:
+    """
+    Fuse several ranked lists with reciprocal-rank fusion.
+
+    Each item scores ``sum(1 / (k + rank))`` over the lists it appears in,
+    so items ranked well by several retrievers rise to the top without
+    having to compare their raw (incompatible) scores.
+
+    Args:
+        rankings: Ranked lists, best first
+        key: Function returning an item's identity for deduplication
+        k: Rank offset
+
+    Returns:
+        Deduplicated items sorted by fused score
+    """
+    scores: dict[str, float] = {}
+    items: dict[str, T] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, 1):
+            item_key = key(item)
+            scores[item_key] = scores.get(item_key, 0.0) + 1.0 / (k + rank)
+            items.setdefault(item_key, item)
+    ordered = sorted(scores, key=scores.__getitem__, reverse=True)
+    return [items[item_key] for item_key in ordered]
 
 
 class MemoryRetrieval:
@@ -47,6 +85,7 @@ class MemoryRetrieval:
 
         logger.info("MemoryRetrieval initialized")
 
+    @timed("memory.retrieval.duration_seconds")
     def search(
         self,
         query: str,
@@ -66,51 +105,27 @@ class MemoryRetrieval:
         Returns:
             Dict with events, entities, and facts
         """
-        results = {
-            "events": [],
-            "entities": [],
-            "facts": [],
-        }
+        event_rankings: list[list[Event]] = []
+        entity_rankings: list[list[Entity]] = []
 
         if search_type in ["semantic", "hybrid"] and self.embedding_provider:
             # Semantic search using embeddings
             query_embedding = self.embedding_provider.embed(query)
-
-            # Search events
-            events = self.store.search_similar_events(query_embedding, limit=limit)
-            results["events"] = events
-
-            # Search entities
-            entities = self.store.search_similar_entities(query_embedding, limit=limit)
-            results["entities"] = entities
+            event_rankings.append(self.store.search_similar_events(query_embedding, limit=limit))
+            entity_rankings.append(self.store.search_similar_entities(query_embedding, limit=limit))
 
         if search_type in ["text", "hybrid"]:
-            # Text search
-            text_events = self.store.search_events_by_text(query, limit=limit)
-            results["events"].extend(text_events)
-
-            # Find entities by name
-            text_entities = self.store.search_entities_by_name(query, limit=limit)
-            results["entities"].extend(text_entities)
-
-        # Remove duplicates
-        seen_event_ids = set()
-        unique_events = []
-        for e in results["events"]:
-            if e.id not in seen_event_ids:
-                seen_event_ids.add(e.id)
-                unique_events.append(e)
-        results["events"] = unique_events[:limit]
-
-        seen_entity_ids = set()
-        unique_entities = []
-        for e in results["entities"]:
-            if e.id not in seen_entity_ids:
-                seen_entity_ids.add(e.id)
-                unique_entities.append(e)
-        results["entities"] = unique_entities[:limit]
-
-        return results
+            # Full-text search, BM25-ranked
+            event_rankings.append(self.store.search_events_by_text(query, limit=limit))
+            entity_rankings.append(self.store.search_entities_by_name(query, limit=limit))
+
+        # Fuse by rank rather than concatenating, so hits found by both
+        # retrievers come first
+        return {
+            "events": reciprocal_rank_fusion(event_rankings, key=lambda e: e.id)[:limit],
+            "entities": reciprocal_rank_fusion(entity_rankings, key=lambda e: e.id)[:limit],
+            "facts": [],
+        }
 
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """
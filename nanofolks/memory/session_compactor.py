@@ -16,8 +16,18 @@ Example workflow:
     - Messages 41-70: Kept verbatim (30 messages, ~1000 tokens)
     - Total: ~1200 tokens (well under 3000 target)
     - Tool chains: All preserved intact
+
+Chunk summaries are generated concurrently and memoized by a hash of the
+chunk's messages. Chunks are cut from the start of the history, so a later
+compaction of the same (grown) history reuses them, and a session nearing
+the threshold can have them prepared in the background
+(SessionCompactor.schedule_precompaction).
 """
 
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Protocol
 
@@ -72,8 +82,15 @@ class SessionCompactionConfig:
     preserve_recent: int = 20
     preserve_tool_chains: bool = True
     summary_chunk_size: int = 10
+    summary_concurrency: int = 4  # Chunks summarized at the same time
+    summary_cache_size: int = 512  # Chunk summaries memoized by content hash
     enable_memory_flush: bool = True
 
+    # Background pre-compaction: once a session passes precompact_ratio of the
+    # compaction threshold, summarize its older chunks ahead of time
+    background_precompaction: bool = False
+    precompact_ratio: float = 0.8
+
     # Strategy selection thresholds
     short_threshold: int = 20  # Below this: no compaction
     medium_threshold: int = 50  # Below this: extraction summary
@@ -104,12 +121,20 @@ class SummaryCompactionMode:
         self,
         chunk_size: int = 10,
         summarizer: LLMSummarizer | None = None,
-        max_summary_tokens: int = 150
+        max_summary_tokens: int = 150,
+        max_concurrency: int = 4,
+        cache_size: int = 512
     ):
         self.chunk_size = chunk_size
         self.token_counter = TokenCounter()
         self.summarizer = summarizer
         self.max_summary_tokens = max_summary_tokens
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache_size = cache_size
+        self._summary_cache: OrderedDict[str, str] = OrderedDict()
+        # Summaries being generated, shared by every caller waiting on a chunk
+        self._in_flight: dict[str, asyncio.Future[str]] = {}
+        self._semaphore: asyncio.Semaphore | None = None
 
     async def compact(
         self,
@@ -149,11 +174,11 @@ class SummaryCompactionMode:
         older = messages[:-preserve_recent]
         target_tokens - recent_tokens
 
-        # Generate summaries for older messages
+        # Generate summaries for older messages (concurrently, memoized)
+        chunks = self._chunks(older)
+        reused = sum(1 for chunk in chunks if self._chunk_key(chunk) in self._summary_cache)
         summaries = []
-        for i in range(0, len(older), self.chunk_size):
-            chunk = older[i:i + self.chunk_size]
-            summary = await self._summarize_chunk(chunk)
+        for chunk, summary in zip(chunks, await self.summarize_chunks(chunks)):
             if summary:
                 summaries.append({
                     "role": "system",
@@ -169,6 +194,7 @@ class SummaryCompactionMode:
             "original_count": len(messages),
             "compacted_count": len(compacted),
             "summaries_generated": len(summaries),
+            "summaries_reused": reused,
             "tokens_before": count_messages(messages),
             "tokens_after": count_messages(compacted),
             "mode": "summary"
@@ -176,11 +202,56 @@ class SummaryCompactionMode:
 
         return compacted, stats
 
+    def _chunks(self, messages: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """Split messages into summary chunks, cut from the start of the list."""
+        return [messages[i:i + self.chunk_size] for i in range(0, len(messages), self.chunk_size)]
+
+    @staticmethod
+    def _chunk_key(messages: list[dict[str, Any]]) -> str:
+        """Memo key of a chunk: a hash of its messages' roles and contents."""
+        payload = json.dumps(
+            [[m.get("role", ""), m.get("content", "")] for m in messages],
+            sort_keys=True, default=str, ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def summarize_chunks(self, chunks: list[list[dict[str, Any]]]) -> list[str]:
+        """
+        Summarize chunks concurrently (at most ``max_concurrency`` at a time).
+
+        Args:
+            chunks: Chunks of messages to summarize.
+
+        Returns:
+            Summary per chunk, in order.
+        """
+        return list(await asyncio.gather(*(self._summarize_chunk(chunk) for chunk in chunks)))
+
+    async def prepare(self, messages: list[dict[str, Any]], preserve_recent: int = 20) -> int:
+        """
+        Summarize the chunks a compaction of ``messages`` would need, ahead of time.
+
+        Args:
+            messages: Session messages.
+            preserve_recent: Number of recent messages compaction keeps verbatim.
+
+        Returns:
+            Number of chunks that were not memoized yet.
+        """
+        if len(messages) <= preserve_recent:
+            return 0
+        chunks = [
+            chunk for chunk in self._chunks(messages[:-preserve_recent])
+            if self._chunk_key(chunk) not in self._summary_cache
+        ]
+        await self.summarize_chunks(chunks)
+        return len(chunks)
+
     async def _summarize_chunk(self, messages: list[dict[str, Any]]) -> str:
         """
-        Summarize a chunk of messages.
+        Summarize a chunk of messages, reusing a memoized summary if there is one.
 
-        Uses LLM if available, falls back to extraction otherwise.
+        Concurrent requests for the same chunk share one summarization.
 
         Args:
             messages: Messages to summarize.
@@ -188,15 +259,50 @@ class SummaryCompactionMode:
         Returns:
             Summary text.
         """
+        key = self._chunk_key(messages)
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            self._summary_cache.move_to_end(key)
+            return cached
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._generate_summary(key, messages))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded so one cancelled caller does not cancel the shared summary
+        return await asyncio.shield(future)
+
+    async def _generate_summary(self, key: str, messages: list[dict[str, Any]]) -> str:
+        """
+        Summarize a chunk of messages and memoize the result.
+
+        Uses LLM if available, falls back to extraction otherwise. Extraction
+        fallbacks after a failed LLM call are not memoized, so a later
+        compaction retries the LLM.
+        """
         if self.summarizer:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
             try:
-                summary = await self.summarizer(messages)
+                async with self._semaphore:
+                    summary = await self.summarizer(messages)
                 if summary:
+                    self._remember(key, summary)
                     return summary
             except Exception as e:
                 logger.warning(f"LLM summarization failed: {e}, falling back to extraction")
+            return self._extraction_summary(messages)
 
-        return self._extraction_summary(messages)
+        summary = self._extraction_summary(messages)
+        self._remember(key, summary)
+        return summary
+
+    def _remember(self, key: str, summary: str) -> None:
+        self._summary_cache[key] = summary
+        self._summary_cache.move_to_end(key)
+        while len(self._summary_cache) > self.cache_size:
+            self._summary_cache.popitem(last=False)
 
     def _extraction_summary(self, messages: list[dict[str, Any]]) -> str:
         """
@@ -417,19 +523,31 @@ class SessionCompactor:
         self._modes: dict[str, CompactionMode] = {
             "summary": SummaryCompactionMode(
                 chunk_size=self.config.summary_chunk_size,
-                summarizer=summarizer
+                summarizer=summarizer,
+                max_concurrency=self.config.summary_concurrency,
+                cache_size=self.config.summary_cache_size,
             ),
             "token-limit": TokenLimitCompactionMode(),
         }
 
-    def should_compact(self, messages: list[dict[str, Any]], max_tokens: int) -> bool:
+        # Background pre-compaction tasks by session key
+        self._precompaction_tasks: dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def _count_tokens(messages: "Session | list[dict[str, Any]]") -> int:
+        """Token total of a session (maintained incrementally) or a message list."""
+        if isinstance(messages, Session):
+            return messages.token_count()
+        return count_messages(messages)
+
+    def should_compact(self, messages: "Session | list[dict[str, Any]]", max_tokens: int) -> bool:
         """
         Check if session should be compacted.
 
         Uses proactive threshold (default 80%) to prevent emergencies.
 
         Args:
-            messages: Session messages.
+            messages: Session (counted incrementally) or its messages.
             max_tokens: Maximum context window.
 
         Returns:
@@ -441,7 +559,7 @@ class SessionCompactor:
         if self.config.mode == "off":
             return False
 
-        current_tokens = count_messages(messages)
+        current_tokens = self._count_tokens(messages)
         threshold = int(max_tokens * self.config.threshold_percent)
 
         should_compact = current_tokens > threshold
@@ -454,7 +572,62 @@ class SessionCompactor:
 
         return should_compact
 
-    def get_compaction_strategy(self, messages: list[dict[str, Any]], max_tokens: int) -> dict[str, Any]:
+    def schedule_precompaction(self, session: Session, max_tokens: int) -> bool:
+        """
+        Prepare a session's compaction in the background when it nears the threshold.
+
+        Once the session passes ``precompact_ratio`` of the compaction
+        threshold, its older chunks are summarized in a background task.
+        Session messages are left untouched; the summaries are memoized, so
+        the compaction that runs once the threshold is crossed only has to
+        summarize what was added since.
+
+        Args:
+            session: Session to prepare.
+            max_tokens: Maximum context window.
+
+        Returns:
+            True if a background task was started.
+        """
+        if (
+            not self.config.enabled
+            or not self.config.background_precompaction
+            or self.config.mode != "summary"
+            or self.summarizer is None
+        ):
+            return False
+
+        pending = self._precompaction_tasks.get(session.key)
+        if pending is not None and not pending.done():
+            return False
+
+        threshold = int(max_tokens * self.config.threshold_percent)
+        if session.token_count() < threshold * self.config.precompact_ratio:
+            return False
+
+        mode_impl = self._modes["summary"]
+        messages = list(session.messages)
+
+        async def precompact() -> None:
+            try:
+                prepared = await mode_impl.prepare(messages, preserve_recent=self.config.preserve_recent)
+                if prepared:
+                    logger.debug(f"Pre-compaction summarized {prepared} chunks for {session.key}")
+            except Exception as e:
+                logger.warning(f"Background pre-compaction failed for {session.key}: {e}")
+
+        def forget(done: asyncio.Task) -> None:
+            if self._precompaction_tasks.get(session.key) is done:
+                del self._precompaction_tasks[session.key]
+
+        task = asyncio.create_task(precompact())
+        self._precompaction_tasks[session.key] = task
+        task.add_done_callback(forget)
+        return True
+
+    def get_compaction_strategy(
+        self, messages: "Session | list[dict[str, Any]]", max_tokens: int
+    ) -> dict[str, Any]:
         """
         Determine the best compaction strategy based on conversation length.
 
@@ -465,14 +638,16 @@ class SessionCompactor:
         - desperate (>{long_threshold}): token-limit mode as fallback
 
         Args:
-            messages: Session messages.
+            messages: Session (counted incrementally) or its messages.
             max_tokens: Maximum context window.
 
         Returns:
             Dict with strategy info: mode, reason, and recommended settings.
         """
+        current_tokens = self._count_tokens(messages)
+        if isinstance(messages, Session):
+            messages = messages.messages
         msg_count = len(messages)
-        current_tokens = count_messages(messages)
 
         short = self.config.short_threshold
         medium = self.config.medium_threshold
@@ -681,7 +856,7 @@ class SessionCompactor:
 
         # Perform compaction
         messages = session.messages
-        original_tokens = count_messages(messages)
+        original_tokens = session.token_count()
 
         if mode == "summary":
             compacted, stats = await mode_impl.compact(
@@ -717,18 +892,20 @@ class SessionCompactor:
 
         return result
 
-    def get_context_status(self, messages: list[dict[str, Any]], max_tokens: int) -> dict[str, Any]:
+    def get_context_status(
+        self, messages: "Session | list[dict[str, Any]]", max_tokens: int
+    ) -> dict[str, Any]:
         """
         Get context usage status.
 
         Args:
-            messages: Session messages.
+            messages: Session (counted incrementally) or its messages.
             max_tokens: Maximum context window.
 
         Returns:
             Status dict with percentage, token counts, etc.
         """
-        current_tokens = count_messages(messages)
+        current_tokens = self._count_tokens(messages)
         percentage = current_tokens / max_tokens if max_tokens > 0 else 0.0
 
         return {
@@ -768,7 +945,7 @@ async def compact_session_if_needed(
     """
     compactor = SessionCompactor(config)
 
-    if not compactor.should_compact(session.messages, max_tokens):
+    if not compactor.should_compact(session, max_tokens):
         return None
 
     # Call memory flush hook if provided
@@ -0,0 +1,151 @@
+"""Vectorized similarity scoring for stored embeddings.
+
+Embeddings are stored in SQLite as packed float32 BLOBs. Rather than
+unpacking each BLOB into a Python list and scoring candidates one by one,
+this module loads all candidates into a single contiguous float32 matrix,
+normalizes it once, and scores every row with one matrix-vector product.
+Top-k selection uses ``argpartition`` so only the winners get sorted.
+"""
+
+from typing import Callable, Optional, Sequence, TypeVar, Union
+
+import numpy as np
+
+EmbeddingLike = Union[bytes, bytearray, memoryview, Sequence[float], np.ndarray]
+
+T = TypeVar("T")
+
+
+def as_vector(embedding: EmbeddingLike) -> np.ndarray:
+    """
+    Convert an embedding in any supported form to a float32 vector.
+
+    Args:
+        embedding: Packed float32 bytes, a list of floats, or an array
+
+    Returns:
+        1-D float32 array (a zero-copy view for bytes input)
+    """
+    if isinstance(embedding, (bytes, bytearray, memoryview)):
+        return np.frombuffer(embedding, dtype=np.float32)
+    return np.asarray(embedding, dtype=np.float32).reshape(-1)
+
+
+def normalize(vector: np.ndarray) -> np.ndarray:
+    """Return a unit-length copy of a vector (zero vectors stay zero)."""
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return np.zeros_like(vector, dtype=np.float32)
+    return (vector / norm).astype(np.float32, copy=False)
+
+
+def embeddings_to_matrix(
+    embeddings: Sequence[Optional[EmbeddingLike]],
+    dimension: int,
+) -> tuple[np.ndarray, list[int]]:
+    """
+    Stack embeddings into a row-normalized float32 matrix.
+
+    Entries that are empty or have the wrong dimension are skipped.
+
+    Args:
+        embeddings: Candidate embeddings (BLOBs, lists or arrays)
+        dimension: Expected embedding dimension
+
+    Returns:
+        Tuple of (matrix of shape (n, dimension), positions of the rows
+        in the input sequence)
+    """
+    row_bytes = dimension * 4
+    blobs: list[bytes] = []
+    positions: list[int] = []
+
+    for position, embedding in enumerate(embeddings):
+        if embedding is None:
+            continue
+        if isinstance(embedding, (bytes, bytearray, memoryview)):
+            blob = bytes(embedding)
+        else:
+            vector = as_vector(embedding)
+            if vector.size != dimension:
+                continue
+            blob = vector.tobytes()
+        if len(blob) != row_bytes:
+            continue
+        blobs.append(blob)
+        positions.append(position)
+
+    if not blobs:
+        return np.empty((0, dimension), dtype=np.float32), []
+
+    matrix = np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(blobs), dimension)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return np.ascontiguousarray(matrix / norms, dtype=np.float32), positions
+
+
+def top_k(
+    query: EmbeddingLike,
+    matrix: np.ndarray,
+    k: int,
+    threshold: Optional[float] = None,
+) -> list[tuple[int, float]]:
+    """
+    Score all rows of a normalized matrix against a query and keep the best.
+
+    Args:
+        query: Query embedding (normalized internally)
+        matrix: Row-normalized matrix from ``embeddings_to_matrix``
+        k: Number of results to return
+        threshold: Optional minimum cosine similarity
+
+    Returns:
+        List of (row_index, similarity) tuples, sorted by similarity
+    """
+    if k <= 0 or matrix.shape[0] == 0:
+        return []
+
+    vector = as_vector(query)
+    if vector.size != matrix.shape[1]:
+        raise ValueError(f"Vectors must have same length: {vector.size} vs {matrix.shape[1]}")
+
+    scores = matrix @ normalize(vector)
+
+    if k < scores.shape[0]:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(scores.shape[0])
+    order = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+    results = []
+    for row in order:
+        score = float(scores[row])
+        if threshold is not None and score < threshold:
+            break
+        results.append((int(row), score))
+    return results
+
+
+def rank_by_similarity(
+    query: EmbeddingLike,
+    items: Sequence[T],
+    key: Callable[[T], Optional[EmbeddingLike]],
+    k: int,
+    threshold: Optional[float] = None,
+) -> list[tuple[T, float]]:
+    """
+    Rank arbitrary items by the similarity of their embeddings to a query.
+
+    Args:
+        query: Query embedding
+        items: Items to rank
+        key: Function returning an item's embedding (or None to skip it)
+        k: Number of results to return
+        threshold: Optional minimum cosine similarity
+
+    Returns:
+        List of (item, similarity) tuples, sorted by similarity
+    """
+    dimension = as_vector(query).size
+    matrix, positions = embeddings_to_matrix([key(item) for item in items], dimension)
+    return [(items[positions[row]], score) for row, score in top_k(query, matrix, k, threshold)]
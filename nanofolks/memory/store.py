@@ -7,8 +7,9 @@ for the memory system using SQLite with WAL mode for better concurrency.
 from __future__ import annotations
 
 import json
+import re
 import sqlite3
-import struct
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
@@ -19,9 +20,18 @@ if TYPE_CHECKING:
     from nanofolks.memory.embeddings import EmbeddingProvider
 
 from nanofolks.config.schema import MemoryConfig
+from nanofolks.memory.embedding_service import EmbeddingService
+from nanofolks.memory.embeddings import (
+    EmbeddingView,
+    cosine_similarity,
+    embedding_from_blob,
+    pack_embedding,
+)
+from nanofolks.memory.mentions import NameMatcher, name_patterns
 from nanofolks.memory.migrations import MigrationManager
 from nanofolks.memory.models import Edge, Entity, Event, Fact, Learning, SummaryNode
-from nanofolks.memory.vector_index import VectorIndex
+from nanofolks.memory.similarity import as_vector, embeddings_to_matrix, top_k
+from nanofolks.memory.vector_index import PartitionedVectorIndex, VectorIndex
 
 
 class TurboMemoryStore:
@@ -34,6 +44,24 @@ class TurboMemoryStore:
     - Better performance for concurrent access
     """
 
+    # Base table -> (FTS table, indexed columns)
+    _FTS_TABLES = {
+        "events": ("events_fts", ("content",)),
+        "entities": ("entities_fts", ("name", "aliases", "description")),
+        "learnings": ("learnings_fts", ("content", "recommendation")),
+    }
+
+    # Columns read when callers don't need the embedding vectors
+    _EVENT_FIELDS = (
+        "id", "timestamp", "channel", "direction", "event_type", "content",
+        "session_key", "parent_event_id", "person_id", "tool_name",
+        "extraction_status", "relevance_score", "last_accessed", "metadata",
+    )
+    _ENTITY_FIELDS = (
+        "id", "name", "entity_type", "aliases", "description",
+        "source_event_ids", "event_count", "first_seen", "last_seen",
+    )
+
     def __init__(self, config: MemoryConfig, workspace: Path):
         """
         Initialize the memory store.
@@ -46,6 +74,9 @@ class TurboMemoryStore:
         self.workspace = workspace
         self.embedding_provider: Optional["EmbeddingProvider"] = None
 
+        # Precision embeddings are held at in memory after being read
+        self._embedding_precision = config.embedding.vector_precision
+
         # Database file path
         self.db_path = workspace / config.db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -53,6 +84,17 @@ class TurboMemoryStore:
         # Connection (created on first use)
         self._conn: Optional[sqlite3.Connection] = None
 
+        # Separate connection for writes made from the embedding worker thread
+        self._bg_conn: Optional[sqlite3.Connection] = None
+        self._bg_lock = threading.Lock()
+
+        # Set once the FTS5 indexes are created in _init_tables
+        self._fts_enabled = False
+
+        # Entity name matcher for recording mentions (rebuilt after entity changes)
+        self._name_matcher: Optional[NameMatcher] = None
+        self._matcher_patterns: dict[str, frozenset[str]] = {}
+
         # Check if this is a new database and old memory files exist
         is_new_db = not self.db_path.exists()
 
@@ -70,8 +112,11 @@ class TurboMemoryStore:
                 stats = self.migrate_from_legacy(workspace)
                 logger.info(f"Migration complete: {stats}")
 
-        # Initialize HNSW vector index for fast semantic search
-        self._vector_index: Optional[VectorIndex] = None
+        # HNSW vector indexes for fast semantic search, one partition per room
+        self._vector_index: Optional[PartitionedVectorIndex] = None
+
+        # HNSW index over entity name embeddings, one partition per entity type
+        self._entity_index: Optional[PartitionedVectorIndex] = None
 
         logger.info(f"TurboMemoryStore initialized: {self.db_path}")
 
@@ -112,6 +157,8 @@ class TurboMemoryStore:
             self._conn.execute("PRAGMA temp_store=MEMORY;")
             self._conn.execute("PRAGMA mmap_size=268435456;")
             self._conn.execute("PRAGMA journal_size_limit=67108864;")
+            # INSERT OR REPLACE must fire delete triggers so FTS stays in sync
+            self._conn.execute("PRAGMA recursive_triggers=ON;")
 
             # Initialize tables
             self._init_tables()
@@ -177,6 +224,26 @@ class TurboMemoryStore:
         conn.execute("CREATE INDEX IF NOT EXISTS idx_entities_name ON entities(name);")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_entities_type ON entities(entity_type);")
 
+        # Event -> entity mentions, recorded when events are saved and extracted
+        mentions_exist = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'event_entities'"
+        ).fetchone()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS event_entities (
+                event_id TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                session_key TEXT NOT NULL,
+                channel TEXT,
+                ts REAL,
+                PRIMARY KEY (event_id, entity_id)
+            ) WITHOUT ROWID
+        """)
+
+        # Covering indexes so session/channel lookups never touch the events table
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_event_entities_session ON event_entities(session_key, entity_id, ts);")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_event_entities_channel ON event_entities(channel, entity_id, ts);")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_event_entities_entity ON event_entities(entity_id);")
+
         # Edges table - relationships between entities
         conn.execute("""
             CREATE TABLE IF NOT EXISTS edges (
@@ -274,20 +341,131 @@ class TurboMemoryStore:
         conn.execute("CREATE INDEX IF NOT EXISTS idx_learnings_source ON learnings(source);")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_learnings_relevance ON learnings(relevance_score);")
 
+        # Full-text indexes over the text columns, kept in sync by triggers
+        self._init_fts_tables(conn)
+
         conn.commit()
+
+        # Databases created before the mention table get it backfilled once
+        if not mentions_exist:
+            self.rebuild_mentions()
+
         logger.debug("Database tables initialized")
 
+    def _init_fts_tables(self, conn: sqlite3.Connection) -> None:
+        """
+        Create external-content FTS5 tables and their sync triggers.
+
+        The FTS tables store only the inverted index; rows are read back from
+        the base tables by rowid. Newly created indexes are backfilled from
+        existing rows. If SQLite was built without FTS5, text search falls
+        back to LIKE scans.
+        """
+        try:
+            for table, (fts_table, columns) in self._FTS_TABLES.items():
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (fts_table,)
+                ).fetchone()
+
+                column_list = ", ".join(columns)
+                new_values = ", ".join(f"new.{c}" for c in columns)
+                old_values = ", ".join(f"old.{c}" for c in columns)
+
+                conn.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(
+                        {column_list},
+                        content='{table}',
+                        content_rowid='rowid',
+                        tokenize='porter unicode61 remove_diacritics 2'
+                    )
+                """)
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {table} BEGIN
+                        INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.rowid, {new_values});
+                    END
+                """)
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {table} BEGIN
+                        INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                        VALUES ('delete', old.rowid, {old_values});
+                    END
+                """)
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {column_list} ON {table} BEGIN
+                        INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                        VALUES ('delete', old.rowid, {old_values});
+                        INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.rowid, {new_values});
+                    END
+                """)
+
+                if not exists:
+                    conn.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+                    logger.info(f"Built full-text index {fts_table}")
+
+            self._fts_enabled = True
+        except sqlite3.OperationalError as e:
+            self._fts_enabled = False
+            logger.warning(f"FTS5 unavailable, text search will use LIKE scans: {e}")
+
+    def rebuild_text_index(self) -> None:
+        """Rebuild the full-text indexes from their base tables."""
+        conn = self._get_connection()
+        if not self._fts_enabled:
+            return
+        for fts_table, _ in self._FTS_TABLES.values():
+            conn.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+        conn.commit()
+        logger.info("Full-text indexes rebuilt")
+
+    @staticmethod
+    def _fts_query(query: str, prefix: bool = False) -> Optional[str]:
+        """
+        Turn free text into a safe FTS5 MATCH expression.
+
+        Each word is quoted so FTS5 operators in user input are treated as
+        plain text, and words are OR-ed so BM25 ranks documents matching more
+        of them higher.
+
+        Args:
+            query: Free-text query
+            prefix: Also match words that start with each term
+
+        Returns:
+            MATCH expression, or None if the query has no searchable words
+        """
+        terms = list(dict.fromkeys(re.findall(r"\w+", query.lower())))
+        if not terms:
+            return None
+        suffix = "*" if prefix else ""
+        return " OR ".join(f'"{term}"{suffix}' for term in terms)
+
+    @staticmethod
+    def _projection(fields: tuple[str, ...], with_embeddings: bool, alias: str = "") -> str:
+        """SELECT list for a row reader: every column, or all but the embeddings."""
+        prefix = f"{alias}." if alias else ""
+        if with_embeddings:
+            return f"{prefix}*"
+        return ", ".join(prefix + field for field in fields)
+
     def close(self):
         """Close the database connection and save vector index."""
         if self._conn:
             self._conn.close()
             self._conn = None
             logger.debug("Database connection closed")
+        with self._bg_lock:
+            if self._bg_conn:
+                self._bg_conn.close()
+                self._bg_conn = None
             
-        # Save vector index
+        # Save vector indexes
         if self._vector_index:
             self._vector_index.close()
             logger.debug("Vector index saved")
+        if self._entity_index:
+            self._entity_index.close()
+            logger.debug("Entity index saved")
 
     def __enter__(self):
         """Context manager entry."""
@@ -297,19 +475,98 @@ class TurboMemoryStore:
         """Context manager exit."""
         self.close()
 
-    def _get_vector_index(self) -> VectorIndex:
-        """Get or initialize the vector index."""
+    def _get_vector_index(self) -> PartitionedVectorIndex:
+        """Get or initialize the per-room partitioned vector index."""
         if self._vector_index is None:
             dimension = 384  # bge-small-en-v1.5
-            self._vector_index = VectorIndex(
+            self._vector_index = PartitionedVectorIndex(
                 workspace=self.workspace,
                 dimension=dimension,
-                name="events"
+                name="events",
+                rebuild_source=lambda session_key: self.iter_event_embeddings(
+                    session_key=session_key
+                ),
             )
             self._vector_index.initialize()
-                
+
+            # Older workspaces have a single global events index; split it
+            # into per-room partitions from the stored embeddings.
+            legacy = VectorIndex(workspace=self.workspace, dimension=dimension, name="events")
+            if legacy.index_path.exists() and not self._vector_index.partitions():
+                logger.info("Migrating global vector index to per-room partitions")
+                self.rebuild_vector_index()
+                legacy.reset()
+
         return self._vector_index
 
+    def _get_entity_index(self) -> PartitionedVectorIndex:
+        """Get or initialize the entity-name index, partitioned by entity type."""
+        if self._entity_index is None:
+            self._entity_index = PartitionedVectorIndex(
+                workspace=self.workspace,
+                dimension=384,  # bge-small-en-v1.5
+                name="entities",
+                rebuild_source=lambda entity_type: self.iter_entity_embeddings(
+                    entity_type=entity_type
+                ),
+            )
+            self._entity_index.initialize()
+
+            if not self._entity_index.partitions():
+                self.rebuild_entity_index()
+
+        return self._entity_index
+
+    def iter_entity_embeddings(self, entity_type: str | None = None, with_type: bool = False):
+        """Iterate over entity name embeddings for index rebuild.
+
+        Yields (entity_id, embedding) tuples, or (entity_id, embedding,
+        entity_type) when ``with_type`` is set.
+        """
+        conn = self._get_connection()
+        query = "SELECT id, entity_type, name_embedding FROM entities WHERE name_embedding IS NOT NULL"
+        params: tuple = ()
+        if entity_type is not None:
+            query += " AND entity_type = ?"
+            params = (entity_type,)
+        for row in conn.execute(query, params):
+            blob = row['name_embedding']
+            if not blob:
+                continue
+            if with_type:
+                yield row['id'], as_vector(blob), row['entity_type']
+            else:
+                yield row['id'], as_vector(blob)
+
+    def _index_entity(self, entity: Entity) -> None:
+        """Keep the entity-name index in sync with a saved entity."""
+        try:
+            entity_index = self._get_entity_index()
+            current = entity_index.locate(entity.id)
+
+            if entity.name_embedding and current == entity.entity_type:
+                # Skip the rewrite when neither type nor embedding changed
+                stored = entity_index.get_vector(entity.id, current)
+                if stored is not None and cosine_similarity(stored, entity.name_embedding) > 0.9999:
+                    return
+
+            if current is not None:
+                entity_index.delete_vector(entity.id, partition=current)
+            if entity.name_embedding:
+                entity_index.add_vector(
+                    entity.id, entity.name_embedding, partition=entity.entity_type
+                )
+        except Exception as e:
+            logger.warning(f"Failed to update entity index for {entity.id}: {e}")
+
+    def rebuild_entity_index(self) -> int:
+        """Rebuild the entity-name index from stored entity embeddings."""
+        entity_index = self._get_entity_index()
+        items = list(self.iter_entity_embeddings(with_type=True))
+        count = entity_index.rebuild(items)
+        logger.info(f"Rebuilt entity index with {count} embeddings")
+        return count
+
     # =========================================================================
     # Event Operations
     # =========================================================================
@@ -326,7 +583,12 @@ class TurboMemoryStore:
         """
         conn = self._get_connection()
 
-        if event.content_embedding is None and self.embedding_provider:
+        # With the embedding service, embed on its worker instead of blocking the caller
+        defer_embedding = (
+            event.content_embedding is None
+            and isinstance(self.embedding_provider, EmbeddingService)
+        )
+        if event.content_embedding is None and self.embedding_provider and not defer_embedding:
             embedding = self._maybe_embed_text(event.content, max_chars=2000)
             if embedding:
                 event.content_embedding = embedding
@@ -335,7 +597,7 @@ class TurboMemoryStore:
         embedding_bytes = None
         if event.content_embedding:
             # Pack float array into bytes (384 floats for bge-small)
-            embedding_bytes = struct.pack(f'{len(event.content_embedding)}f', *event.content_embedding)
+            embedding_bytes = pack_embedding(event.content_embedding)
 
         conn.execute(
             """
@@ -364,19 +626,83 @@ class TurboMemoryStore:
                 json.dumps(event.metadata) if event.metadata else None
             )
         )
+
+        # Record which known entities the event mentions
+        try:
+            mentioned = self._get_name_matcher().find(event.content)
+            self._insert_mentions(conn, event, mentioned)
+        except Exception as e:
+            logger.warning(f"Failed to record entity mentions for {event.id}: {e}")
         conn.commit()
 
         # Also add to vector index for fast semantic search
         if event.content_embedding:
             try:
                 vector_index = self._get_vector_index()
-                vector_index.add_vector(event.id, event.content_embedding)
+                vector_index.add_vector(
+                    event.id, event.content_embedding, partition=event.session_key
+                )
             except Exception as e:
                 logger.warning(f"Failed to add embedding to vector index: {e}")
+        elif defer_embedding:
+            self._embed_event_async(event, max_chars=2000)
 
         logger.debug(f"Event saved: {event.id}")
         return event.id
 
+    def _embed_event_async(self, event: Event, max_chars: int = 2000) -> None:
+        """Queue an event's embedding; it is stored when the service resolves it."""
+        text = event.content[:max_chars] if max_chars and event.content else event.content
+        if not text or not text.strip():
+            return
+        try:
+            # Initialize the index here so the worker callback never has to
+            self._get_vector_index()
+            future = self.embedding_provider.submit(text)
+        except Exception as e:
+            logger.warning(f"Failed to queue embedding for {event.id}: {e}")
+            return
+        future.add_done_callback(
+            lambda done: self._store_event_embedding(event, done)
+        )
+
+    def _store_event_embedding(self, event: Event, future) -> None:
+        """
+        Persist an embedding produced by the embedding service.
+
+        Runs on the embedding worker thread, so it writes through a dedicated
+        connection. Events whose embedding fails stay NULL and are picked up
+        later by embed_missing_events.
+        """
+        try:
+            embedding = future.result()
+        except Exception as e:
+            logger.debug(f"Deferred embedding failed for {event.id}: {e}")
+            return
+        if not embedding or not any(embedding):
+            return
+
+        try:
+            with self._bg_lock:
+                if self._bg_conn is None:
+                    self._bg_conn = sqlite3.connect(
+                        str(self.db_path), check_same_thread=False, timeout=5.0
+                    )
+                    self._bg_conn.execute("PRAGMA busy_timeout=5000;")
+                cursor = self._bg_conn.execute(
+                    "UPDATE events SET content_embedding = ? WHERE id = ? AND content_embedding IS NULL",
+                    (pack_embedding(embedding), event.id)
+                )
+                self._bg_conn.commit()
+            if cursor.rowcount == 0:
+                return  # deleted, or embedded by embed_missing_events meanwhile
+
+            event.content_embedding = embedding
+            if self._vector_index is not None:
+                self._vector_index.add_vector(event.id, embedding, partition=event.session_key)
+        except Exception as e:
+            logger.warning(f"Failed to store deferred embedding for {event.id}: {e}")
+
     def get_event(self, event_id: str) -> Optional[Event]:
         """Retrieve an event by ID."""
         conn = self._get_connection()
@@ -390,11 +716,48 @@ class TurboMemoryStore:
 
         return self._row_to_event(row)
 
+    def get_events_by_ids(
+        self,
+        event_ids: list[str],
+        session_key: str | None = None,
+    ) -> dict[str, Event]:
+        """
+        Fetch several events in one round trip.
+
+        Args:
+            event_ids: Event IDs to load
+            session_key: Optional session to restrict results to
+
+        Returns:
+            Mapping of event ID to Event for the IDs that were found
+        """
+        if not event_ids:
+            return {}
+
+        conn = self._get_connection()
+        events: dict[str, Event] = {}
+
+        # Stay under SQLITE_MAX_VARIABLE_NUMBER on older builds
+        chunk_size = 900
+        for i in range(0, len(event_ids), chunk_size):
+            chunk = event_ids[i:i + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            query = f"SELECT * FROM events WHERE id IN ({placeholders})"
+            params: list[Any] = list(chunk)
+            if session_key:
+                query += " AND session_key = ?"
+                params.append(session_key)
+            for row in conn.execute(query, params).fetchall():
+                events[row['id']] = self._row_to_event(row)
+
+        return events
+
     def get_events_by_session(
         self,
         session_key: str,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        with_embeddings: bool = False
     ) -> list[Event]:
         """
         Get events for a specific session.
@@ -403,14 +766,16 @@ class TurboMemoryStore:
             session_key: The session identifier (e.g., "room:cli_default")
             limit: Maximum number of events to return
             offset: Number of events to skip
+            with_embeddings: Also load content embeddings
 
         Returns:
             List of events, most recent first
         """
         conn = self._get_connection()
+        columns = self._projection(self._EVENT_FIELDS, with_embeddings)
         rows = conn.execute(
-            """
-            SELECT * FROM events
+            f"""
+            SELECT {columns} FROM events
             WHERE session_key = ?
             ORDER BY timestamp DESC
             LIMIT ? OFFSET ?
@@ -420,12 +785,13 @@ class TurboMemoryStore:
 
         return [self._row_to_event(row) for row in rows]
 
-    def get_recent_events(self, limit: int = 50) -> list[Event]:
+    def get_recent_events(self, limit: int = 50, with_embeddings: bool = False) -> list[Event]:
         """Get most recent events across all sessions."""
         conn = self._get_connection()
+        columns = self._projection(self._EVENT_FIELDS, with_embeddings)
         rows = conn.execute(
-            """
-            SELECT * FROM events
+            f"""
+            SELECT {columns} FROM events
             ORDER BY timestamp DESC
             LIMIT ?
             """,
@@ -433,19 +799,33 @@ class TurboMemoryStore:
         ).fetchall()
         return [self._row_to_event(row) for row in rows]
 
-    def iter_event_embeddings(self, batch_size: int = 500):
-        """Iterate over event embeddings for index rebuild."""
+    def iter_event_embeddings(
+        self,
+        batch_size: int = 500,
+        with_session: bool = False,
+        session_key: str | None = None,
+    ):
+        """Iterate over event embeddings for index rebuild.
+
+        Yields (event_id, embedding) tuples, or (event_id, embedding,
+        session_key) when ``with_session`` is set. ``session_key``
+        restricts the iteration to one room.
+        """
         conn = self._get_connection()
+        session_filter = "AND session_key = ?" if session_key is not None else ""
         offset = 0
         while True:
+            params: tuple = (batch_size, offset)
+            if session_key is not None:
+                params = (session_key, batch_size, offset)
             rows = conn.execute(
-                """
-                SELECT id, content_embedding FROM events
-                WHERE content_embedding IS NOT NULL
+                f"""
+                SELECT id, session_key, content_embedding FROM events
+                WHERE content_embedding IS NOT NULL {session_filter}
                 ORDER BY timestamp ASC
                 LIMIT ? OFFSET ?
                 """,
-                (batch_size, offset)
+                params
             ).fetchall()
 
             if not rows:
@@ -455,9 +835,11 @@ class TurboMemoryStore:
                 blob = row["content_embedding"]
                 if not blob:
                     continue
-                dim = len(blob) // 4
-                embedding = struct.unpack(f'{dim}f', blob)
-                yield row["id"], list(embedding)
+                embedding = as_vector(blob)
+                if with_session:
+                    yield row["id"], embedding, row["session_key"]
+                else:
+                    yield row["id"], embedding
 
             offset += batch_size
 
@@ -502,7 +884,7 @@ class TurboMemoryStore:
         conn = self._get_connection()
         rows = conn.execute(
             """
-            SELECT id, content FROM events
+            SELECT id, content, session_key FROM events
             WHERE content_embedding IS NULL
             ORDER BY timestamp ASC
             LIMIT ?
@@ -514,7 +896,7 @@ class TurboMemoryStore:
             return 0
 
         updated = 0
-        vector_updates: list[tuple[str, list[float]]] = []
+        vector_updates: list[tuple[str, list[float], str]] = []
 
         def _prepare_text(text: str) -> str:
             if not text:
@@ -541,9 +923,9 @@ class TurboMemoryStore:
                 if not embedding or not any(embedding):
                     continue
                 event_id = batch[local_idx]["id"]
-                embedding_bytes = struct.pack(f'{len(embedding)}f', *embedding)
+                embedding_bytes = pack_embedding(embedding)
                 updates.append((embedding_bytes, event_id))
-                vector_updates.append((event_id, embedding))
+                vector_updates.append((event_id, embedding, batch[local_idx]["session_key"]))
 
             if updates:
                 conn.executemany(
@@ -579,21 +961,73 @@ class TurboMemoryStore:
 
         logger.debug(f"Event {event_id} marked as {status}")
 
+    def delete_event(self, event_id: str) -> bool:
+        """
+        Delete an event and drop its vector from the semantic index.
+
+        Args:
+            event_id: ID of event to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT session_key FROM events WHERE id = ?",
+            (event_id,)
+        ).fetchone()
+        if not row:
+            return False
+
+        conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
+        conn.execute("DELETE FROM event_entities WHERE event_id = ?", (event_id,))
+        conn.commit()
+
+        try:
+            self._get_vector_index().delete_vector(event_id, partition=row['session_key'])
+        except Exception as e:
+            logger.warning(f"Failed to remove {event_id} from vector index: {e}")
+
+        logger.debug(f"Event deleted: {event_id}")
+        return True
+
+    def delete_session_events(self, session_key: str) -> int:
+        """
+        Delete every event of a session and its vector index partition.
+
+        Args:
+            session_key: The session identifier (e.g., "room:cli_default")
+
+        Returns:
+            Number of events deleted
+        """
+        conn = self._get_connection()
+        cursor = conn.execute("DELETE FROM events WHERE session_key = ?", (session_key,))
+        conn.execute("DELETE FROM event_entities WHERE session_key = ?", (session_key,))
+        conn.commit()
+
+        try:
+            self._get_vector_index().drop_partition(session_key)
+        except Exception as e:
+            logger.warning(f"Failed to drop vector partition for {session_key}: {e}")
+
+        logger.debug(f"Deleted {cursor.rowcount} events for session {session_key}")
+        return cursor.rowcount
+
     def rebuild_vector_index(self) -> int:
-        """Rebuild the vector index from stored event embeddings."""
+        """Rebuild the partitioned vector index from stored event embeddings."""
         vector_index = self._get_vector_index()
-        items = list(self.iter_event_embeddings())
+        items = list(self.iter_event_embeddings(with_session=True))
         count = vector_index.rebuild(items)
         logger.info(f"Rebuilt vector index with {count} embeddings")
         return count
 
     def _row_to_event(self, row: sqlite3.Row) -> Event:
-        """Convert a database row to an Event object."""
-        # Deserialize embedding
+        """Convert a database row (full or projected) to an Event object."""
+        # Wrap the embedding BLOB without decoding it; projected rows have none
         embedding = None
-        if row['content_embedding']:
-            floats = struct.unpack('384f', row['content_embedding'])  # bge-small = 384 dims
-            embedding = list(floats)
+        if 'content_embedding' in row.keys():
+            embedding = embedding_from_blob(row['content_embedding'], self._embedding_precision)
 
         # Deserialize metadata
         metadata = {}
@@ -644,40 +1078,48 @@ class TurboMemoryStore:
         # Use vector index for fast search
         try:
             vector_index = self._get_vector_index()
-            index_results = vector_index.search(
-                query_embedding=query_embedding,
-                k=limit * 2,  # Get more to filter by session
-            )
-            
-            if not index_results:
+            partitions = [session_key] if session_key else None
+            index_size = vector_index.count(session_key)
+            if index_size == 0:
                 return []
-                
-            # Get events from database and filter by session if needed
-            conn = self._get_connection()
-            results = []
-            
-            for event_id, similarity in index_results:
-                if similarity < threshold:
-                    continue
-                    
-                row = conn.execute(
-                    "SELECT * FROM events WHERE id = ?",
-                    (event_id,)
-                ).fetchone()
-                
-                if row:
-                    # Apply session filter if specified
-                    if session_key and row['session_key'] != session_key:
-                        continue
-                        
-                    event = self._row_to_event(row)
-                    results.append((event, similarity))
-                    
-                if len(results) >= limit:
-                    break
-                    
-            return results
-            
+
+            # Over-fetch so threshold and missing rows still leave enough hits,
+            # and widen the window when they do not.
+            max_k = min(index_size, max(limit * 64, 256))
+            k = min(limit * 2, max_k)
+            while True:
+                index_results = vector_index.search(
+                    query_embedding=query_embedding,
+                    k=k,
+                    partitions=partitions,
+                )
+                candidates = [
+                    (event_id, similarity)
+                    for event_id, similarity in index_results
+                    if similarity >= threshold
+                ]
+                events = self.get_events_by_ids(
+                    [event_id for event_id, _ in candidates],
+                    session_key=session_key,
+                )
+
+                results = []
+                for event_id, similarity in candidates:
+                    event = events.get(event_id)
+                    if event is not None:
+                        results.append((event, similarity))
+                        if len(results) >= limit:
+                            break
+
+                exhausted = (
+                    len(results) >= limit
+                    or k >= max_k
+                    or len(candidates) < len(index_results)  # fell below threshold
+                )
+                if exhausted:
+                    return results
+                k = min(k * 4, max_k)
+
         except Exception as e:
             logger.warning(f"Vector index search failed, falling back to brute force: {e}")
             # Fallback to brute force
@@ -711,14 +1153,12 @@ class TurboMemoryStore:
         threshold: float = 0.5
     ) -> list[tuple[Event, float]]:
         """Fallback brute-force search if vector index fails."""
-        from nanofolks.memory.embeddings import cosine_similarity
-
         conn = self._get_connection()
 
         if session_key:
             rows = conn.execute(
                 """
-                SELECT * FROM events
+                SELECT id, content_embedding FROM events
                 WHERE session_key = ? AND content_embedding IS NOT NULL
                 ORDER BY timestamp DESC
                 LIMIT 1000
@@ -728,25 +1168,60 @@ class TurboMemoryStore:
         else:
             rows = conn.execute(
                 """
-                SELECT * FROM events
+                SELECT id, content_embedding FROM events
                 WHERE content_embedding IS NOT NULL
                 ORDER BY timestamp DESC
                 LIMIT 1000
                 """
             ).fetchall()
 
-        results = []
-        for row in rows:
-            if row['content_embedding']:
-                embedding = struct.unpack(f'{len(query_embedding)}f', row['content_embedding'])
-                similarity = cosine_similarity(query_embedding, list(embedding))
+        matrix, positions = embeddings_to_matrix(
+            [row['content_embedding'] for row in rows], len(query_embedding)
+        )
+        hits = [
+            (rows[positions[i]]['id'], score)
+            for i, score in top_k(query_embedding, matrix, limit, threshold)
+        ]
+        events = self.get_events_by_ids([event_id for event_id, _ in hits])
+        return [(events[event_id], score) for event_id, score in hits if event_id in events]
+
+    def search_events_fts(
+        self,
+        query: str,
+        session_key: str | None = None,
+        limit: int = 10
+    ) -> list[tuple[Event, float]]:
+        """
+        Search events with the full-text index, ranked by BM25.
 
-                if similarity >= threshold:
-                    event = self._row_to_event(row)
-                    results.append((event, similarity))
+        Args:
+            query: Free-text query
+            session_key: Optional session to restrict search to
+            limit: Maximum number of results
 
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:limit]
+        Returns:
+            List of (event, score) tuples, best first (higher is better)
+        """
+        conn = self._get_connection()
+        match = self._fts_query(query)
+        if not self._fts_enabled or match is None:
+            return []
+
+        sql = """
+            SELECT e.*, events_fts.rank AS fts_rank
+            FROM events_fts
+            JOIN events e ON e.rowid = events_fts.rowid
+            WHERE events_fts MATCH ?
+        """
+        params: list[Any] = [match]
+        if session_key:
+            sql += " AND e.session_key = ?"
+            params.append(session_key)
+        sql += " ORDER BY events_fts.rank LIMIT ?"
+        params.append(limit)
+
+        rows = conn.execute(sql, params).fetchall()
+        return [(self._row_to_event(row), -row['fts_rank']) for row in rows]
 
     def search_events_by_text(
         self,
@@ -755,7 +1230,7 @@ class TurboMemoryStore:
         limit: int = 10
     ) -> list[Event]:
         """
-        Search events by simple text matching.
+        Search events by text, ranked by BM25 when full-text search is available.
 
         Args:
             query: Text query
@@ -766,6 +1241,9 @@ class TurboMemoryStore:
             List of matching events
         """
         conn = self._get_connection()
+        if self._fts_enabled and self._fts_query(query) is not None:
+            return [event for event, _ in self.search_events_fts(query, session_key, limit)]
+
         pattern = f"%{query}%"
         if session_key:
             rows = conn.execute(
@@ -809,34 +1287,54 @@ class TurboMemoryStore:
         Returns:
             List of (entity, similarity_score) tuples
         """
-        from nanofolks.memory.embeddings import cosine_similarity
+        try:
+            entity_index = self._get_entity_index()
+            partitions = [entity_type] if entity_type else None
+            if entity_index.count(entity_type) == 0:
+                return []
+            hits = [
+                (entity_id, similarity)
+                for entity_id, similarity in entity_index.search(
+                    name_embedding, k=limit, partitions=partitions
+                )
+                if similarity >= threshold
+            ]
+            entities = self.get_entities_by_ids([entity_id for entity_id, _ in hits])
+            return [(entities[entity_id], score) for entity_id, score in hits if entity_id in entities]
+        except Exception as e:
+            logger.warning(f"Entity index search failed, falling back to brute force: {e}")
+            return self._similar_entities_bruteforce(name_embedding, entity_type, limit, threshold)
 
+    def _similar_entities_bruteforce(
+        self,
+        name_embedding: list[float],
+        entity_type: str | None = None,
+        limit: int = 10,
+        threshold: float = 0.7
+    ) -> list[tuple[Entity, float]]:
+        """Fallback brute-force entity search if the entity index fails."""
         conn = self._get_connection()
 
-        # Get entities with embeddings
+        # Only pull the vectors; full rows are loaded for the winners
         if entity_type:
             rows = conn.execute(
-                "SELECT * FROM entities WHERE entity_type = ? AND name_embedding IS NOT NULL",
+                "SELECT id, name_embedding FROM entities WHERE entity_type = ? AND name_embedding IS NOT NULL",
                 (entity_type,)
             ).fetchall()
         else:
             rows = conn.execute(
-                "SELECT * FROM entities WHERE name_embedding IS NOT NULL"
+                "SELECT id, name_embedding FROM entities WHERE name_embedding IS NOT NULL"
             ).fetchall()
 
-        # Calculate similarities
-        results = []
-        for row in rows:
-            if row['name_embedding']:
-                embedding = struct.unpack(f'{len(name_embedding)}f', row['name_embedding'])
-                similarity = cosine_similarity(name_embedding, list(embedding))
-
-                if similarity >= threshold:
-                    entity = self._row_to_entity(row)
-                    results.append((entity, similarity))
-
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:limit]
+        matrix, positions = embeddings_to_matrix(
+            [row['name_embedding'] for row in rows], len(name_embedding)
+        )
+        hits = [
+            (rows[positions[i]]['id'], score)
+            for i, score in top_k(name_embedding, matrix, limit, threshold)
+        ]
+        entities = self.get_entities_by_ids([entity_id for entity_id, _ in hits])
+        return [(entities[entity_id], score) for entity_id, score in hits if entity_id in entities]
 
     # =========================================================================
     # Entity Operations
@@ -864,13 +1362,12 @@ class TurboMemoryStore:
                 entity.description_embedding = embedding
 
         # Serialize embeddings
-        name_embedding_bytes = None
-        if entity.name_embedding:
-            name_embedding_bytes = struct.pack(f'{len(entity.name_embedding)}f', *entity.name_embedding)
-
-        desc_embedding_bytes = None
-        if entity.description_embedding:
-            desc_embedding_bytes = struct.pack(f'{len(entity.description_embedding)}f', *entity.description_embedding)
+        name_embedding_bytes = self._entity_embedding_bytes(
+            conn, entity.id, "name_embedding", entity.name_embedding
+        )
+        desc_embedding_bytes = self._entity_embedding_bytes(
+            conn, entity.id, "description_embedding", entity.description_embedding
+        )
 
         conn.execute(
             """
@@ -895,10 +1392,33 @@ class TurboMemoryStore:
             )
         )
         conn.commit()
+        self._entity_names_changed(entity.id, [entity.name, *(entity.aliases or [])])
+        self._index_entity(entity)
 
         logger.debug(f"Entity saved: {entity.id}")
         return entity.id
 
+    @staticmethod
+    def _entity_embedding_bytes(
+        conn: sqlite3.Connection, entity_id: str, column: str, embedding
+    ) -> Optional[bytes]:
+        """
+        Pack an entity embedding for writing without degrading the stored one.
+
+        With a reduced ``vector_precision`` the entity's vectors were read
+        back quantized. If one is unchanged, the stored float32 BLOB is
+        written back as-is rather than its dequantized approximation.
+        """
+        if not embedding:
+            return None
+        if isinstance(embedding, EmbeddingView) and embedding.precision != "float32":
+            row = conn.execute(
+                f"SELECT {column} FROM entities WHERE id = ?", (entity_id,)
+            ).fetchone()
+            if row and embedding.encodes(row[0]):
+                return row[0]
+        return pack_embedding(embedding)
+
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Retrieve an entity by ID."""
         conn = self._get_connection()
@@ -912,6 +1432,35 @@ class TurboMemoryStore:
 
         return self._row_to_entity(row)
 
+    def get_entities_by_ids(self, entity_ids: list[str]) -> dict[str, Entity]:
+        """
+        Fetch several entities in one round trip.
+
+        Args:
+            entity_ids: Entity IDs to load
+
+        Returns:
+            Mapping of entity ID to Entity for the IDs that were found
+        """
+        if not entity_ids:
+            return {}
+
+        conn = self._get_connection()
+        entities: dict[str, Entity] = {}
+
+        chunk_size = 900
+        for i in range(0, len(entity_ids), chunk_size):
+            chunk = entity_ids[i:i + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT * FROM entities WHERE id IN ({placeholders})",
+                chunk
+            ).fetchall()
+            for row in rows:
+                entities[row['id']] = self._row_to_entity(row)
+
+        return entities
+
     def find_entity_by_name(self, name: str) -> Optional[Entity]:
         """
         Find an entity by name (case-insensitive).
@@ -940,9 +1489,73 @@ class TurboMemoryStore:
 
         return self._row_to_entity(row)
 
+    def find_similar_entity(self, entity: Entity, threshold: float = 0.92) -> Optional[Entity]:
+        """
+        Find an existing entity of the same type whose name is semantically close.
+
+        Embeds the candidate's name if needed (the embedding is kept on the
+        entity so a later save does not embed it again) and runs an ANN query
+        against the entity index.
+
+        Args:
+            entity: Candidate entity (usually freshly extracted)
+            threshold: Minimum name similarity to treat as the same entity
+
+        Returns:
+            Matching entity, or None
+        """
+        if entity.name_embedding is None and entity.name:
+            entity.name_embedding = self._maybe_embed_text(entity.name, max_chars=200)
+        if not entity.name_embedding:
+            return None
+
+        matches = self.get_similar_entities(
+            entity.name_embedding,
+            entity_type=entity.entity_type,
+            limit=2,
+            threshold=threshold,
+        )
+        for match, _ in matches:
+            if match.id != entity.id:
+                return match
+        return None
+
+    def search_entities_fts(self, query: str, limit: int = 10) -> list[tuple[Entity, float]]:
+        """
+        Search entities with the full-text index, ranked by BM25.
+
+        Name matches weigh more than alias matches, which weigh more than
+        description matches. Terms also match as prefixes so partial names
+        still find their entity.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+
+        Returns:
+            List of (entity, score) tuples, best first (higher is better)
+        """
+        conn = self._get_connection()
+        match = self._fts_query(query, prefix=True)
+        if not self._fts_enabled or match is None:
+            return []
+
+        rows = conn.execute(
+            """
+            SELECT e.*, entities_fts.rank AS fts_rank
+            FROM entities_fts
+            JOIN entities e ON e.rowid = entities_fts.rowid
+            WHERE entities_fts MATCH ? AND entities_fts.rank MATCH 'bm25(10.0, 5.0, 1.0)'
+            ORDER BY entities_fts.rank
+            LIMIT ?
+            """,
+            (match, limit)
+        ).fetchall()
+        return [(self._row_to_entity(row), -row['fts_rank']) for row in rows]
+
     def search_entities_by_name(self, query: str, limit: int = 10) -> list[Entity]:
         """
-        Search entities by name or aliases using text matching.
+        Search entities by name or aliases, ranked by BM25 when available.
 
         Args:
             query: Search query
@@ -952,6 +1565,9 @@ class TurboMemoryStore:
             List of matching entities
         """
         conn = self._get_connection()
+        if self._fts_enabled and self._fts_query(query) is not None:
+            return [entity for entity, _ in self.search_entities_fts(query, limit)]
+
         pattern = f"%{query}%"
         rows = conn.execute(
             """
@@ -974,23 +1590,39 @@ class TurboMemoryStore:
         """
         conn = self._get_connection()
 
+        # Entities read without their vectors (projected listings) reuse the
+        # stored ones as long as the text they were computed from is unchanged
+        stored = None
+        if entity.name_embedding is None or entity.description_embedding is None:
+            stored = conn.execute(
+                "SELECT name, description, name_embedding, description_embedding FROM entities WHERE id = ?",
+                (entity.id,)
+            ).fetchone()
+
         if entity.name_embedding is None and entity.name:
-            embedding = self._maybe_embed_text(entity.name, max_chars=200)
-            if embedding:
-                entity.name_embedding = embedding
+            if stored and stored['name_embedding'] and stored['name'] == entity.name:
+                entity.name_embedding = embedding_from_blob(stored['name_embedding'], self._embedding_precision)
+            else:
+                embedding = self._maybe_embed_text(entity.name, max_chars=200)
+                if embedding:
+                    entity.name_embedding = embedding
         if entity.description_embedding is None and entity.description:
-            embedding = self._maybe_embed_text(entity.description, max_chars=1000)
-            if embedding:
-                entity.description_embedding = embedding
+            if stored and stored['description_embedding'] and stored['description'] == entity.description:
+                entity.description_embedding = embedding_from_blob(
+                    stored['description_embedding'], self._embedding_precision
+                )
+            else:
+                embedding = self._maybe_embed_text(entity.description, max_chars=1000)
+                if embedding:
+                    entity.description_embedding = embedding
 
         # Serialize embeddings
-        name_embedding_bytes = None
-        if entity.name_embedding:
-            name_embedding_bytes = struct.pack(f'{len(entity.name_embedding)}f', *entity.name_embedding)
-
-        desc_embedding_bytes = None
-        if entity.description_embedding:
-            desc_embedding_bytes = struct.pack(f'{len(entity.description_embedding)}f', *entity.description_embedding)
+        name_embedding_bytes = self._entity_embedding_bytes(
+            conn, entity.id, "name_embedding", entity.name_embedding
+        )
+        desc_embedding_bytes = self._entity_embedding_bytes(
+            conn, entity.id, "description_embedding", entity.description_embedding
+        )
 
         conn.execute(
             """
@@ -1020,13 +1652,16 @@ class TurboMemoryStore:
             )
         )
         conn.commit()
+        self._entity_names_changed(entity.id, [entity.name, *(entity.aliases or [])])
+        self._index_entity(entity)
 
         logger.debug(f"Entity updated: {entity.id}")
 
     def get_entities_by_type(
         self,
         entity_type: str,
-        limit: int = 100
+        limit: int = 100,
+        with_embeddings: bool = False
     ) -> list[Entity]:
         """
         Get entities of a specific type.
@@ -1034,14 +1669,16 @@ class TurboMemoryStore:
         Args:
             entity_type: Type of entities to retrieve
             limit: Maximum number of results
+            with_embeddings: Also load name/description embeddings
 
         Returns:
             List of entities
         """
         conn = self._get_connection()
+        columns = self._projection(self._ENTITY_FIELDS, with_embeddings)
         rows = conn.execute(
-            """
-            SELECT * FROM entities
+            f"""
+            SELECT {columns} FROM entities
             WHERE entity_type = ?
             ORDER BY event_count DESC
             LIMIT ?
@@ -1051,20 +1688,22 @@ class TurboMemoryStore:
 
         return [self._row_to_entity(row) for row in rows]
 
-    def get_all_entities(self, limit: int = 1000) -> list[Entity]:
+    def get_all_entities(self, limit: int = 1000, with_embeddings: bool = False) -> list[Entity]:
         """
         Get all entities.
 
         Args:
             limit: Maximum number of results
+            with_embeddings: Also load name/description embeddings
 
         Returns:
             List of entities
         """
         conn = self._get_connection()
+        columns = self._projection(self._ENTITY_FIELDS, with_embeddings)
         rows = conn.execute(
-            """
-            SELECT * FROM entities
+            f"""
+            SELECT {columns} FROM entities
             ORDER BY event_count DESC
             LIMIT ?
             """,
@@ -1089,14 +1728,140 @@ class TurboMemoryStore:
             "DELETE FROM entities WHERE id = ?",
             (entity_id,)
         )
+        conn.execute("DELETE FROM event_entities WHERE entity_id = ?", (entity_id,))
         conn.commit()
 
         deleted = cursor.rowcount > 0
         if deleted:
+            self._entity_names_changed(entity_id, [])
+            try:
+                self._get_entity_index().delete_vector(entity_id)
+            except Exception as e:
+                logger.warning(f"Failed to remove {entity_id} from entity index: {e}")
             logger.debug(f"Entity deleted: {entity_id}")
 
         return deleted
 
+    # =========================================================================
+    # Entity Mentions
+    # =========================================================================
+
+    def _get_name_matcher(self) -> NameMatcher:
+        """Get the name matcher, building it from current entities if needed."""
+        if self._name_matcher is None:
+            conn = self._get_connection()
+            names: list[tuple[str, str]] = []
+            patterns: dict[str, frozenset[str]] = {}
+            for row in conn.execute("SELECT id, name, aliases FROM entities"):
+                entity_names = [row['name'], *(json.loads(row['aliases']) if row['aliases'] else [])]
+                names.extend((name, row['id']) for name in entity_names)
+                patterns[row['id']] = name_patterns(entity_names)
+            self._name_matcher = NameMatcher(names)
+            self._matcher_patterns = patterns
+        return self._name_matcher
+
+    def _entity_names_changed(self, entity_id: str, names: list[str]) -> None:
+        """
+        Drop the name matcher if an entity's name or aliases changed.
+
+        Saving an entity with the names the matcher was built from (the
+        common case during extraction, which mostly bumps counts and
+        timestamps) keeps the matcher.
+        """
+        if self._name_matcher is None:
+            return
+        if self._matcher_patterns.get(entity_id, frozenset()) != name_patterns(names):
+            self._name_matcher = None
+
+    def _insert_mentions(self, conn: sqlite3.Connection, event: Event, entity_ids) -> None:
+        """Insert mention rows for an event (caller commits)."""
+        ts = event.timestamp.timestamp() if event.timestamp else None
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO event_entities (event_id, entity_id, session_key, channel, ts)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [(event.id, entity_id, event.session_key, event.channel, ts) for entity_id in entity_ids]
+        )
+
+    def add_event_mentions(self, event: Event, entity_ids: list[str]) -> None:
+        """
+        Record that an event mentions the given entities.
+
+        Args:
+            event: The mentioning event
+            entity_ids: IDs of the mentioned entities
+        """
+        if not entity_ids:
+            return
+        conn = self._get_connection()
+        self._insert_mentions(conn, event, set(entity_ids))
+        conn.commit()
+
+    def reassign_entity_mentions(self, from_entity_id: str, to_entity_id: str) -> None:
+        """
+        Move mentions from one entity to another (used when merging entities).
+
+        Args:
+            from_entity_id: Entity whose mentions are moved
+            to_entity_id: Entity receiving the mentions
+        """
+        conn = self._get_connection()
+        conn.execute(
+            "UPDATE OR IGNORE event_entities SET entity_id = ? WHERE entity_id = ?",
+            (to_entity_id, from_entity_id)
+        )
+        conn.execute("DELETE FROM event_entities WHERE entity_id = ?", (from_entity_id,))
+        conn.commit()
+
+    def rebuild_mentions(self, batch_size: int = 500) -> int:
+        """
+        Rebuild the mention table by matching entity names against all events.
+
+        Args:
+            batch_size: Number of events read per query
+
+        Returns:
+            Number of mentions recorded
+        """
+        conn = self._get_connection()
+        self._name_matcher = None
+        matcher = self._get_name_matcher()
+
+        conn.execute("DELETE FROM event_entities")
+        count = 0
+        if len(matcher) > 1:
+            last_rowid = 0
+            while True:
+                rows = conn.execute(
+                    """
+                    SELECT rowid, id, content, session_key, channel, timestamp FROM events
+                    WHERE rowid > ? ORDER BY rowid LIMIT ?
+                    """,
+                    (last_rowid, batch_size)
+                ).fetchall()
+                if not rows:
+                    break
+                last_rowid = rows[-1]['rowid']
+
+                mentions = [
+                    (row['id'], entity_id, row['session_key'], row['channel'], row['timestamp'])
+                    for row in rows
+                    for entity_id in matcher.find(row['content'])
+                ]
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO event_entities (event_id, entity_id, session_key, channel, ts)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    mentions
+                )
+                count += len(mentions)
+        conn.commit()
+
+        logger.info(f"Rebuilt entity mentions: {count}")
+        return count
+
     # =========================================================================
     # Edge Operations (for Knowledge Graph)
     # =========================================================================
@@ -1431,20 +2196,37 @@ class TurboMemoryStore:
             valid_to=datetime.fromtimestamp(row['valid_to']) if row['valid_to'] else None,
         )
 
-    def get_events_for_session(self, session_key: str, limit: int = 50) -> list[Event]:
+    def get_events_for_session(
+        self,
+        session_key: str,
+        limit: int = 50,
+        with_embeddings: bool = False
+    ) -> list[Event]:
         """Get events for a specific session key."""
-        return self.get_events_by_session(session_key, limit=limit, offset=0)
+        return self.get_events_by_session(
+            session_key, limit=limit, offset=0, with_embeddings=with_embeddings
+        )
 
-    def get_entities_for_session(self, session_key: str, limit: int = 20) -> list[Entity]:
+    def get_entities_for_session(
+        self,
+        session_key: str,
+        limit: int = 20,
+        with_embeddings: bool = False
+    ) -> list[Entity]:
         """Get entities mentioned in a specific session."""
         conn = self._get_connection()
+        columns = self._projection(self._ENTITY_FIELDS, with_embeddings, alias="e")
 
         rows = conn.execute(
-            """
-            SELECT DISTINCT e.* FROM entities e
-            JOIN events ev ON ev.content LIKE '%' || e.name || '%'
-            WHERE ev.session_key = ?
-            ORDER BY e.event_count DESC
+            f"""
+            SELECT {columns} FROM (
+                SELECT entity_id, MAX(ts) AS last_mentioned
+                FROM event_entities
+                WHERE session_key = ?
+                GROUP BY entity_id
+            ) m
+            JOIN entities e ON e.id = m.entity_id
+            ORDER BY e.event_count DESC, m.last_mentioned DESC
             LIMIT ?
             """,
             (session_key, limit)
@@ -1469,36 +2251,19 @@ class TurboMemoryStore:
         Returns:
             List of similar entities
         """
-        # Get all entities with embeddings
-        entities = self.get_all_entities(limit=1000)
-
-        # Calculate cosine similarity for each
-        from nanofolks.memory.embeddings import cosine_similarity
-
-        similarities = []
-        for entity in entities:
-            if entity.name_embedding:
-                sim = cosine_similarity(embedding, entity.name_embedding)
-                if sim >= threshold:
-                    similarities.append((entity, sim))
-
-        # Sort by similarity and return top results
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return [e for e, _ in similarities[:limit]]
+        results = self.get_similar_entities(embedding, limit=limit, threshold=threshold)
+        return [entity for entity, _ in results]
 
     def _row_to_entity(self, row: sqlite3.Row) -> Entity:
-        """Convert a database row to an Entity object."""
-        # Deserialize name embedding
+        """Convert a database row (full or projected) to an Entity object."""
+        # Wrap the embedding BLOBs without decoding them; projected rows have none
+        keys = row.keys()
         name_embedding = None
-        if row['name_embedding']:
-            floats = struct.unpack('384f', row['name_embedding'])
-            name_embedding = list(floats)
-
-        # Deserialize description embedding
         desc_embedding = None
-        if row['description_embedding']:
-            floats = struct.unpack('384f', row['description_embedding'])
-            desc_embedding = list(floats)
+        if 'name_embedding' in keys:
+            name_embedding = embedding_from_blob(row['name_embedding'], self._embedding_precision)
+        if 'description_embedding' in keys:
+            desc_embedding = embedding_from_blob(row['description_embedding'], self._embedding_precision)
 
         # Deserialize aliases and source event IDs
         aliases = []
@@ -1536,7 +2301,10 @@ class TurboMemoryStore:
         """
         conn = self._get_connection()
 
-        tables = ['events', 'entities', 'edges', 'facts', 'topics', 'summary_nodes', 'learnings']
+        tables = [
+            'events', 'entities', 'edges', 'facts', 'topics', 'summary_nodes', 'learnings',
+            'event_entities',
+        ]
         stats = {}
 
         for table in tables:
@@ -1554,6 +2322,15 @@ class TurboMemoryStore:
             "SELECT COUNT(*) FROM events WHERE content_embedding IS NULL"
         ).fetchone()[0]
         stats['pending_embeddings'] = pending_embeddings
+        stats['fts_enabled'] = self._fts_enabled
+
+        # Vector index health (deleted vectors awaiting compaction)
+        try:
+            index_stats = self._get_vector_index().get_stats()
+            stats['vector_index_tombstones'] = index_stats['tombstones']
+            stats['vector_index_tombstone_ratio'] = index_stats['tombstone_ratio']
+        except Exception as e:
+            logger.debug(f"Vector index stats unavailable: {e}")
 
         # Database file size
         try:
@@ -1711,13 +2488,19 @@ class TurboMemoryStore:
         conn.commit()
         return cursor.rowcount > 0
 
-    def get_events_for_channel(self, channel: str, limit: int = 50) -> list[Event]:
+    def get_events_for_channel(
+        self,
+        channel: str,
+        limit: int = 50,
+        with_embeddings: bool = False
+    ) -> list[Event]:
         """Get events for a specific channel."""
         conn = self._get_connection()
+        columns = self._projection(self._EVENT_FIELDS, with_embeddings)
 
         rows = conn.execute(
-            """
-            SELECT * FROM events
+            f"""
+            SELECT {columns} FROM events
             WHERE channel = ?
             ORDER BY timestamp DESC
             LIMIT ?
@@ -1727,17 +2510,27 @@ class TurboMemoryStore:
 
         return [self._row_to_event(row) for row in rows]
 
-    def get_entities_for_channel(self, channel: str, limit: int = 20) -> list[Entity]:
+    def get_entities_for_channel(
+        self,
+        channel: str,
+        limit: int = 20,
+        with_embeddings: bool = False
+    ) -> list[Entity]:
         """Get entities mentioned in a specific channel."""
         conn = self._get_connection()
+        columns = self._projection(self._ENTITY_FIELDS, with_embeddings, alias="e")
 
-        # Get entities that have events from this channel
+        # Get entities mentioned by events from this channel
         rows = conn.execute(
-            """
-            SELECT DISTINCT e.* FROM entities e
-            JOIN events ev ON ev.content LIKE '%' || e.name || '%'
-            WHERE ev.channel = ?
-            ORDER BY e.event_count DESC
+            f"""
+            SELECT {columns} FROM (
+                SELECT entity_id, MAX(ts) AS last_mentioned
+                FROM event_entities
+                WHERE channel = ?
+                GROUP BY entity_id
+            ) m
+            JOIN entities e ON e.id = m.entity_id
+            ORDER BY e.event_count DESC, m.last_mentioned DESC
             LIMIT ?
             """,
             (channel, limit)
@@ -1752,6 +2545,9 @@ class TurboMemoryStore:
         conn.commit()
         logger.info("Database vacuumed")
 
+        # VACUUM may renumber rowids, which the FTS indexes are keyed on
+        self.rebuild_text_index()
+
     # =========================================================================
     # Learning Operations (Phase 6: Learning + User Preferences)
     # =========================================================================
@@ -1821,6 +2617,41 @@ class TurboMemoryStore:
             return self._row_to_learning(row)
         return None
 
+    def search_learnings_fts(
+        self,
+        query: str,
+        limit: int = 10,
+        active_only: bool = True
+    ) -> list[tuple[Learning, float]]:
+        """
+        Search learnings with the full-text index, ranked by BM25.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            active_only: If True, skip superseded learnings
+
+        Returns:
+            List of (learning, score) tuples, best first (higher is better)
+        """
+        conn = self._get_connection()
+        match = self._fts_query(query)
+        if not self._fts_enabled or match is None:
+            return []
+
+        sql = """
+            SELECT l.*, learnings_fts.rank AS fts_rank
+            FROM learnings_fts
+            JOIN learnings l ON l.rowid = learnings_fts.rowid
+            WHERE learnings_fts MATCH ?
+        """
+        if active_only:
+            sql += " AND l.superseded_by IS NULL"
+        sql += " ORDER BY learnings_fts.rank LIMIT ?"
+
+        rows = conn.execute(sql, (match, limit)).fetchall()
+        return [(self._row_to_learning(row), -row['fts_rank']) for row in rows]
+
     def get_all_learnings(self, active_only: bool = True) -> list[Learning]:
         """
         Get all learnings, optionally filtering out superseded ones.
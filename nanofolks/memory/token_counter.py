@@ -9,12 +9,21 @@ we need accurate token counting to:
 2. Trigger compaction at 80% threshold (not 100%)
 3. Show context=X% to users
 4. Reserve buffer for model response
+
+Per-message counts are memoized by content hash, and cold counts of many
+messages go through tiktoken's ``encode_batch``.
 """
 
+import hashlib
+import json
+from collections import OrderedDict
 from typing import Any
 
 from loguru import logger
 
+# Per-message token counts remembered by each TokenCounter
+MESSAGE_CACHE_SIZE = 20000
+
 
 class TokenCounter:
     """
@@ -26,16 +35,19 @@ class TokenCounter:
     Supports multiple model encodings (cl100k_base for Claude/GPT-4).
     """
 
-    def __init__(self, encoding_name: str = "cl100k_base"):
+    def __init__(self, encoding_name: str = "cl100k_base", cache_size: int = MESSAGE_CACHE_SIZE):
         """
         Initialize the token counter.
 
         Args:
             encoding_name: The tiktoken encoding to use.
                           cl100k_base is used by Claude and GPT-4.
+            cache_size: Per-message counts to memoize (LRU)
         """
         self.encoding_name = encoding_name
+        self.cache_size = cache_size
         self._encoding = None
+        self._message_cache: OrderedDict[str, int] = OrderedDict()
         self._init_encoding()
 
     def _init_encoding(self):
@@ -75,56 +87,126 @@ class TokenCounter:
         # This is less accurate but works without tiktoken
         return len(text) // 4
 
-    def count_message(self, message: dict[str, Any]) -> int:
+    def _count_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens of many texts, in one ``encode_batch`` call when possible."""
+        if self._encoding is not None and len(texts) > 1:
+            try:
+                return [len(tokens) for tokens in self._encoding.encode_batch(texts)]
+            except Exception:
+                pass  # e.g. special tokens in one text; count individually
+        return [self.count_tokens(text) for text in texts]
+
+    @staticmethod
+    def _message_texts(message: dict[str, Any]) -> list[str]:
         """
-        Count tokens in a message dict.
+        The pieces of a message that are counted.
 
         Handles both simple string content and structured content
         with tool_use/tool_result blocks.
-
-        Args:
-            message: Message dict with 'role' and 'content'.
-
-        Returns:
-            Number of tokens in the message.
         """
         role = message.get("role", "")
         content = message.get("content", "")
 
         # Start with role tokens (approximate)
-        total = self.count_tokens(role) + 3  # +3 for formatting overhead
+        texts = [role]
 
         if isinstance(content, str):
-            total += self.count_tokens(content)
+            texts.append(content)
         elif isinstance(content, list):
             # Structured content (tool_use, tool_result blocks)
             for block in content:
                 if isinstance(block, dict):
                     block_type = block.get("type", "")
                     if block_type == "text":
-                        total += self.count_tokens(block.get("text", ""))
+                        texts.append(block.get("text", ""))
                     elif block_type == "tool_use":
                         # Count tool_use ID and input
-                        total += self.count_tokens(block.get("id", ""))
-                        total += self.count_tokens(str(block.get("input", "")))
+                        texts.append(block.get("id", ""))
+                        texts.append(str(block.get("input", "")))
                     elif block_type == "tool_result":
                         # Count tool_result content
                         result_content = block.get("content", "")
                         if isinstance(result_content, str):
-                            total += self.count_tokens(result_content)
+                            texts.append(result_content)
                         elif isinstance(result_content, list):
                             for item in result_content:
                                 if isinstance(item, dict) and item.get("type") == "text":
-                                    total += self.count_tokens(item.get("text", ""))
+                                    texts.append(item.get("text", ""))
                     else:
                         # Unknown block type, count as string
-                        total += self.count_tokens(str(block))
+                        texts.append(str(block))
                 else:
-                    total += self.count_tokens(str(block))
+                    texts.append(str(block))
         else:
-            total += self.count_tokens(str(content))
+            texts.append(str(content))
+
+        return [text for text in texts if text]
+
+    def message_key(self, message: dict[str, Any]) -> str:
+        """Cache key of a message: its encoding plus a hash of role and content."""
+        payload = json.dumps(
+            [message.get("role", ""), message.get("content", "")],
+            sort_keys=True, default=str, ensure_ascii=False,
+        )
+        digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{self.encoding_name}:{digest}"
+
+    def _remember(self, key: str, count: int) -> None:
+        self._message_cache[key] = count
+        self._message_cache.move_to_end(key)
+        while len(self._message_cache) > self.cache_size:
+            self._message_cache.popitem(last=False)
+
+    def count_message(self, message: dict[str, Any]) -> int:
+        """
+        Count tokens in a message dict.
 
-        return total
+        Handles both simple string content and structured content
+        with tool_use/tool_result blocks.
+
+        Args:
+            message: Message dict with 'role' and 'content'.
+
+        Returns:
+            Number of tokens in the message.
+        """
+        return self.count_message_list([message])[0]
+
+    def count_message_list(self, messages: list[dict[str, Any]]) -> list[int]:
+        """
+        Count tokens of each message.
+
+        Memoized counts (keyed by content hash and encoding) are reused;
+        the rest are encoded together with ``encode_batch``.
+
+        Args:
+            messages: List of message dicts.
+
+        Returns:
+            Token count per message, in order.
+        """
+        counts: list[int | None] = [None] * len(messages)
+        misses: list[tuple[int, str, list[str]]] = []
+
+        for index, message in enumerate(messages):
+            key = self.message_key(message)
+            cached = self._message_cache.get(key)
+            if cached is not None:
+                self._message_cache.move_to_end(key)
+                counts[index] = cached
+            else:
+                misses.append((index, key, self._message_texts(message)))
+
+        if misses:
+            texts = [text for _, _, message_texts in misses for text in message_texts]
+            text_counts = iter(self._count_batch(texts))
+            for index, key, message_texts in misses:
+                # +3 for formatting overhead
+                count = 3 + sum(next(text_counts) for _ in message_texts)
+                counts[index] = count
+                self._remember(key, count)
+
+        return counts
 
     def count_messages(self, messages: list[dict[str, Any]]) -> int:
         """
@@ -136,7 +218,7 @@ class TokenCounter:
         Returns:
             Total token count.
         """
-        return sum(self.count_message(msg) for msg in messages)
+        return sum(self.count_message_list(messages))
 
     def estimate_context_usage(
         self,
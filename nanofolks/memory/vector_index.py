@@ -2,16 +2,42 @@
 
 This module provides fast approximate nearest neighbor (ANN) search
 using hnswlib, replacing the brute-force cosine similarity approach.
+
+Persistence is incremental: new vectors and deletions are appended to a
+small binary delta log that is replayed on load, and the log is folded
+into a numbered snapshot (index file + compact id array + manifest) in
+the background once it grows past a threshold. Each snapshot starts a
+new delta log stamped with its generation, so replay never applies
+records to a snapshot they were not written against.
 """
 
+import hashlib
+import heapq
+import json
 import os
+import struct
+import threading
+import zlib
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 import hnswlib
 import numpy as np
 from loguru import logger
 
+# Delta log record: op, label, id length, crc32(payload); payload is the
+# UTF-8 id followed (for adds) by the normalized float32 vector.
+_DELTA_HEADER = struct.Struct("<cIHI")
+_DELTA_ADD = b"A"
+_DELTA_DELETE = b"D"
+
+# Delta log file header: magic, snapshot generation the records follow, and
+# whether that snapshot relabeled the index (tombstone compaction).
+_DELTA_LOG_HEADER = struct.Struct("<4sIB")
+_DELTA_LOG_MAGIC = b"NFVD"
+
+RebuildSource = Callable[[], Iterable[tuple[str, list[float]]]]
+
 
 class VectorIndex:
     """
@@ -29,6 +55,11 @@ class VectorIndex:
         M: int = 16,
         max_elements: int = 100000,
         name: str = "events",
+        directory: Optional[Path] = None,
+        compact_threshold: int = 1000,
+        rebuild_source: Optional[RebuildSource] = None,
+        tombstone_threshold: float = 0.25,
+        min_tombstones: int = 64,
     ):
         """
         Initialize the vector index.
@@ -39,6 +70,13 @@ class VectorIndex:
             ef_construction: Construction-time parameter (higher = better index, slower build)
             M: Number of connections per layer (higher = better recall, more memory)
             name: Name for this index (used in filename)
+            directory: Directory for index files (defaults to workspace/memory)
+            compact_threshold: Delta-log records before a background snapshot
+            rebuild_source: Callable yielding (id, embedding) pairs, used to
+                rebuild the index when the snapshot on disk is damaged
+            tombstone_threshold: Dead fraction of the graph that triggers a
+                background rebuild of the live vectors
+            min_tombstones: Minimum number of dead vectors before rebuilding
         """
         self.workspace = workspace
         self.dimension = dimension
@@ -46,13 +84,29 @@ class VectorIndex:
         self.M = M
         self.max_elements = max_elements
         self.name = name
+        self.compact_threshold = compact_threshold
+        self.rebuild_source = rebuild_source
+        self.tombstone_threshold = tombstone_threshold
+        self.min_tombstones = min_tombstones
         
-        self.index_path = workspace / "memory" / f"{name}_index.bin"
-        self.id_mapping_path = workspace / "memory" / f"{name}_ids.json"
+        self.directory = directory or workspace / "memory"
+        self.manifest_path = self.directory / f"{name}_snapshot.json"
+        # Single-file format written by older versions
+        self.index_path = self.directory / f"{name}_index.bin"
+        self.id_mapping_path = self.directory / f"{name}_ids.json"
         
         self._index: Optional[hnswlib.Index] = None
         self._id_map: dict[str, int] = {}  # event_id -> index position
         self._reverse_map: dict[int, str] = {}  # index position -> event_id
+
+        self._lock = threading.RLock()
+        # Serializes snapshot writers; always taken before _lock
+        self._snapshot_lock = threading.RLock()
+        self._generation = 0
+        self._delta_base = 0
+        self._delta_file = None
+        self._delta_records = 0
+        self._compaction_thread: Optional[threading.Thread] = None
         
     def _ensure_index(self):
         """Ensure the HNSW index is initialized."""
@@ -65,23 +119,35 @@ class VectorIndex:
             self._index.set_num_threads(4)
             
     def initialize(self):
-        """Initialize or load the index."""
-        self.workspace.mkdir(parents=True, exist_ok=True)
-        self._ensure_index()
-        
-        if self.index_path.exists():
+        """Initialize or load the index, replaying any pending delta log."""
+        with self._snapshot_lock, self._lock:
+            self.workspace.mkdir(parents=True, exist_ok=True)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._ensure_index()
+
             try:
-                self._index.load_index(str(self.index_path))
-                self._load_id_mapping()
-                logger.info(f"Loaded vector index from {self.index_path}")
+                if self.manifest_path.exists():
+                    self._load_snapshot()
+                    logger.info(f"Loaded vector index snapshot {self.name}.{self._generation}")
+                elif self.index_path.exists():
+                    self._load_legacy()
+                    logger.info(f"Loaded legacy vector index from {self.index_path}")
+                else:
+                    self._create_new_index()
+                self._replay_delta()
             except Exception as e:
-                logger.warning(f"Failed to load index: {e}, creating new one")
-                self._create_new_index()
-        else:
-            self._create_new_index()
+                logger.warning(f"Vector index {self.name} is damaged ({e}), rebuilding")
+                self._recover()
+                return
+
+            if self.index_path.exists():
+                # Convert the legacy single-file format on first load
+                self._write_snapshot()
+                self._remove_legacy_files()
             
     def _create_new_index(self):
         """Create a new index."""
+        self._index = None
         self._ensure_index()
         self._index.init_index(
             max_elements=self.max_elements,
@@ -90,54 +156,454 @@ class VectorIndex:
         )
         logger.info(f"Created new vector index (dim={self.dimension})")
 
-    def reset(self):
-        """Reset the index on disk and in memory."""
-        self._index = None
+    def _snapshot_paths(self, generation: int) -> tuple[Path, Path]:
+        """Index and id-array file paths for a snapshot generation."""
+        return (
+            self.directory / f"{self.name}_index.{generation}.bin",
+            self.directory / f"{self.name}_ids.{generation}.npy",
+        )
+
+    def _snapshot_files(self) -> list[Path]:
+        """All snapshot files on disk, of any generation."""
+        return (
+            list(self.directory.glob(f"{self.name}_index.*.bin"))
+            + list(self.directory.glob(f"{self.name}_ids.*.npy"))
+        )
+
+    def _delta_path(self, base: int) -> Path:
+        """Delta log holding the records written after snapshot ``base``."""
+        return self.directory / f"{self.name}_delta.{base}.log"
+
+    def _delta_logs(self) -> list[tuple[int, Path]]:
+        """Delta logs on disk as (base generation, path), oldest first."""
+        logs = []
+        for path in self.directory.glob(f"{self.name}_delta.*.log"):
+            base = path.name[len(self.name) + len("_delta."):-len(".log")]
+            if base.isdigit():
+                logs.append((int(base), path))
+        return sorted(logs)
+
+    def _load_snapshot(self):
+        """Load the snapshot named by the manifest, verifying it is complete."""
+        manifest = json.loads(self.manifest_path.read_text())
+        generation = int(manifest["generation"])
+        index_file, ids_file = self._snapshot_paths(generation)
+
+        if index_file.stat().st_size != manifest["index_bytes"]:
+            raise ValueError(f"torn snapshot {index_file.name}")
+
+        ids = np.load(ids_file, allow_pickle=False)
+        if len(ids) != manifest["labels"]:
+            raise ValueError(f"torn id array {ids_file.name}")
+
+        self._index.load_index(str(index_file))
+        if self._index.get_current_count() != manifest["count"]:
+            raise ValueError(f"snapshot {index_file.name} element count mismatch")
+
+        self._reverse_map = {label: item_id for label, item_id in enumerate(ids.tolist()) if item_id}
+        self._id_map = {item_id: label for label, item_id in self._reverse_map.items()}
+        self._generation = generation
+
+    def _load_legacy(self):
+        """Load the single-file index and JSON id map used by older versions."""
+        self._index.load_index(str(self.index_path))
         self._id_map = {}
         self._reverse_map = {}
-        if self.index_path.exists():
-            try:
-                self.index_path.unlink()
-            except Exception as e:
-                logger.warning(f"Failed to remove index file {self.index_path}: {e}")
         if self.id_mapping_path.exists():
+            data = json.loads(self.id_mapping_path.read_text())
+            self._id_map = data.get('id_map', {})
+            self._reverse_map = {int(k): v for k, v in data.get('reverse_map', {}).items()}
+
+    def _remove_legacy_files(self):
+        for path in (self.index_path, self.id_mapping_path):
             try:
-                self.id_mapping_path.unlink()
+                path.unlink(missing_ok=True)
             except Exception as e:
-                logger.warning(f"Failed to remove id map {self.id_mapping_path}: {e}")
+                logger.warning(f"Failed to remove legacy index file {path}: {e}")
 
-    def rebuild(self, items: list[tuple[str, list[float]]]) -> int:
-        """Rebuild the index from a full vector list."""
-        self.reset()
+    def _recover(self):
+        """Start over from an empty index and rebuild from the source of truth."""
+        self._id_map = {}
+        self._reverse_map = {}
+        self._generation = 0
+        self._close_delta()
+        logs = [path for _, path in self._delta_logs()]
+        for path in self._snapshot_files() + [self.manifest_path] + logs:
+            try:
+                path.unlink(missing_ok=True)
+            except Exception as e:
+                logger.warning(f"Failed to remove damaged snapshot file {path}: {e}")
+        self._delta_base = 0
+        self._delta_records = 0
         self._create_new_index()
-        if not items:
-            return 0
+
+        if self.rebuild_source is None:
+            logger.warning(f"No rebuild source for vector index {self.name}; starting empty")
+            return
+
+        items = list(self.rebuild_source())
         self.add_vectors_batch(items)
-        self.save()
-        return len(items)
-    
-    def _load_id_mapping(self):
-        """Load ID mapping from disk."""
-        import json
-        if self.id_mapping_path.exists():
+        self._write_snapshot()
+        logger.info(f"Rebuilt vector index {self.name} with {len(items)} vectors")
+
+    # ------------------------------------------------------------------
+    # Delta log
+    # ------------------------------------------------------------------
+
+    def _open_delta(self):
+        if self._delta_file is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._delta_file = open(self._delta_path(self._delta_base), "ab")
+            if self._delta_file.tell() == 0:
+                self._delta_file.write(
+                    _DELTA_LOG_HEADER.pack(_DELTA_LOG_MAGIC, self._delta_base, 0)
+                )
+        return self._delta_file
+
+    def _close_delta(self):
+        if self._delta_file is not None:
+            self._delta_file.close()
+            self._delta_file = None
+
+    def _start_delta(self, base: int, relabeled: bool):
+        """Send further records to a fresh log following snapshot ``base``."""
+        self._close_delta()
+        self._delta_base = base
+        self._delta_file = open(self._delta_path(base), "wb")
+        self._delta_file.write(_DELTA_LOG_HEADER.pack(_DELTA_LOG_MAGIC, base, int(relabeled)))
+        self._delta_file.flush()
+        self._delta_records = 0
+
+    def _log_records(self, records: list[bytes]):
+        """Append encoded records to the delta log."""
+        if not records:
+            return
+        delta = self._open_delta()
+        delta.write(b"".join(records))
+        delta.flush()
+        self._delta_records += len(records)
+
+    @staticmethod
+    def _encode_record(op: bytes, label: int, item_id: str, vector: Optional[np.ndarray] = None) -> bytes:
+        payload = item_id.encode("utf-8")
+        id_length = len(payload)
+        if vector is not None:
+            payload += np.ascontiguousarray(vector, dtype=np.float32).tobytes()
+        return _DELTA_HEADER.pack(op, label, id_length, zlib.crc32(payload)) + payload
+
+    def _replay_delta(self):
+        """Apply delta logs on top of the loaded snapshot.
+
+        Each log is stamped with the snapshot generation its records follow.
+        Logs older than the loaded snapshot are already folded into it (a
+        crash before they were removed) and are dropped unread. Logs newer
+        than it mean a crash before the manifest swap: their records still
+        apply when that snapshot kept the labels, but not after a relabeling
+        compaction, in which case the index is treated as damaged and
+        rebuilt. A torn trailing record is discarded.
+        """
+        records = 0
+        self._delta_base = self._generation
+        for base, path in self._delta_logs():
+            if base < self._generation:
+                path.unlink(missing_ok=True)
+                continue
+
+            data = path.read_bytes()
+            if len(data) < _DELTA_LOG_HEADER.size:
+                # Crash while the log was being created; it holds no records
+                path.unlink(missing_ok=True)
+                continue
+            magic, header_base, relabeled = _DELTA_LOG_HEADER.unpack_from(data, 0)
+            if magic != _DELTA_LOG_MAGIC or header_base != base:
+                raise ValueError(f"bad delta log header in {path.name}")
+            if base > self._generation and relabeled:
+                raise ValueError(f"{path.name} follows an uncommitted compaction")
+
+            records += self._replay_records(path, data, _DELTA_LOG_HEADER.size)
+            self._delta_base = base
+
+        self._delta_records = records
+        if records:
+            logger.debug(f"Replayed {records} delta records into vector index {self.name}")
+
+    def _replay_records(self, path: Path, data: bytes, offset: int) -> int:
+        """Apply the records of one delta log, truncating a torn tail."""
+        vector_bytes = self.dimension * 4
+        records = 0
+
+        while offset + _DELTA_HEADER.size <= len(data):
+            op, label, id_length, crc = _DELTA_HEADER.unpack_from(data, offset)
+            payload_length = id_length + (vector_bytes if op == _DELTA_ADD else 0)
+            start = offset + _DELTA_HEADER.size
+            end = start + payload_length
+            if end > len(data):
+                break
+            payload = data[start:end]
+            if zlib.crc32(payload) != crc:
+                break
+
+            item_id = payload[:id_length].decode("utf-8")
+            if op == _DELTA_ADD:
+                vector = np.frombuffer(payload[id_length:], dtype=np.float32)
+                self._apply_add(item_id, label, vector)
+            elif op == _DELTA_DELETE:
+                self._apply_delete(item_id)
+            else:
+                break
+
+            offset = end
+            records += 1
+
+        if offset < len(data):
+            logger.warning(f"Discarding {len(data) - offset} torn bytes from {path.name}")
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+        return records
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def _write_snapshot(self, relabeled: bool = False):
+        """Write a new snapshot generation and start a new delta log.
+
+        Callers hold ``_snapshot_lock`` and ``_lock``.
+        """
+        self._commit_snapshot(self._cut_snapshot(relabeled))
+
+    def _cut_snapshot(self, relabeled: bool = False) -> tuple[int, np.ndarray, int]:
+        """Capture the in-memory index as the next snapshot generation.
+
+        Runs under ``_lock``. The index is saved to its generation file
+        (buffered, not yet durable) and later records go to a new delta log
+        stamped with that generation; ``_commit_snapshot`` makes it durable
+        without holding ``_lock``.
+
+        Returns:
+            (generation, id array, element count) for ``_commit_snapshot``
+        """
+        self._ensure_index()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        generation = max(self._generation, self._delta_base) + 1
+        index_file, _ = self._snapshot_paths(generation)
+        self._index.save_index(str(index_file))
+
+        labels = self._next_label()
+        ids = np.array([self._reverse_map.get(label, "") for label in range(labels)], dtype=str)
+        count = self._index.get_current_count()
+
+        self._start_delta(generation, relabeled)
+        return generation, ids, count
+
+    def _commit_snapshot(self, snapshot: tuple[int, np.ndarray, int]):
+        """Make a cut snapshot durable, swap the manifest and drop what it replaces.
+
+        The manifest is replaced atomically after both snapshot files are
+        durable, so a crash at any point leaves a loadable snapshot plus
+        delta logs that replay cleanly on top of it. Callers hold
+        ``_snapshot_lock``.
+        """
+        generation, ids, count = snapshot
+        index_file, ids_file = self._snapshot_paths(generation)
+
+        with open(index_file, "rb+") as f:
+            os.fsync(f.fileno())
+
+        with open(ids_file, "wb") as f:
+            np.save(f, ids, allow_pickle=False)
+            f.flush()
+            os.fsync(f.fileno())
+
+        manifest = {
+            "generation": generation,
+            "count": count,
+            "labels": len(ids),
+            "index_bytes": index_file.stat().st_size,
+            "dimension": self.dimension,
+        }
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(manifest))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
+        self._generation = generation
+
+        current = set(self._snapshot_paths(generation))
+        stale = [path for base, path in self._delta_logs() if base < generation]
+        stale += [path for path in self._snapshot_files() if path not in current]
+        for path in stale:
             try:
-                data = json.loads(self.id_mapping_path.read_text())
-                self._id_map = data.get('id_map', {})
-                self._reverse_map = {int(k): v for k, v in data.get('reverse_map', {}).items()}
+                path.unlink(missing_ok=True)
             except Exception as e:
-                logger.warning(f"Failed to load ID mapping: {e}")
-                self._id_map = {}
-                self._reverse_map = {}
-                
-    def _save_id_mapping(self):
-        """Save ID mapping to disk."""
-        import json
-        self.id_mapping_path.parent.mkdir(parents=True, exist_ok=True)
-        self.id_mapping_path.write_text(json.dumps({
-            'id_map': self._id_map,
-            'reverse_map': {str(k): v for k, v in self._reverse_map.items()}
-        }))
+                logger.warning(f"Failed to remove old snapshot file {path}: {e}")
+
+        logger.debug(f"Wrote vector index snapshot {self.name}.{generation}")
+
+    def _maybe_compact(self):
+        """Snapshot (or rebuild, if mostly tombstones) in the background when due."""
+        if self._delta_records < self.compact_threshold and not self._needs_tombstone_compaction():
+            return
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        self._compaction_thread = threading.Thread(
+            target=self._compact,
+            name=f"vector-index-compact-{self.name}",
+            daemon=True,
+        )
+        self._compaction_thread.start()
+
+    def _compact(self):
+        try:
+            with self._snapshot_lock:
+                # Only the cut blocks searches; the fsyncs run after it
+                with self._lock:
+                    if self._needs_tombstone_compaction():
+                        self._rebuild_live()
+                        snapshot = self._cut_snapshot(relabeled=True)
+                    elif self._delta_records:
+                        snapshot = self._cut_snapshot()
+                    else:
+                        return
+                self._commit_snapshot(snapshot)
+        except Exception as e:
+            logger.warning(f"Vector index compaction failed for {self.name}: {e}")
+
+    def wait_for_compaction(self):
+        """Block until a running background compaction finishes."""
+        thread = self._compaction_thread
+        if thread is not None and thread.is_alive():
+            thread.join()
+
+    # ------------------------------------------------------------------
+    # Index operations
+    # ------------------------------------------------------------------
+
+    def reset(self):
+        """Reset the index on disk and in memory."""
+        self.wait_for_compaction()
+        with self._snapshot_lock, self._lock:
+            self._close_delta()
+            self._index = None
+            self._id_map = {}
+            self._reverse_map = {}
+            self._generation = 0
+            self._delta_base = 0
+            self._delta_records = 0
+
+            paths = [self.manifest_path, self.index_path, self.id_mapping_path]
+            paths += [path for _, path in self._delta_logs()]
+            for path in paths + self._snapshot_files():
+                try:
+                    path.unlink(missing_ok=True)
+                except Exception as e:
+                    logger.warning(f"Failed to remove index file {path}: {e}")
+
+    def rebuild(self, items: list[tuple[str, list[float]]]) -> int:
+        """Rebuild the index from a full vector list."""
+        self.wait_for_compaction()
+        with self._snapshot_lock, self._lock:
+            self.reset()
+            self._create_new_index()
+            self.add_vectors_batch(items)
+            self._write_snapshot()
+        return len(items)
         
+    def _next_label(self) -> int:
+        """Next unused HNSW label (labels are never reused after deletion)."""
+        next_label = self._index.get_current_count() if self._index is not None else 0
+        if self._reverse_map:
+            next_label = max(next_label, max(self._reverse_map) + 1)
+        return next_label
+
+    def _reserve(self, extra: int):
+        """Grow the HNSW capacity to fit ``extra`` more elements."""
+        max_elements = self._index.get_max_elements()
+        needed = self._index.get_current_count() + extra
+        if needed > max_elements:
+            self._index.resize_index(max(needed, max_elements * 2))
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        vec = np.array(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if norm > 0:
+            vec = vec / norm
+        return vec
+
+    def _apply_add(self, item_id: str, label: int, vector: np.ndarray):
+        """Insert a vector under a known label (used by delta replay)."""
+        if self._id_map.get(item_id) == label:
+            return
+        self._reserve(1)
+        self._index.add_items([vector], [label])
+        self._id_map[item_id] = label
+        self._reverse_map[label] = item_id
+
+    def _apply_delete(self, item_id: str) -> Optional[int]:
+        """Drop an item from the id mapping and tombstone it in the graph."""
+        idx = self._id_map.pop(item_id, None)
+        if idx is not None:
+            self._reverse_map.pop(idx, None)
+            try:
+                self._index.mark_deleted(idx)
+            except RuntimeError:
+                pass  # already tombstoned (e.g. replaying a delete)
+        return idx
+
+    def tombstones(self) -> int:
+        """Number of deleted vectors still occupying the graph."""
+        if self._index is None:
+            return 0
+        return max(0, self._index.get_current_count() - len(self._id_map))
+
+    def tombstone_ratio(self) -> float:
+        """Fraction of the graph taken up by deleted vectors."""
+        if self._index is None or self._index.get_current_count() == 0:
+            return 0.0
+        return self.tombstones() / self._index.get_current_count()
+
+    def _needs_tombstone_compaction(self) -> bool:
+        return (
+            self.tombstones() >= self.min_tombstones
+            and self.tombstone_ratio() >= self.tombstone_threshold
+        )
+
+    def _rebuild_live(self):
+        """Rebuild the graph from live vectors only, dropping tombstones.
+
+        Labels are reassigned, so the caller must cut a relabeled snapshot
+        before releasing ``_lock``.
+        """
+        live = sorted(self._reverse_map.items())
+        labels = [label for label, _ in live]
+        vectors = self._index.get_items(labels) if labels else []
+
+        dead = self.tombstones()
+        self._create_new_index()
+        if len(labels) > self._index.get_max_elements():
+            self._index.resize_index(len(labels))
+
+        self._id_map = {}
+        self._reverse_map = {}
+        if labels:
+            self._index.add_items(np.asarray(vectors, dtype=np.float32), list(range(len(labels))))
+            for label, (_, item_id) in enumerate(live):
+                self._id_map[item_id] = label
+                self._reverse_map[label] = item_id
+
+        logger.info(f"Compacted vector index {self.name}: dropped {dead} deleted vectors")
+
+    def compact(self):
+        """Rebuild without tombstones now (normally done automatically)."""
+        self.wait_for_compaction()
+        with self._snapshot_lock, self._lock:
+            if self._index is not None and self.tombstones():
+                self._rebuild_live()
+                self._write_snapshot(relabeled=True)
+
     def add_vector(self, event_id: str, embedding: list[float]):
         """
         Add a vector to the index.
@@ -146,33 +612,26 @@ class VectorIndex:
             event_id: Unique identifier for the vector
             embedding: Embedding vector
         """
-        self._ensure_index()
+        with self._lock:
+            self._ensure_index()
 
-        max_elements = self._index.get_max_elements()
-        current_count = self._index.get_current_count()
-        if current_count + 1 > max_elements:
-            new_max = max(current_count + 1, max_elements * 2)
-            self._index.resize_index(new_max)
-        
-        if event_id in self._id_map:
-            logger.debug(f"Vector {event_id} already in index, skipping")
-            return
-            
-        # Convert to numpy array
-        vec = np.array(embedding, dtype=np.float32)
-        
-        # Normalize for cosine similarity
-        norm = np.linalg.norm(vec)
-        if norm > 0:
-            vec = vec / norm
-            
-        # Add to index
-        idx = len(self._id_map)
-        self._index.add_items([vec], [idx])
-        
-        # Update mappings
-        self._id_map[event_id] = idx
-        self._reverse_map[idx] = event_id
+            if event_id in self._id_map:
+                logger.debug(f"Vector {event_id} already in index, skipping")
+                return
+
+            self._reserve(1)
+            vec = self._normalize(embedding)
+
+            # Add to index
+            idx = self._next_label()
+            self._index.add_items([vec], [idx])
+
+            # Update mappings
+            self._id_map[event_id] = idx
+            self._reverse_map[idx] = event_id
+
+            self._log_records([self._encode_record(_DELTA_ADD, idx, event_id, vec)])
+            self._maybe_compact()
         
     def add_vectors_batch(self, items: list[tuple[str, list[float]]]):
         """
@@ -183,38 +642,35 @@ class VectorIndex:
         """
         if not items:
             return
-            
-        self._ensure_index()
-        
-        # Filter out duplicates
-        new_items = [(eid, emb) for eid, emb in items if eid not in self._id_map]
-        if not new_items:
-            return
 
-        max_elements = self._index.get_max_elements()
-        current_count = self._index.get_current_count()
-        needed = current_count + len(new_items)
-        if needed > max_elements:
-            new_max = max(needed, max_elements * 2)
-            self._index.resize_index(new_max)
-            
-        # Convert to numpy array
-        vectors = []
-        ids = []
-        start_idx = len(self._id_map)
-        
-        for i, (event_id, embedding) in enumerate(new_items):
-            vec = np.array(embedding, dtype=np.float32)
-            norm = np.linalg.norm(vec)
-            if norm > 0:
-                vec = vec / norm
-            vectors.append(vec)
-            ids.append(start_idx + i)
-            self._id_map[event_id] = start_idx + i
-            self._reverse_map[start_idx + i] = event_id
-            
-        self._index.add_items(vectors, ids)
-        logger.debug(f"Added {len(new_items)} vectors to index")
+        with self._lock:
+            self._ensure_index()
+
+            # Filter out duplicates
+            new_items = [(eid, emb) for eid, emb in items if eid not in self._id_map]
+            if not new_items:
+                return
+
+            self._reserve(len(new_items))
+
+            vectors = []
+            ids = []
+            records = []
+            start_idx = self._next_label()
+
+            for i, (event_id, embedding) in enumerate(new_items):
+                vec = self._normalize(embedding)
+                label = start_idx + i
+                vectors.append(vec)
+                ids.append(label)
+                self._id_map[event_id] = label
+                self._reverse_map[label] = event_id
+                records.append(self._encode_record(_DELTA_ADD, label, event_id, vec))
+
+            self._index.add_items(vectors, ids)
+            self._log_records(records)
+            self._maybe_compact()
+            logger.debug(f"Added {len(new_items)} vectors to index")
         
     def search(
         self,
@@ -233,36 +689,38 @@ class VectorIndex:
         Returns:
             List of (event_id, similarity_score) tuples, sorted by similarity
         """
-        if self._index is None or self._index.get_current_count() == 0:
-            return []
-            
-        # Normalize query
-        vec = np.array(query_embedding, dtype=np.float32)
-        norm = np.linalg.norm(vec)
-        if norm > 0:
-            vec = vec / norm
-            
-        # Search
-        labels, distances = self._index.knn_query([vec], k=k + (len(filter_event_ids) if filter_event_ids else 0))
-        
-        results = []
-        for idx, distance in zip(labels[0], distances[0]):
-            event_id = self._reverse_map.get(int(idx))
-            if event_id is None:
-                continue
-                
-            # Apply filter if provided
-            if filter_event_ids and event_id not in filter_event_ids:
-                continue
-                
-            # Convert distance to similarity (cosine distance -> similarity)
-            similarity = 1.0 - distance
-            results.append((event_id, similarity))
-            
-            if len(results) >= k:
-                break
-                
-        return results
+        with self._lock:
+            if self._index is None or not self._id_map:
+                return []
+
+            vec = self._normalize(query_embedding)
+
+            # Search (hnswlib refuses k larger than the number of live items;
+            # tombstoned vectors are skipped by the graph walk itself)
+            k_query = min(
+                k + (len(filter_event_ids) if filter_event_ids else 0),
+                len(self._id_map),
+            )
+            labels, distances = self._index.knn_query([vec], k=k_query)
+
+            results = []
+            for idx, distance in zip(labels[0], distances[0]):
+                event_id = self._reverse_map.get(int(idx))
+                if event_id is None:
+                    continue
+
+                # Apply filter if provided
+                if filter_event_ids and event_id not in filter_event_ids:
+                    continue
+
+                # Convert distance to similarity (cosine distance -> similarity)
+                similarity = 1.0 - float(distance)
+                results.append((event_id, similarity))
+
+                if len(results) >= k:
+                    break
+
+            return results
         
     def get_vector(self, event_id: str) -> Optional[list[float]]:
         """
@@ -274,54 +732,72 @@ class VectorIndex:
         Returns:
             Embedding vector, or None if not found
         """
-        idx = self._id_map.get(event_id)
-        if idx is None:
-            return None
-            
-        try:
-            vectors = self._index.get_items([idx])
-            return vectors[0].tolist()
-        except Exception:
-            return None
+        with self._lock:
+            idx = self._id_map.get(event_id)
+            if idx is None:
+                return None
+
+            try:
+                vectors = self._index.get_items([idx])
+                return vectors[0].tolist()
+            except Exception:
+                return None
             
     def delete_vector(self, event_id: str):
         """
         Delete a vector from the index.
         
-        Note: HNSW doesn't support efficient deletion, so we mark it
-        as deleted and skip it in searches. For full deletion, rebuild.
+        The vector is tombstoned in the HNSW graph so searches skip it; the
+        graph is rebuilt from live vectors in the background once the dead
+        fraction passes ``tombstone_threshold``.
         
         Args:
             event_id: Event ID to delete
         """
-        # HNSW deletion is expensive - just remove from mapping
-        idx = self._id_map.pop(event_id, None)
-        if idx is not None:
-            self._reverse_map.pop(idx, None)
-            logger.debug(f"Marked vector {event_id} for deletion")
+        with self._lock:
+            idx = self._apply_delete(event_id)
+            if idx is not None:
+                self._log_records([self._encode_record(_DELTA_DELETE, idx, event_id)])
+                self._maybe_compact()
+                logger.debug(f"Marked vector {event_id} for deletion")
             
     def save(self):
-        """Save the index to disk."""
-        if self._index is not None:
-            self.index_path.parent.mkdir(parents=True, exist_ok=True)
-            self._index.save_index(str(self.index_path))
-            self._save_id_mapping()
-            logger.info(f"Saved vector index to {self.index_path}")
+        """Fold pending changes into a new on-disk snapshot."""
+        with self._snapshot_lock, self._lock:
+            if self._index is None:
+                return
+            if self._delta_records or not self.manifest_path.exists():
+                self._write_snapshot()
+                logger.info(f"Saved vector index snapshot {self.name}.{self._generation}")
             
     def get_stats(self) -> dict:
         """Get index statistics."""
-        if self._index is None:
-            return {"count": 0, "dimension": self.dimension}
-        return {
-            "count": self._index.get_current_count(),
-            "dimension": self.dimension,
-            "max_elements": self._index.get_max_elements(),
-            "ef_construction": self.ef_construction,
-        }
+        with self._lock:
+            if self._index is None:
+                return {"count": 0, "dimension": self.dimension}
+            return {
+                "count": self._index.get_current_count(),
+                "dimension": self.dimension,
+                "max_elements": self._index.get_max_elements(),
+                "ef_construction": self.ef_construction,
+                "live": len(self._id_map),
+                "tombstones": self.tombstones(),
+                "tombstone_ratio": self.tombstone_ratio(),
+                "generation": self._generation,
+                "delta_records": self._delta_records,
+            }
         
     def close(self):
-        """Close and save the index."""
-        self.save()
+        """Flush the delta log; snapshot only if it has grown large."""
+        self.wait_for_compaction()
+        with self._snapshot_lock, self._lock:
+            if self._delta_records >= self.compact_threshold:
+                self._write_snapshot()
+            if self._delta_file is not None:
+                self._delta_file.flush()
+                os.fsync(self._delta_file.fileno())
+                self._delta_file.close()
+                self._delta_file = None
         
     def __enter__(self):
         self.initialize()
@@ -329,3 +805,279 @@ class VectorIndex:
         
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class PartitionedVectorIndex:
+    """
+    A set of HNSW indexes partitioned by room/session key.
+
+    Each partition is a small, independent VectorIndex, so a search scoped
+    to one room only walks that room's graph and never has to discard
+    neighbours from other rooms. Cross-room searches fan out over all
+    partitions and merge the per-partition top-k.
+    """
+
+    def __init__(
+        self,
+        workspace: Path,
+        dimension: int = 384,
+        name: str = "events",
+        ef_construction: int = 200,
+        M: int = 16,
+        partition_capacity: int = 1024,
+        rebuild_source: Optional[Callable[[str], Iterable[tuple[str, list[float]]]]] = None,
+    ):
+        """
+        Initialize the partitioned index.
+
+        Args:
+            workspace: Path to workspace directory
+            dimension: Embedding dimension (384 for bge-small)
+            name: Name for this index family (used for the directory name)
+            ef_construction: Construction-time parameter for each partition
+            M: Connections per layer for each partition
+            partition_capacity: Initial capacity of a new partition (grows on demand)
+            rebuild_source: Callable taking a partition key and yielding its
+                (id, embedding) pairs, used to rebuild a damaged partition
+        """
+        self.workspace = workspace
+        self.dimension = dimension
+        self.name = name
+        self.ef_construction = ef_construction
+        self.M = M
+        self.partition_capacity = partition_capacity
+        self.rebuild_source = rebuild_source
+
+        self.directory = workspace / "memory" / f"{name}_partitions"
+        self.manifest_path = self.directory / "manifest.json"
+
+        self._manifest: dict[str, str] = {}  # partition key -> file slug
+        self._partitions: dict[str, VectorIndex] = {}  # loaded partitions
+        self._dirty: set[str] = set()
+
+        # Guards the partition maps; each partition has its own lock for its graph
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _slug(partition: str) -> str:
+        """Filesystem-safe, stable file name for a partition key."""
+        return hashlib.sha1(partition.encode("utf-8")).hexdigest()[:16]
+
+    def initialize(self):
+        """Load the partition manifest (partitions themselves load lazily)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self.manifest_path.exists():
+            try:
+                self._manifest = json.loads(self.manifest_path.read_text())
+            except Exception as e:
+                logger.warning(f"Failed to load partition manifest: {e}")
+                self._manifest = {}
+
+    def _save_manifest(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps(self._manifest))
+
+    def partitions(self) -> list[str]:
+        """Return all known partition keys."""
+        return list(self._manifest)
+
+    def _get_partition(self, partition: str, create: bool = False) -> Optional[VectorIndex]:
+        """Get a loaded partition, loading or creating it as needed."""
+        index = self._partitions.get(partition)
+        if index is not None:
+            return index
+
+        with self._lock:
+            index = self._partitions.get(partition)
+            if index is not None:
+                return index
+
+            if partition not in self._manifest:
+                if not create:
+                    return None
+                self._manifest[partition] = self._slug(partition)
+                self._save_manifest()
+
+            index = VectorIndex(
+                workspace=self.workspace,
+                dimension=self.dimension,
+                ef_construction=self.ef_construction,
+                M=self.M,
+                max_elements=self.partition_capacity,
+                name=self._manifest[partition],
+                directory=self.directory,
+                rebuild_source=self._partition_source(partition),
+            )
+            index.initialize()
+            self._partitions[partition] = index
+            return index
+
+    def _partition_source(self, partition: str) -> Optional[RebuildSource]:
+        if self.rebuild_source is None:
+            return None
+        return lambda: self.rebuild_source(partition)
+
+    def add_vector(self, item_id: str, embedding: list[float], partition: str):
+        """Add a vector to the given partition."""
+        with self._lock:
+            index = self._get_partition(partition, create=True)
+            index.add_vector(item_id, embedding)
+            self._dirty.add(partition)
+
+    def add_vectors_batch(self, items: list[tuple[str, list[float], str]]):
+        """
+        Add multiple vectors in batch.
+
+        Args:
+            items: List of (item_id, embedding, partition) tuples
+        """
+        grouped: dict[str, list[tuple[str, list[float]]]] = {}
+        for item_id, embedding, partition in items:
+            grouped.setdefault(partition, []).append((item_id, embedding))
+        with self._lock:
+            for partition, group in grouped.items():
+                index = self._get_partition(partition, create=True)
+                index.add_vectors_batch(group)
+                self._dirty.add(partition)
+
+    def locate(self, item_id: str) -> Optional[str]:
+        """Return the partition holding an item, if any."""
+        for key in self.partitions():
+            index = self._get_partition(key)
+            if index is not None and item_id in index._id_map:
+                return key
+        return None
+
+    def get_vector(self, item_id: str, partition: str) -> Optional[list[float]]:
+        """Get the stored (normalized) vector for an item in a partition."""
+        index = self._get_partition(partition)
+        if index is None:
+            return None
+        return index.get_vector(item_id)
+
+    def count(self, partition: str | None = None) -> int:
+        """Number of vectors in one partition, or across all partitions."""
+        keys = [partition] if partition is not None else self.partitions()
+        total = 0
+        for key in keys:
+            index = self._get_partition(key)
+            if index is not None:
+                total += len(index._id_map)
+        return total
+
+    def search(
+        self,
+        query_embedding: list[float],
+        k: int = 10,
+        partitions: list[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Search one or more partitions and merge the results.
+
+        Args:
+            query_embedding: Query vector
+            k: Number of results to return
+            partitions: Partition keys to search (all partitions if None)
+
+        Returns:
+            List of (item_id, similarity_score) tuples, sorted by similarity
+        """
+        keys = partitions if partitions is not None else self.partitions()
+        hits: list[tuple[str, float]] = []
+        for key in keys:
+            index = self._get_partition(key)
+            if index is None:
+                continue
+            hits.extend(index.search(query_embedding, k=k))
+        if len(keys) == 1:
+            return hits[:k]
+        return heapq.nlargest(k, hits, key=lambda hit: hit[1])
+
+    def delete_vector(self, item_id: str, partition: str | None = None):
+        """Delete a vector from its partition (or whichever partition holds it)."""
+        with self._lock:
+            key = partition if partition is not None else self.locate(item_id)
+            index = self._get_partition(key) if key is not None else None
+            if index is not None and item_id in index._id_map:
+                index.delete_vector(item_id)
+                self._dirty.add(key)
+
+    def reset(self):
+        """Drop every partition on disk and in memory."""
+        with self._lock:
+            for key in self.partitions():
+                index = self._get_partition(key)
+                if index is not None:
+                    index.reset()
+            self._partitions = {}
+            self._manifest = {}
+            self._dirty = set()
+            if self.manifest_path.exists():
+                try:
+                    self.manifest_path.unlink()
+                except Exception as e:
+                    logger.warning(f"Failed to remove manifest {self.manifest_path}: {e}")
+
+    def rebuild(self, items: list[tuple[str, list[float], str]]) -> int:
+        """Rebuild all partitions from a full (item_id, embedding, partition) list."""
+        with self._lock:
+            self.reset()
+            self.add_vectors_batch(items)
+            self.save()
+        return len(items)
+
+    def save(self):
+        """Snapshot partitions that changed since the last save."""
+        with self._lock:
+            for key in list(self._dirty):
+                index = self._partitions.get(key)
+                if index is not None:
+                    index.save()
+            self._dirty.clear()
+            if self._manifest:
+                self._save_manifest()
+
+    def drop_partition(self, partition: str):
+        """Remove a whole partition (e.g. when a room's events are deleted)."""
+        with self._lock:
+            index = self._get_partition(partition)
+            if index is not None:
+                index.reset()
+            self._partitions.pop(partition, None)
+            self._dirty.discard(partition)
+            if self._manifest.pop(partition, None) is not None:
+                self._save_manifest()
+
+    def compact(self):
+        """Rebuild every partition that holds deleted vectors."""
+        for key in self.partitions():
+            index = self._get_partition(key)
+            if index is not None:
+                index.compact()
+
+    def get_stats(self) -> dict:
+        """Get index statistics."""
+        tombstones = 0
+        stored = 0
+        for key in self.partitions():
+            index = self._get_partition(key)
+            if index is not None:
+                tombstones += index.tombstones()
+                stored += index.get_stats().get("count", 0)
+        return {
+            "count": self.count(),
+            "tombstones": tombstones,
+            "tombstone_ratio": tombstones / stored if stored else 0.0,
+            "partitions": len(self._manifest),
+            "loaded_partitions": len(self._partitions),
+            "dimension": self.dimension,
+        }
+
+    def close(self):
+        """Flush and close all loaded partitions."""
+        with self._lock:
+            for index in self._partitions.values():
+                index.close()
+            self._dirty.clear()
+            if self._manifest:
+                self._save_manifest()
@@ -1,11 +1,34 @@
-"""Lightweight metrics sink for internal telemetry."""
+"""Lightweight metrics sink for internal telemetry.
+
+Counters, gauges and log-bucketed histograms, with a ``timer`` helper that
+works as a context manager or (async) decorator. Series are spread over
+lock shards so hot paths in different components rarely contend, and the
+whole sink can be rendered in the OpenMetrics text format.
+"""
 
 from __future__ import annotations
 
+import functools
+import inspect
+import math
+import re
+import time
 from collections import defaultdict
 from dataclasses import dataclass
 from threading import Lock
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
+
+# Histogram bucket upper bounds (seconds): 0.5ms up to ~1.6h, growing by sqrt(2)
+HISTOGRAM_MIN = 0.0005
+HISTOGRAM_GROWTH = math.sqrt(2.0)
+HISTOGRAM_BUCKETS = 47
+BUCKET_BOUNDS: tuple[float, ...] = tuple(
+    HISTOGRAM_MIN * HISTOGRAM_GROWTH ** i for i in range(HISTOGRAM_BUCKETS)
+)
+_LOG_GROWTH = math.log(HISTOGRAM_GROWTH)
+
+DEFAULT_SHARDS = 16
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
 
 
 @dataclass(frozen=True)
@@ -14,29 +37,208 @@ class MetricKey:
     tags: tuple[tuple[str, str], ...] = ()
 
 
-class MetricsSink:
-    """In-memory metrics sink (counters + gauges)."""
+class Histogram:
+    """Log-bucketed distribution; quantiles are accurate to one bucket (~41%)."""
+
+    __slots__ = ("counts", "count", "sum", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (HISTOGRAM_BUCKETS + 1)  # last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    @staticmethod
+    def bucket_index(value: float) -> int:
+        if value <= HISTOGRAM_MIN:
+            return 0
+        index = math.ceil(math.log(value / HISTOGRAM_MIN) / _LOG_GROWTH - 1e-9)
+        return min(index, HISTOGRAM_BUCKETS)
+
+    def observe(self, value: float) -> None:
+        value = max(0.0, value)
+        self.counts[self.bucket_index(value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0..1), interpolating within the bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = BUCKET_BOUNDS[index - 1] if index > 0 else 0.0
+                upper = BUCKET_BOUNDS[index] if index < HISTOGRAM_BUCKETS else self.max
+                estimate = lower + (upper - lower) * ((rank - seen) / bucket_count)
+                return min(max(estimate, self.min), self.max)
+            seen += bucket_count
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "avg": self.sum / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class _Shard:
+    __slots__ = ("lock", "counters", "gauges", "histograms")
 
     def __init__(self) -> None:
-        self._lock = Lock()
-        self._counters: dict[MetricKey, int] = defaultdict(int)
-        self._gauges: dict[MetricKey, float] = {}
+        self.lock = Lock()
+        self.counters: dict[MetricKey, int] = defaultdict(int)
+        self.gauges: dict[MetricKey, float] = {}
+        self.histograms: dict[MetricKey, Histogram] = {}
+
+
+class Timer:
+    """
+    Records elapsed seconds into a histogram.
+
+    Use as ``with sink.timer("x"):`` or as a decorator on sync or async
+    functions (each call is timed independently).
+    """
+
+    def __init__(self, sink: "MetricsSink", name: str, tags: dict[str, Any] | None = None):
+        self.sink = sink
+        self.name = name
+        self.tags = tags
+        self._start = 0.0
+        self.elapsed = 0.0
+
+    def __enter__(self) -> "Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed = time.perf_counter() - self._start
+        self.sink.observe(self.name, self.elapsed, tags=self.tags)
+
+    def __call__(self, func: Callable) -> Callable:
+        sink, name, tags = self.sink, self.name, self.tags
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    sink.observe(name, time.perf_counter() - start, tags=tags)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                sink.observe(name, time.perf_counter() - start, tags=tags)
+        return wrapper
+
+
+class MetricsSink:
+    """In-memory metrics sink (counters, gauges, histograms), lock-sharded by series."""
+
+    def __init__(self, shards: int = DEFAULT_SHARDS) -> None:
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+
+    def _shard(self, key: MetricKey) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
 
     def incr(self, name: str, count: int = 1, tags: dict[str, Any] | None = None) -> None:
         key = MetricKey(name=name, tags=_normalize_tags(tags))
-        with self._lock:
-            self._counters[key] += count
+        shard = self._shard(key)
+        with shard.lock:
+            shard.counters[key] += count
 
     def set_gauge(self, name: str, value: float, tags: dict[str, Any] | None = None) -> None:
         key = MetricKey(name=name, tags=_normalize_tags(tags))
-        with self._lock:
-            self._gauges[key] = value
+        shard = self._shard(key)
+        with shard.lock:
+            shard.gauges[key] = value
+
+    def observe(self, name: str, value: float, tags: dict[str, Any] | None = None) -> None:
+        """Record a value (seconds, for durations) in a histogram."""
+        key = MetricKey(name=name, tags=_normalize_tags(tags))
+        shard = self._shard(key)
+        with shard.lock:
+            histogram = shard.histograms.get(key)
+            if histogram is None:
+                histogram = shard.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def timer(self, name: str, tags: dict[str, Any] | None = None) -> Timer:
+        """Time a block or function into the ``name`` histogram."""
+        return Timer(self, name, tags)
+
+    def _collect(self) -> tuple[dict[MetricKey, int], dict[MetricKey, float], dict[MetricKey, Histogram]]:
+        counters: dict[MetricKey, int] = {}
+        gauges: dict[MetricKey, float] = {}
+        histograms: dict[MetricKey, Histogram] = {}
+        for shard in self._shards:
+            with shard.lock:
+                counters.update(shard.counters)
+                gauges.update(shard.gauges)
+                for key, histogram in shard.histograms.items():
+                    copy = Histogram()
+                    copy.counts = list(histogram.counts)
+                    copy.count, copy.sum = histogram.count, histogram.sum
+                    copy.min, copy.max = histogram.min, histogram.max
+                    histograms[key] = copy
+        return counters, gauges, histograms
 
     def snapshot(self) -> dict[str, Any]:
-        with self._lock:
-            counters = {self._key_to_str(k): v for k, v in self._counters.items()}
-            gauges = {self._key_to_str(k): v for k, v in self._gauges.items()}
-        return {"counters": counters, "gauges": gauges}
+        counters, gauges, histograms = self._collect()
+        return {
+            "counters": {self._key_to_str(k): v for k, v in counters.items()},
+            "gauges": {self._key_to_str(k): v for k, v in gauges.items()},
+            "histograms": {self._key_to_str(k): h.summary() for k, h in histograms.items()},
+        }
+
+    def render_openmetrics(self) -> str:
+        """Render every series in the OpenMetrics text exposition format."""
+        counters, gauges, histograms = self._collect()
+        lines: list[str] = []
+
+        for name, series in _group_by_name(counters):
+            metric = _metric_name(name)
+            lines.append(f"# TYPE {metric} counter")
+            for tags, value in series:
+                lines.append(f"{metric}_total{_labels(tags)} {value}")
+
+        for name, series in _group_by_name(gauges):
+            metric = _metric_name(name)
+            lines.append(f"# TYPE {metric} gauge")
+            for tags, value in series:
+                lines.append(f"{metric}{_labels(tags)} {_format_value(value)}")
+
+        for name, series in _group_by_name(histograms):
+            metric = _metric_name(name)
+            lines.append(f"# TYPE {metric} histogram")
+            for tags, histogram in series:
+                cumulative = 0
+                for bound, bucket_count in zip(BUCKET_BOUNDS, histogram.counts):
+                    cumulative += bucket_count
+                    le = (("le", _format_value(bound)),)
+                    lines.append(f"{metric}_bucket{_labels(tags + le)} {cumulative}")
+                lines.append(f'{metric}_bucket{_labels(tags + (("le", "+Inf"),))} {histogram.count}')
+                lines.append(f"{metric}_count{_labels(tags)} {histogram.count}")
+                lines.append(f"{metric}_sum{_labels(tags)} {_format_value(histogram.sum)}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
 
     @staticmethod
     def _key_to_str(key: MetricKey) -> str:
@@ -57,9 +259,43 @@ def get_metrics() -> MetricsSink:
     return _metrics
 
 
+def timed(name: str, tags: dict[str, Any] | None = None) -> Callable[[Callable], Callable]:
+    """Decorator timing every call of a function into the global sink."""
+    def decorator(func: Callable) -> Callable:
+        return Timer(get_metrics(), name, tags)(func)
+    return decorator
+
+
 def _normalize_tags(tags: dict[str, Any] | None) -> tuple[tuple[str, str], ...]:
     if not tags:
         return ()
     items: Iterable[tuple[str, str]] = ((str(k), str(v)) for k, v in tags.items())
     return tuple(sorted(items))
 
+
+def _group_by_name(series: dict[MetricKey, Any]) -> list[tuple[str, list[tuple[tuple[tuple[str, str], ...], Any]]]]:
+    grouped: dict[str, list] = defaultdict(list)
+    for key, value in series.items():
+        grouped[key.name].append((key.tags, value))
+    return [(name, sorted(grouped[name], key=lambda item: item[0])) for name in sorted(grouped)]
+
+
+def _metric_name(name: str) -> str:
+    return "nanofolks_" + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _labels(tags: tuple[tuple[str, str], ...]) -> str:
+    if not tags:
+        return ""
+    parts = []
+    for key, value in tags:
+        label = re.sub(r"[^a-zA-Z0-9_]", "_", key)
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{label}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return f"{value:.1f}"
+    return repr(float(value))
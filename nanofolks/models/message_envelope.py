@@ -73,6 +73,27 @@ class MessageEnvelope:
         self.ensure_trace_id()
         self.ensure_priority()
 
+    def merge(self, other: "MessageEnvelope") -> None:
+        """Fold a later message from the same sender into this one (burst coalescing).
+
+        Content is appended on a new line and media is combined. Channel
+        metadata from the later message wins, so replies target the newest
+        message. The later trace id is kept in ``metadata["linked_trace_ids"]``.
+        """
+        if other.content:
+            self.content = f"{self.content}\n{other.content}" if self.content else other.content
+        self.media.extend(item for item in other.media if item not in self.media)
+
+        linked = list(self.metadata.get("linked_trace_ids", []))
+        if other.trace_id:
+            linked.append(other.trace_id)
+        linked.extend(other.metadata.get("linked_trace_ids", []))
+        count = self.metadata.get("coalesced_count", 1) + other.metadata.get("coalesced_count", 1)
+
+        self.metadata.update(other.metadata)
+        self.metadata["linked_trace_ids"] = linked
+        self.metadata["coalesced_count"] = count
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize envelope to a JSON-safe dict."""
         return {
@@ -9,9 +9,11 @@ import json_repair
 import litellm
 from litellm import acompletion
 
+from nanofolks.metrics import get_metrics
 from nanofolks.providers.base import LLMProvider, LLMResponse, StreamChunk, ToolCallRequest
 from nanofolks.providers.registry import find_by_model, find_gateway
 from nanofolks.security.secure_memory import SecureString
+from nanofolks.tracing import get_tracer
 
 
 class LiteLLMProvider(LLMProvider):
@@ -286,8 +288,13 @@ class LiteLLMProvider(LLMProvider):
         async def _op():
             return await asyncio.wait_for(acompletion(**kwargs), timeout=self.request_timeout_s)
 
-        response = await self._run_with_resilience(_op, "LLM chat")
-        return self._parse_response(response)
+        with get_tracer().span("llm.chat", attributes={"model": original_model}) as span:
+            with get_metrics().timer("llm.request.duration_seconds", tags={"model": original_model}):
+                response = await self._run_with_resilience(_op, "LLM chat")
+            result = self._parse_response(response)
+            for key, value in (result.usage or {}).items():
+                span.set_attribute(f"llm.usage.{key}", value)
+        return result
 
     async def stream_chat(
         self,
@@ -8,6 +8,8 @@ import json
 import logging
 from typing import Any, Optional
 
+from nanofolks.metrics import OPENMETRICS_CONTENT_TYPE, get_metrics
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,6 +85,7 @@ class DashboardHTTPServer:
         app.router.add_get('/api/health', self._handle_health)
         app.router.add_get('/api/bot/{bot_name}', self._handle_bot)
         app.router.add_get('/api/metrics', self._handle_metrics)
+        app.router.add_get('/metrics', self._handle_openmetrics)
         app.router.add_get('/ws/metrics', self._handle_websocket)
 
         # Static files (embedded CSS/JS)
@@ -128,6 +131,12 @@ class DashboardHTTPServer:
                     metrics = self.dashboard.get_metrics_history()
                     self.send_json_response(metrics)
 
+                elif path == '/metrics':
+                    self.send_response(200)
+                    self.send_header('Content-type', OPENMETRICS_CONTENT_TYPE)
+                    self.end_headers()
+                    self.wfile.write(get_metrics().render_openmetrics().encode())
+
                 else:
                     self.send_response(404)
                     self.send_header('Content-type', 'text/plain')
@@ -185,6 +194,13 @@ class DashboardHTTPServer:
         metrics = self.dashboard_service.get_metrics_history()
         return self.aiohttp.web.json_response(metrics)
 
+    async def _handle_openmetrics(self, request):
+        """Handle /metrics request (OpenMetrics text format for scrapers)."""
+        return self.aiohttp.web.Response(
+            body=get_metrics().render_openmetrics().encode(),
+            headers={'Content-Type': OPENMETRICS_CONTENT_TYPE},
+        )
+
     async def _handle_websocket(self, request):
         """Handle WebSocket connection for real-time metrics."""
         ws = self.aiohttp.web.WebSocketResponse()
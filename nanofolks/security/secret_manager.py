@@ -41,12 +41,15 @@ class SecretManager:
 
     def store_key(self, key: str, value: str) -> None:
         self._store.set(key, value)
+        _forget_config_keys()
 
     def get_key(self, key: str) -> Optional[str]:
         return self._store.get(key)
 
     def delete_key(self, key: str) -> bool:
-        return self._store.delete(key)
+        deleted = self._store.delete(key)
+        _forget_config_keys()
+        return deleted
 
     def list_keys(self) -> list[str]:
         return self._store.list_keys()
@@ -66,3 +69,9 @@ def get_secret_manager() -> SecretManager:
     if _default_secret_manager is None:
         _default_secret_manager = SecretManager()
     return _default_secret_manager
+
+
+def _forget_config_keys() -> None:
+    """Drop the config loader's memoized keyring lookups after a change."""
+    from nanofolks.config.loader import clear_keyring_cache
+    clear_keyring_cache()
@@ -1,15 +1,64 @@
-"""Session management for conversation history."""
+"""Session management for conversation history.
+
+Sessions are persisted as append-only JSONL logs: each save appends only
+the messages added since the previous save, and session metadata lives in
+a small side record. The log is rewritten in full only when the message
+list was replaced or truncated (e.g. by SessionCompactor), so per-turn
+persistence cost does not depend on history length.
+"""
 
 import json
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
 from nanofolks.utils.helpers import ensure_dir, safe_filename, strip_base64_images
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+if TYPE_CHECKING:
+    from nanofolks.memory.token_counter import TokenCounter
+
+
+@contextmanager
+def _log_lock(lock_path: Path):
+    """
+    Hold an exclusive lock on a session's lock file.
+
+    The lock lives in a side file rather than on the log itself, because a
+    rewrite replaces the log: an appender blocked on the old file would
+    otherwise wake up holding an unlinked inode. Uses flock on POSIX, msvcrt
+    byte locking on Windows, and no lock where neither is available.
+    """
+    with open(lock_path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
 
 @dataclass
 class Session:
@@ -25,6 +74,33 @@ class Session:
     updated_at: datetime = field(default_factory=datetime.now)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    # Persistence bookkeeping (see SessionManager.save): the message list that
+    # was last persisted, how many of its messages are on disk, and the last
+    # of them, used to tell appends apart from rewrites.
+    _persisted_list: list[dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _persisted_count: int = field(default=0, init=False, repr=False, compare=False)
+    _persisted_tail: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _persisted_meta: str | None = field(default=None, init=False, repr=False, compare=False)
+    # Which instance of this key the manager handed out (see SessionManager.save)
+    _generation: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Token accounting (see token_count): per-message counts for the message
+    # list they were taken from, its last counted message, the running total
+    # and the encoding they were counted with.
+    _token_list: list[dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _token_counts: list[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _token_tail: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _token_total: int = field(default=0, init=False, repr=False, compare=False)
+    _token_encoding: str | None = field(default=None, init=False, repr=False, compare=False)
+
     def add_message(self, role: str, content: str, **kwargs: Any) -> None:
         """Add a message to the session."""
         if role == "user":
@@ -33,6 +109,47 @@ class Session:
         self.messages.append(msg)
         self.updated_at = datetime.now()
 
+    def token_count(self, counter: "TokenCounter | None" = None) -> int:
+        """
+        Total tokens in the session's messages, maintained incrementally.
+
+        Messages appended since the last call are counted and added to a
+        running total. If the message list was replaced or truncated (e.g.
+        by SessionCompactor) or the encoding changed, every message is
+        recounted in one batch; the counter's per-message memo makes that
+        cheap for messages it has already seen.
+
+        Args:
+            counter: Token counter to use (defaults to the global one).
+
+        Returns:
+            Total token count.
+        """
+        if counter is None:
+            from nanofolks.memory.token_counter import get_token_counter
+
+            counter = get_token_counter()
+
+        messages = self.messages
+        counted = len(self._token_counts)
+        if (
+            messages is not self._token_list
+            or counter.encoding_name != self._token_encoding
+            or len(messages) < counted
+            or (counted and messages[counted - 1] is not self._token_tail)
+        ):
+            self._token_counts = counter.count_message_list(messages)
+            self._token_total = sum(self._token_counts)
+        elif len(messages) > counted:
+            new_counts = counter.count_message_list(messages[counted:])
+            self._token_counts.extend(new_counts)
+            self._token_total += sum(new_counts)
+
+        self._token_list = messages
+        self._token_encoding = counter.encoding_name
+        self._token_tail = messages[-1] if messages else None
+        return self._token_total
+
     def get_history(
         self, max_messages: int = 50, preserve_tool_chains: bool = True
     ) -> list[dict[str, Any]]:
@@ -212,19 +329,45 @@ class SessionManager:
     """
     Manages conversation sessions.
 
-    Sessions are stored as JSONL files in the sessions directory.
+    Sessions are stored as append-only JSONL logs in the sessions directory,
+    with metadata in a ``.meta.json`` side record. Loaded sessions are kept
+    in an LRU cache bounded by session count and total message count;
+    evicted sessions are written back before they are dropped.
+
+    Each instance handed out for a key gets a generation number. A caller
+    may keep using an evicted session as long as no newer copy of it has
+    been loaded; once one has, saves from the stale copy are rejected so
+    two instances never append to the same log from different offsets.
     """
 
-    def __init__(self, workspace: Path):
+    def __init__(
+        self,
+        workspace: Path,
+        max_cached_sessions: int = 256,
+        max_cached_messages: int = 50000,
+    ):
         self.workspace = workspace
         self.sessions_dir = ensure_dir(Path.home() / ".nanofolks" / "sessions")
-        self._cache: dict[str, Session] = {}
+        self.max_cached_sessions = max(1, max_cached_sessions)
+        self.max_cached_messages = max_cached_messages
+        self._cache: OrderedDict[str, Session] = OrderedDict()
+        self._generations: dict[str, int] = {}
 
     def _get_session_path(self, key: str) -> Path:
         """Get the file path for a session."""
         safe_key = safe_filename(key.replace(":", "_"))
         return self.sessions_dir / f"{safe_key}.jsonl"
 
+    @staticmethod
+    def _meta_path(path: Path) -> Path:
+        """Side record holding a session's metadata."""
+        return path.with_suffix(".meta.json")
+
+    @staticmethod
+    def _lock_path(path: Path) -> Path:
+        """Side file locked while a session's log is appended or rewritten."""
+        return path.with_suffix(".lock")
+
     def get_or_create(self, key: str) -> Session:
         """
         Get an existing session or create a new one.
@@ -236,21 +379,52 @@ class SessionManager:
             The session.
         """
         # Check cache
-        if key in self._cache:
-            return self._cache[key]
+        session = self._cache.get(key)
+        if session is not None:
+            self._cache.move_to_end(key)
+            return session
 
         # Try to load from disk
         session = self._load(key)
         if session is None:
             session = Session(key=key)
 
-        self._cache[key] = session
+        self._adopt(session)
+        self._remember(session)
         return session
 
+    def _adopt(self, session: Session) -> None:
+        """Make a session the current instance for its key."""
+        session._generation = self._generations.get(session.key, 0) + 1
+        self._generations[session.key] = session._generation
+
+    def _remember(self, session: Session) -> None:
+        """Put a session in the cache as most recently used, evicting as needed."""
+        self._cache[session.key] = session
+        self._cache.move_to_end(session.key)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Write back and drop least recently used sessions over the bounds."""
+        total_messages = sum(len(cached.messages) for cached in self._cache.values())
+        while len(self._cache) > 1 and (
+            len(self._cache) > self.max_cached_sessions
+            or total_messages > self.max_cached_messages
+        ):
+            key, evicted = self._cache.popitem(last=False)
+            total_messages -= len(evicted.messages)
+            try:
+                self._persist(evicted)
+            except Exception as e:
+                logger.warning(f"Failed to write back evicted session {key}: {e}")
+            logger.debug(f"Evicted session {key} from cache")
+
     def _load(self, key: str) -> Session | None:
         """Load a session from disk."""
-        path = self._get_session_path(key)
+        return self._load_path(key, self._get_session_path(key))
 
+    def _load_path(self, key: str, path: Path) -> Session | None:
+        """Load a session from its log and side record."""
         if not path.exists():
             return None
 
@@ -258,54 +432,166 @@ class SessionManager:
             messages = []
             metadata = {}
             created_at = None
+            updated_at = None
+            torn = False
 
             with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
+                lines = f.readlines()
 
-                    data = json.loads(line)
+            for number, line in enumerate(lines):
+                line = line.strip()
+                if not line:
+                    continue
 
-                    if data.get("_type") == "metadata":
-                        metadata = data.get("metadata", {})
-                        created_at = (
-                            datetime.fromisoformat(data["created_at"])
-                            if data.get("created_at")
-                            else None
-                        )
-                    else:
-                        messages.append(data)
-
-            return Session(
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    if number == len(lines) - 1:
+                        # Append cut short by a crash; drop it and repair below
+                        torn = True
+                        continue
+                    raise
+
+                if data.get("_type") == "metadata":
+                    metadata = data.get("metadata", {})
+                    created_at = (
+                        datetime.fromisoformat(data["created_at"])
+                        if data.get("created_at")
+                        else None
+                    )
+                    updated_at = (
+                        datetime.fromisoformat(data["updated_at"])
+                        if data.get("updated_at")
+                        else None
+                    )
+                else:
+                    messages.append(data)
+
+            meta_path = self._meta_path(path)
+            if meta_path.exists():
+                record = json.loads(meta_path.read_text())
+                metadata = record.get("metadata", metadata)
+                if record.get("created_at"):
+                    created_at = datetime.fromisoformat(record["created_at"])
+                if record.get("updated_at"):
+                    updated_at = datetime.fromisoformat(record["updated_at"])
+
+            session = Session(
                 key=key,
                 messages=messages,
                 created_at=created_at or datetime.now(),
+                updated_at=updated_at or datetime.now(),
                 metadata=metadata,
             )
+            if torn:
+                logger.warning(f"Dropped torn trailing record in session {key}")
+                self._rewrite(session, path)
+            else:
+                self._mark_persisted(session, len(messages))
+            return session
         except Exception as e:
             logger.warning(f"Failed to load session {key}: {e}")
             return None
 
     def save(self, session: Session) -> None:
-        """Save a session to disk."""
-        path = self._get_session_path(session.key)
-
-        with open(path, "w") as f:
-            # Write metadata first
-            metadata_line = {
-                "_type": "metadata",
-                "created_at": session.created_at.isoformat(),
-                "updated_at": session.updated_at.isoformat(),
-                "metadata": session.metadata,
-            }
-            f.write(json.dumps(metadata_line) + "\n")
+        """
+        Save a session to disk.
 
-            # Write messages
-            for msg in session.messages:
-                f.write(json.dumps(msg) + "\n")
+        Appends only the messages added since the last save. The log is
+        rewritten (compacted) when the message list was replaced or
+        truncated since then, e.g. by session compaction or ``clear()``.
 
-        self._cache[session.key] = session
+        Saving a stale copy, i.e. one evicted from the cache after which the
+        session was loaded again, is rejected with a warning.
+        """
+        current = self._generations.get(session.key)
+        if session._generation != current:
+            if session._generation or current is not None:
+                logger.warning(
+                    f"Ignoring save of stale session {session.key}; "
+                    "a newer copy has been loaded"
+                )
+                return
+            # Built outside the manager and never handed out: take it over
+            self._adopt(session)
+        self._persist(session)
+        self._remember(session)
+
+    def _persist(self, session: Session) -> None:
+        path = self._get_session_path(session.key)
+        messages = session.messages
+        count = session._persisted_count
+
+        appendable = (
+            messages is session._persisted_list
+            and len(messages) >= count
+            and (count == 0 or messages[count - 1] is session._persisted_tail)
+            and path.exists()
+        )
+        if not appendable:
+            self._rewrite(session, path)
+            return
+
+        new_messages = messages[count:]
+        if new_messages:
+            payload = "".join(json.dumps(msg) + "\n" for msg in new_messages)
+            with _log_lock(self._lock_path(path)), open(path, "a") as f:
+                f.write(payload)
+                f.flush()
+            self._mark_persisted(session, len(messages))
+
+        self._write_meta(session, path)
+
+    def _rewrite(self, session: Session, path: Path) -> None:
+        """Atomically replace the log with the session's current messages."""
+        metadata_line = {
+            "_type": "metadata",
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "metadata": session.metadata,
+        }
+        tmp_path = path.with_suffix(".jsonl.tmp")
+        # Under the append lock, so no appender writes into the replaced file
+        with _log_lock(self._lock_path(path)):
+            with open(tmp_path, "w") as f:
+                # Metadata first, so the log alone is a complete snapshot
+                f.write(json.dumps(metadata_line) + "\n")
+                for msg in session.messages:
+                    f.write(json.dumps(msg) + "\n")
+            os.replace(tmp_path, path)
+
+        self._mark_persisted(session, len(session.messages))
+        self._write_meta(session, path)
+        logger.debug(f"Compacted session log {session.key} ({len(session.messages)} messages)")
+
+    def _write_meta(self, session: Session, path: Path) -> None:
+        """Write the metadata side record if it changed."""
+        record = json.dumps({
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "metadata": session.metadata,
+        })
+        if record == session._persisted_meta:
+            return
+        meta_path = self._meta_path(path)
+        tmp_path = meta_path.with_suffix(".tmp")
+        tmp_path.write_text(record)
+        os.replace(tmp_path, meta_path)
+        session._persisted_meta = record
+
+    @staticmethod
+    def _mark_persisted(session: Session, count: int) -> None:
+        session._persisted_list = session.messages
+        session._persisted_count = count
+        session._persisted_tail = session.messages[count - 1] if count else None
+
+    def flush(self) -> None:
+        """Write back every cached session (e.g. on shutdown)."""
+        for key, session in list(self._cache.items()):
+            try:
+                self._persist(session)
+            except Exception as e:
+                logger.warning(f"Failed to flush session {key}: {e}")
 
     def delete(self, key: str) -> bool:
         """
@@ -317,16 +603,33 @@ class SessionManager:
         Returns:
             True if deleted, False if not found.
         """
-        # Remove from cache
+        # Remove from cache; copies still held elsewhere become stale
         self._cache.pop(key, None)
+        if key in self._generations:
+            self._generations[key] += 1
 
-        # Remove file
+        # Remove files
         path = self._get_session_path(key)
+        self._meta_path(path).unlink(missing_ok=True)
+        self._lock_path(path).unlink(missing_ok=True)
         if path.exists():
             path.unlink()
             return True
         return False
 
+    def _read_session_info(self, path: Path) -> dict[str, Any] | None:
+        """Read a session's metadata from its side record or log header."""
+        meta_path = self._meta_path(path)
+        if meta_path.exists():
+            return json.loads(meta_path.read_text())
+        with open(path) as f:
+            first_line = f.readline().strip()
+        if first_line:
+            data = json.loads(first_line)
+            if data.get("_type") == "metadata":
+                return data
+        return None
+
     def list_sessions(self) -> list[dict[str, Any]]:
         """
         List all sessions.
@@ -338,20 +641,16 @@ class SessionManager:
 
         for path in self.sessions_dir.glob("*.jsonl"):
             try:
-                # Read just the metadata line
-                with open(path) as f:
-                    first_line = f.readline().strip()
-                    if first_line:
-                        data = json.loads(first_line)
-                        if data.get("_type") == "metadata":
-                            sessions.append(
-                                {
-                                    "key": path.stem.replace("_", ":"),
-                                    "created_at": data.get("created_at"),
-                                    "updated_at": data.get("updated_at"),
-                                    "path": str(path),
-                                }
-                            )
+                data = self._read_session_info(path)
+                if data:
+                    sessions.append(
+                        {
+                            "key": path.stem.replace("_", ":"),
+                            "created_at": data.get("created_at"),
+                            "updated_at": data.get("updated_at"),
+                            "path": str(path),
+                        }
+                    )
             except Exception:
                 continue
 
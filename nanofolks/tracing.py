@@ -0,0 +1,360 @@
+"""Lightweight span tracing keyed on MessageEnvelope.trace_id.
+
+Spans are tracked in a ``contextvars`` variable, so nesting follows the
+call stack and is inherited by asyncio tasks spawned inside a span. A span
+started with an explicit ``trace_id`` (a message's trace id) opens or
+joins that trace; a span started without one is recorded only when it
+runs inside an existing trace, so code shared with background jobs does
+not produce orphan traces.
+
+Finished spans are exported in OTLP/JSON form (one
+``ExportTraceServiceRequest`` per line, as written by the OpenTelemetry
+collector's file exporter) to ``<data dir>/traces/spans.jsonl``, which
+``load_traces``/``slowest_traces`` read back for the CLI.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from loguru import logger
+
+SERVICE_NAME = "nanofolks"
+DEFAULT_MAX_FILE_BYTES = 50 * 1024 * 1024
+EXPORT_BATCH_SIZE = 64
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("nanofolks_current_span", default=None)
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        self.error = message
+
+    @property
+    def duration_ms(self) -> float:
+        return max(self.end_ns - self.start_ns, 0) / 1e6
+
+    def to_otlp(self) -> dict[str, Any]:
+        """OTLP/JSON span representation."""
+        span: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class _NoopSpan:
+    """Stand-in yielded when nothing is recorded."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, message: str) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class FileSpanExporter:
+    """Buffers finished spans and appends them to a JSONL file in batches."""
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_FILE_BYTES, batch_size: int = EXPORT_BATCH_SIZE):
+        """
+        Args:
+            path: Span file (rotated to ``<path>.1`` past ``max_bytes``)
+            max_bytes: Rotation threshold
+            batch_size: Spans buffered before a write (a finished root span also flushes)
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self._buffer: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._buffer.append(span)
+            if span.parent_id is None or len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        spans, self._buffer = self._buffer, []
+        request = {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", SERVICE_NAME)]},
+                "scopeSpans": [{
+                    "scope": {"name": SERVICE_NAME},
+                    "spans": [span.to_otlp() for span in spans],
+                }],
+            }]
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists() and self.path.stat().st_size > self.max_bytes:
+                os.replace(self.path, self.path.with_name(self.path.name + ".1"))
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(request, default=str) + "\n")
+        except OSError as e:
+            logger.warning(f"Failed to export {len(spans)} spans: {e}")
+
+
+class Tracer:
+    """Creates spans and hands finished ones to the exporter."""
+
+    def __init__(self, exporter: Optional[FileSpanExporter] = None, enabled: bool = True):
+        self.exporter = exporter
+        self.enabled = enabled and exporter is not None
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        trace_id: Optional[str] = None,
+        attributes: Optional[dict[str, Any]] = None,
+        start_ns: Optional[int] = None,
+    ) -> Iterator[Span | _NoopSpan]:
+        """
+        Time a block as a span.
+
+        Args:
+            name: Span name
+            trace_id: Trace to record in; defaults to the current span's trace
+            attributes: Initial span attributes
+            start_ns: Start time (epoch ns) if the operation began earlier
+
+        Yields:
+            The span (a no-op stand-in when not recording)
+        """
+        parent = _current_span.get()
+        if not self.enabled or (trace_id is None and parent is None):
+            yield _NOOP_SPAN
+            return
+        if trace_id is None:
+            trace_id = parent.trace_id
+        elif parent is not None and parent.trace_id != trace_id:
+            parent = None
+
+        span = Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_ns=start_ns or time.time_ns(),
+            attributes=dict(attributes or {}),
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(token)
+            self.exporter.export(span)
+
+    def record(
+        self,
+        name: str,
+        start_ns: int,
+        end_ns: int,
+        attributes: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Record an already-finished operation as a child of the current span."""
+        parent = _current_span.get()
+        if not self.enabled or parent is None:
+            return
+        self.exporter.export(Span(
+            name=name,
+            trace_id=parent.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id,
+            start_ns=start_ns,
+            end_ns=end_ns,
+            attributes=dict(attributes or {}),
+        ))
+
+    def flush(self) -> None:
+        if self.exporter is not None:
+            self.exporter.flush()
+
+
+def current_span() -> Optional[Span]:
+    """The span active in this context, if any."""
+    return _current_span.get()
+
+
+_tracer: Tracer | None = None
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer (exporting to the data dir unless configured otherwise)."""
+    global _tracer
+    if _tracer is None:
+        configure_tracing()
+    return _tracer
+
+
+def configure_tracing(enabled: bool = True, max_file_bytes: int = DEFAULT_MAX_FILE_BYTES) -> Tracer:
+    """(Re)create the global tracer."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.flush()
+    _tracer = Tracer(FileSpanExporter(get_trace_path(), max_bytes=max_file_bytes), enabled=enabled)
+    return _tracer
+
+
+def get_trace_path() -> Path:
+    from nanofolks.config.loader import get_data_dir
+    return get_data_dir() / "traces" / "spans.jsonl"
+
+
+def traced(
+    name: str,
+    trace_id_from: Optional[Callable[..., Optional[str]]] = None,
+) -> Callable[[Callable], Callable]:
+    """
+    Decorator recording each call of a (sync or async) function as a span.
+
+    Args:
+        name: Span name
+        trace_id_from: Optional callable receiving the function's arguments
+            and returning the trace id to record in
+    """
+    def decorator(func: Callable) -> Callable:
+        def trace_id(args, kwargs) -> Optional[str]:
+            if trace_id_from is None:
+                return None
+            try:
+                return trace_id_from(*args, **kwargs)
+            except Exception:
+                return None
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with get_tracer().span(name, trace_id=trace_id(args, kwargs)):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(name, trace_id=trace_id(args, kwargs)):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ============================================================================
+# Reading exported traces
+# ============================================================================
+
+def load_traces(path: Optional[Path] = None) -> dict[str, list[dict[str, Any]]]:
+    """
+    Read exported spans grouped by trace id (rotated file included).
+
+    Returns:
+        Dict mapping trace id to its OTLP/JSON spans
+    """
+    path = Path(path) if path else get_trace_path()
+    traces: dict[str, list[dict[str, Any]]] = {}
+    for file_path in (path.with_name(path.name + ".1"), path):
+        if not file_path.exists():
+            continue
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                for resource_spans in request.get("resourceSpans", []):
+                    for scope_spans in resource_spans.get("scopeSpans", []):
+                        for span in scope_spans.get("spans", []):
+                            traces.setdefault(span.get("traceId", ""), []).append(span)
+    return traces
+
+
+def summarize_trace(spans: list[dict[str, Any]]) -> dict[str, Any]:
+    """Duration, root span and per-name time breakdown of one trace."""
+    start = min(int(span["startTimeUnixNano"]) for span in spans)
+    end = max(int(span["endTimeUnixNano"]) for span in spans)
+    roots = [span for span in spans if not span.get("parentSpanId")]
+    root = min(roots or spans, key=lambda span: int(span["startTimeUnixNano"]))
+    breakdown: dict[str, float] = {}
+    for span in spans:
+        if span is root:
+            continue
+        duration = (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e6
+        breakdown[span["name"]] = breakdown.get(span["name"], 0.0) + duration
+    return {
+        "trace_id": root.get("traceId", ""),
+        "root": root.get("name", ""),
+        "start_ns": start,
+        "duration_ms": (end - start) / 1e6,
+        "spans": len(spans),
+        "errors": sum(1 for span in spans if span.get("status", {}).get("code") == 2),
+        "breakdown_ms": breakdown,
+    }
+
+
+def slowest_traces(limit: int = 10, path: Optional[Path] = None) -> list[dict[str, Any]]:
+    """Summaries of the slowest exported traces, slowest first."""
+    summaries = [summarize_trace(spans) for spans in load_traces(path).values() if spans]
+    summaries.sort(key=lambda summary: summary["duration_ms"], reverse=True)
+    return summaries[:limit]
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        wrapped = {"boolValue": value}
+    elif isinstance(value, int):
+        wrapped = {"intValue": str(value)}
+    elif isinstance(value, float):
+        wrapped = {"doubleValue": value}
+    else:
+        wrapped = {"stringValue": str(value)}
+    return {"key": key, "value": wrapped}
+
+
+atexit.register(lambda: _tracer.flush() if _tracer is not None else None)
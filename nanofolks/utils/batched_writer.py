@@ -0,0 +1,177 @@
+"""Background batched writer for append-heavy SQLite databases.
+
+Stores such as the work log and routing stats write several times per
+agent turn. Instead of opening a connection and committing per row on the
+event loop, callers enqueue write operations and a single writer thread
+applies them over one long-lived WAL connection, committing each drained
+batch in one transaction.
+"""
+
+import atexit
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+from loguru import logger
+
+WriteOp = Callable[[sqlite3.Connection], None]
+
+OVERFLOW_POLICIES = ("block", "drop")
+
+
+class _Flush:
+    """Queue marker: set once every earlier operation is committed."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class BatchedSQLiteWriter:
+    """Applies queued write operations to SQLite from a background thread."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_queue_size: int = 10000,
+        batch_size: int = 256,
+        overflow: str = "block",
+        name: str = "sqlite",
+    ):
+        """Initialize and start the writer thread.
+
+        Args:
+            db_path: SQLite database file
+            max_queue_size: Pending operations before the overflow policy applies
+            batch_size: Maximum operations committed per transaction
+            overflow: "block" to wait for room in the queue, "drop" to discard
+            name: What is being written, for the thread name and log messages
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.overflow = overflow
+        self.name = name
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_queue_size))
+        self._closed = False
+
+        self.written = 0
+        self.failed = 0
+        self.dropped = 0
+        self.batches = 0
+
+        self._thread = threading.Thread(target=self._run, name=f"{name.replace(' ', '-')}-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, op: WriteOp) -> bool:
+        """Queue a write operation.
+
+        Args:
+            op: Callable run with the writer's connection inside a transaction
+
+        Returns:
+            False if the operation was dropped (queue full or writer closed)
+        """
+        if self._closed:
+            self.dropped += 1
+            return False
+        if self.overflow == "block":
+            self._queue.put(op)
+            return True
+        try:
+            self._queue.put_nowait(op)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(f"{self.name.capitalize()} queue full, dropped {self.dropped} writes so far")
+            return False
+        return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until everything queued so far is committed.
+
+        Returns:
+            False if the timeout expired first
+        """
+        if self._closed or not self._thread.is_alive():
+            return True
+        marker = _Flush()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Commit pending writes and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self) -> None:
+        conn = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not enable WAL for {self.name}: {e}")
+
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                ops = [item for item in batch if callable(item)]
+                if ops:
+                    self._commit(conn, ops)
+                for item in batch:
+                    if isinstance(item, _Flush):
+                        item.done.set()
+                if any(item is _STOP for item in batch):
+                    return
+        finally:
+            conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, ops: list[WriteOp]) -> None:
+        """Apply a batch in one transaction; on failure, retry ops one by one."""
+        try:
+            with conn:
+                for op in ops:
+                    op(conn)
+            self.written += len(ops)
+            self.batches += 1
+            return
+        except Exception as e:
+            logger.debug(f"{self.name.capitalize()} batch of {len(ops)} failed ({e}), retrying individually")
+
+        for op in ops:
+            try:
+                with conn:
+                    op(conn)
+                self.written += 1
+            except Exception as e:
+                self.failed += 1
+                logger.warning(f"Failed to write {self.name} entry: {e}")
+
+    def get_stats(self) -> dict:
+        return {
+            "pending": self.pending,
+            "written": self.written,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "batches": self.batches,
+        }
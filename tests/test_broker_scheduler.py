@@ -0,0 +1,197 @@
+"""Tests for the room broker worker pool (FairScheduler)."""
+
+import asyncio
+
+import pytest
+
+from nanofolks.broker.room_broker import RoomBrokerManager, RoomMessageBroker
+from nanofolks.broker.scheduler import FairScheduler
+from nanofolks.models.message_envelope import BOT_PRIORITY, MessageEnvelope
+
+
+class GatedAgentLoop:
+    """Agent loop stand-in that records turns and blocks until released."""
+
+    def __init__(self, gated: bool = False):
+        self.started: list[tuple[str, str]] = []
+        self.finished: list[tuple[str, str]] = []
+        self.active: dict[str, int] = {}
+        self.max_active: dict[str, int] = {}
+        self.gate = asyncio.Event()
+        if not gated:
+            self.gate.set()
+
+    async def process_inbound(self, message):
+        room = message.room_id
+        self.started.append((room, message.content))
+        self.active[room] = self.active.get(room, 0) + 1
+        self.max_active[room] = max(self.max_active.get(room, 0), self.active[room])
+        await asyncio.sleep(0)
+        await self.gate.wait()
+        self.active[room] -= 1
+        self.finished.append((room, message.content))
+
+
+def _message(room_id, content, priority=None, sender_id=None):
+    message = MessageEnvelope(channel="cli", chat_id=room_id, content=content, sender_id=sender_id)
+    if priority is not None:
+        message.priority = priority
+    message.room_id = room_id
+    return message
+
+
+async def _until(condition, timeout=2.0):
+    """Wait for a condition to become true."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not reached")
+        await asyncio.sleep(0.005)
+
+
+async def _broker(tmp_path, room_id, scheduler, agent_loop):
+    broker = RoomMessageBroker(room_id, queue_dir=tmp_path, scheduler=scheduler)
+    broker.set_agent_loop(agent_loop)
+    await broker.start()
+    return broker
+
+
+class TestFairScheduler:
+    """Test FairScheduler dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_one_message_in_flight_per_room(self, tmp_path):
+        """Test a room never runs two turns at once and keeps its order."""
+        scheduler = FairScheduler(max_workers=4)
+        loop = GatedAgentLoop()
+        broker = await _broker(tmp_path, "a", scheduler, loop)
+        for n in range(6):
+            await broker.enqueue(_message("a", f"a{n}"))
+
+        scheduler.start()
+        await _until(lambda: len(loop.finished) == 6)
+        await scheduler.stop()
+        await broker.stop()
+
+        assert loop.max_active["a"] == 1
+        assert [content for _, content in loop.finished] == [f"a{n}" for n in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_rooms_run_in_parallel(self, tmp_path):
+        """Test different rooms occupy different workers."""
+        scheduler = FairScheduler(max_workers=3)
+        loop = GatedAgentLoop(gated=True)
+        brokers = [await _broker(tmp_path, room, scheduler, loop) for room in "abc"]
+        for broker in brokers:
+            await broker.enqueue(_message(broker.room_id, "hi"))
+
+        scheduler.start()
+        await _until(lambda: len(loop.started) == 3)
+        assert all(scheduler.is_busy(room) for room in "abc")
+
+        loop.gate.set()
+        await _until(lambda: len(loop.finished) == 3)
+        await scheduler.stop()
+        for broker in brokers:
+            await broker.stop()
+
+    @pytest.mark.asyncio
+    async def test_lane_cap(self, tmp_path):
+        """Test a capped lane never holds more workers than its limit."""
+        scheduler = FairScheduler(max_workers=4, lane_limits={"bot": 1})
+        loop = GatedAgentLoop(gated=True)
+        bot_rooms = [await _broker(tmp_path, room, scheduler, loop) for room in "abc"]
+        for broker in bot_rooms:
+            await broker.enqueue(_message(broker.room_id, "bot", priority=BOT_PRIORITY))
+        user_room = await _broker(tmp_path, "u", scheduler, loop)
+        await user_room.enqueue(_message("u", "user"))
+
+        scheduler.start()
+        await _until(lambda: len(loop.started) == 2)
+        await asyncio.sleep(0.02)
+        assert scheduler.get_stats()["in_flight"] == {"system": 0, "bot": 1, "user": 1}
+        assert sorted(content for _, content in loop.started) == ["bot", "user"]
+
+        loop.gate.set()
+        await _until(lambda: len(loop.finished) == 4)
+        await scheduler.stop()
+        for broker in bot_rooms + [user_room]:
+            await broker.stop()
+
+    @pytest.mark.asyncio
+    async def test_drr_alternates_busy_and_quiet_rooms(self, tmp_path):
+        """Test a quiet room gets turns between a busy room's messages."""
+        scheduler = FairScheduler(max_workers=1)
+        loop = GatedAgentLoop()
+        busy = await _broker(tmp_path, "busy", scheduler, loop)
+        quiet = await _broker(tmp_path, "quiet", scheduler, loop)
+        for n in range(5):
+            await busy.enqueue(_message("busy", f"b{n}"))
+        for n in range(2):
+            await quiet.enqueue(_message("quiet", f"q{n}"))
+
+        scheduler.start()
+        await _until(lambda: len(loop.finished) == 7)
+        await scheduler.stop()
+        await busy.stop()
+        await quiet.stop()
+
+        order = [content for _, content in loop.finished]
+        assert order == ["b0", "q0", "b1", "q1", "b2", "b3", "b4"]
+
+    @pytest.mark.asyncio
+    async def test_drr_weight(self, tmp_path):
+        """Test a room's weight sets its consecutive turns per round."""
+        scheduler = FairScheduler(max_workers=1)
+        scheduler.set_weight("busy", 2)
+        loop = GatedAgentLoop()
+        busy = await _broker(tmp_path, "busy", scheduler, loop)
+        quiet = await _broker(tmp_path, "quiet", scheduler, loop)
+        for n in range(4):
+            await busy.enqueue(_message("busy", f"b{n}"))
+        for n in range(2):
+            await quiet.enqueue(_message("quiet", f"q{n}"))
+
+        scheduler.start()
+        await _until(lambda: len(loop.finished) == 6)
+        await scheduler.stop()
+        await busy.stop()
+        await quiet.stop()
+
+        order = [content for _, content in loop.finished]
+        assert order == ["b0", "b1", "q0", "b2", "b3", "q1"]
+
+
+class TestIdleEviction:
+    """Test RoomBrokerManager.evict_idle."""
+
+    @pytest.mark.asyncio
+    async def test_evict_idle_skips_held_and_in_flight_rooms(self, tmp_path):
+        """Test only rooms with nothing held, queued or running are evicted."""
+        manager = RoomBrokerManager(
+            agent_loop_factory=lambda: GatedAgentLoop(gated=True),
+            queue_dir=tmp_path,
+            idle_timeout=0,
+            coalesce_window_ms=60_000,
+        )
+
+        # Idle: its only turn has finished
+        await manager.route_message(_message("idle", "done"))
+        manager.get_broker("idle").agent_loop.gate.set()
+        await _until(lambda: manager.get_broker("idle").messages_processed == 1)
+
+        # In flight: the turn is still running
+        await manager.route_message(_message("busy", "working"))
+        await _until(lambda: manager.scheduler.is_busy("busy"))
+
+        # Held: a user message waiting in the coalescing window
+        await manager.route_message(_message("held", "wait", sender_id="user-1"))
+        assert manager.get_broker("held").queue_depth == 1
+
+        assert await manager.evict_idle() == 1
+        assert manager.get_broker("idle") is None
+        assert manager.get_broker("busy") is not None
+        assert manager.get_broker("held") is not None
+
+        manager.get_broker("busy").agent_loop.gate.set()
+        await manager.stop_all()
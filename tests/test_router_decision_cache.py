@@ -0,0 +1,54 @@
+"""Tests for the router decision cache (RouterDecisionCache)."""
+
+import pytest
+
+from nanofolks.agent.router.decision_cache import RouterDecisionCache
+from nanofolks.agent.router.models import RoutingDecision, RoutingTier
+
+
+class CountingEmbedder:
+    """Embedding provider stand-in that counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed(self, text):
+        self.calls += 1
+        return [1.0, 0.0] if "tests" in text else [0.0, 1.0]
+
+
+def _decision():
+    return RoutingDecision(
+        tier=RoutingTier.CODING, model="m", confidence=0.9, layer="llm",
+        reasoning="", estimated_tokens=100, needs_tools=True,
+    )
+
+
+class TestRouterDecisionCache:
+    """Test RouterDecisionCache lookups."""
+
+    @pytest.mark.asyncio
+    async def test_exact_hit(self):
+        """Test a repeated message hits the exact tier."""
+        cache = RouterDecisionCache()
+        await cache.put("Run the tests", None, _decision())
+
+        cached = await cache.get("run  the tests ")
+        assert cached.tier == RoutingTier.CODING
+        assert cached.metadata["cache"] == "exact"
+
+    @pytest.mark.asyncio
+    async def test_miss_embedding_is_reused_by_put(self):
+        """Test a miss followed by put embeds the message only once."""
+        embedder = CountingEmbedder()
+        cache = RouterDecisionCache(embedding_provider=embedder)
+
+        cached, embedding = await cache.lookup("run the tests", None)
+        assert cached is None
+        await cache.put("run the tests", None, _decision(), embedding=embedding)
+        assert embedder.calls == 1
+
+        cached = await cache.get("please run the tests again")
+        assert cached.metadata["cache"] == "semantic"
+        assert await cache.get("write a poem") is None
+        assert cache.stats()["semantic_hits"] == 1
@@ -0,0 +1,58 @@
+"""Tests for the routing decision store (RoutingStatsStore)."""
+
+from nanofolks.agent.router.analytics_store import RoutingStatsStore
+
+
+def _record(n, client_tier="simple", llm_tier="coding"):
+    return {
+        "content_preview": f"please refactor module number {n}",
+        "client_tier": client_tier,
+        "client_confidence": 0.6,
+        "llm_tier": llm_tier,
+        "final_tier": llm_tier,
+        "layer_used": "llm",
+        "action_type": "refactor",
+    }
+
+
+def _counters(store):
+    return (
+        store.total(),
+        sorted(store.tier_counts()),
+        store.decision_distribution(),
+        store.action_counts("coding"),
+        store.top_ngrams("coding", limit=50),
+    )
+
+
+class TestPrune:
+    """Test RoutingStatsStore.prune."""
+
+    def test_prune_retracts_counters(self, tmp_path):
+        """Test counters after a prune match a store holding only the kept rows."""
+        records = [_record(n) for n in range(4)] + [_record(n, llm_tier="simple") for n in range(4, 6)]
+
+        pruned = RoutingStatsStore(tmp_path / "pruned.db", max_records=3)
+        pruned.append_many(records)
+        assert pruned.prune() == 3
+
+        kept = RoutingStatsStore(tmp_path / "kept.db", max_records=3)
+        kept.append_many(records[3:])
+
+        assert pruned.count_since() == 3
+        assert _counters(pruned) == _counters(kept)
+        pruned.close()
+        kept.close()
+
+    def test_prune_deletes_emptied_counters(self, tmp_path):
+        """Test counter rows whose decisions were all pruned are removed."""
+        store = RoutingStatsStore(tmp_path / "stats.db", max_records=1)
+        store.append(_record(0))
+        store.append(_record(1, client_tier="simple", llm_tier="simple"))
+        assert store.prune() == 1
+
+        assert store.action_counts("coding") == {}
+        assert store.top_ngrams("coding") == []
+        assert store.decision_distribution() == ({"simple": 1}, {"llm": 1})
+        assert store.prune() == 0
+        store.close()
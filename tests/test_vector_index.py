@@ -0,0 +1,232 @@
+"""Tests for VectorIndex persistence (delta log, snapshots, compaction)."""
+
+import numpy as np
+import pytest
+
+from nanofolks.memory.vector_index import VectorIndex
+
+DIM = 8
+
+
+def _vectors(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [(f"item-{seed}-{i}", rng.random(DIM).tolist()) for i in range(count)]
+
+
+def _open(tmp_path, **kwargs):
+    # Background snapshots and compaction stay off unless a test asks for them
+    options = {"max_elements": 16, "compact_threshold": 10_000, "min_tombstones": 10_000}
+    options.update(kwargs)
+    index = VectorIndex(tmp_path, dimension=DIM, **options)
+    index.initialize()
+    return index
+
+
+def _assert_contains(index, items):
+    """Every item is mapped and is its own nearest neighbour."""
+    assert len(index._id_map) == len(items)
+    for item_id, vector in items:
+        assert item_id in index._id_map
+        assert index.search(vector, k=1)[0][0] == item_id
+
+
+class TestDeltaReplay:
+    """Test replaying the delta log on load."""
+
+    def test_replay_without_snapshot(self, tmp_path):
+        """Test vectors logged but never snapshotted are restored."""
+        items = _vectors(5)
+        index = _open(tmp_path)
+        index.add_vectors_batch(items)
+        index.close()
+
+        reopened = _open(tmp_path)
+        _assert_contains(reopened, items)
+
+    def test_torn_record_is_discarded(self, tmp_path):
+        """Test a record cut short by a crash is dropped and the log repaired."""
+        items = _vectors(4)
+        index = _open(tmp_path)
+        index.add_vectors_batch(items[:3])
+        index.add_vector(*items[3])
+        index.close()
+
+        log = index._delta_path(index._delta_base)
+        intact = log.stat().st_size
+        with open(log, "r+b") as f:
+            f.truncate(intact - 5)
+
+        reopened = _open(tmp_path)
+        _assert_contains(reopened, items[:3])
+        assert log.stat().st_size < intact - 5
+
+        # The repaired log accepts further appends
+        reopened.add_vector(*items[3])
+        reopened.close()
+        _assert_contains(_open(tmp_path), items)
+
+    def test_corrupt_record_is_discarded(self, tmp_path):
+        """Test a record whose checksum does not match ends replay."""
+        items = _vectors(3)
+        index = _open(tmp_path)
+        index.add_vectors_batch(items[:2])
+        index.add_vector(*items[2])
+        index.close()
+
+        log = index._delta_path(index._delta_base)
+        data = bytearray(log.read_bytes())
+        data[-1] ^= 0xFF
+        log.write_bytes(bytes(data))
+
+        _assert_contains(_open(tmp_path), items[:2])
+
+
+class TestSnapshotReplay:
+    """Test replay on top of a snapshot."""
+
+    def test_replay_after_snapshot(self, tmp_path):
+        """Test records logged after a snapshot replay on top of it."""
+        before, after = _vectors(5, seed=1), _vectors(5, seed=2)
+        index = _open(tmp_path)
+        index.add_vectors_batch(before)
+        index.save()
+        index.add_vectors_batch(after)
+        index.delete_vector(before[0][0])
+        index.close()
+
+        reopened = _open(tmp_path)
+        assert reopened._generation == 1
+        _assert_contains(reopened, before[1:] + after)
+
+    def test_log_folded_into_snapshot_is_skipped(self, tmp_path):
+        """Test a log left behind by a crash after the manifest swap is ignored."""
+        items = _vectors(5)
+        index = _open(tmp_path)
+        index.add_vectors_batch(items)
+        old_log = index._delta_path(index._delta_base)
+        index._delta_file.flush()
+        leftover = old_log.read_bytes()
+        index.save()
+        index.close()
+        assert not old_log.exists()
+
+        # Crash between the manifest swap and removing the old log
+        old_log.write_bytes(leftover)
+
+        reopened = _open(tmp_path)
+        _assert_contains(reopened, items)
+        assert reopened._index.get_current_count() == len(items)
+        assert not old_log.exists()
+
+    def test_crash_before_manifest_swap(self, tmp_path, monkeypatch):
+        """Test records after an uncommitted snapshot replay on the previous one."""
+        before, during, after = _vectors(4, seed=1), _vectors(4, seed=2), _vectors(4, seed=3)
+        index = _open(tmp_path)
+        index.add_vectors_batch(before)
+        index.save()
+        index.add_vectors_batch(during)
+
+        def crash(snapshot):
+            raise OSError("crash before manifest swap")
+
+        monkeypatch.setattr(index, "_commit_snapshot", crash)
+        with pytest.raises(OSError):
+            index.save()
+        index.add_vectors_batch(after)
+        index.close()
+        monkeypatch.undo()
+
+        reopened = _open(tmp_path)
+        assert reopened._generation == 1
+        _assert_contains(reopened, before + during + after)
+
+
+class TestCompactionReplay:
+    """Test replay after tombstone compaction relabels the index."""
+
+    def _compacted(self, tmp_path):
+        items = _vectors(10)
+        index = _open(tmp_path)
+        index.add_vectors_batch(items)
+        for item_id, _ in items[:6]:
+            index.delete_vector(item_id)
+        index.compact()
+        assert index.tombstones() == 0
+        return index, items[6:]
+
+    def test_replay_after_compaction(self, tmp_path):
+        """Test records logged after compaction use the new labels on replay."""
+        index, live = self._compacted(tmp_path)
+        added = _vectors(3, seed=5)
+        index.add_vectors_batch(added)
+        index.delete_vector(live[0][0])
+        index.close()
+
+        reopened = _open(tmp_path)
+        _assert_contains(reopened, live[1:] + added)
+        assert reopened._reverse_map == {
+            label: item_id for item_id, label in reopened._id_map.items()
+        }
+
+    def test_pre_compaction_log_is_not_replayed(self, tmp_path):
+        """Test old-label records left by a crash are not applied to the relabeled snapshot."""
+        items = _vectors(10)
+        index = _open(tmp_path)
+        index.add_vectors_batch(items)
+        for item_id, _ in items[:6]:
+            index.delete_vector(item_id)
+        old_log = index._delta_path(index._delta_base)
+        index._delta_file.flush()
+        leftover = old_log.read_bytes()
+        index.compact()
+        index.close()
+
+        # Crash between the manifest swap and removing the old log
+        old_log.write_bytes(leftover)
+
+        reopened = _open(tmp_path)
+        _assert_contains(reopened, items[6:])
+        assert reopened._index.get_current_count() == 4
+
+    def test_crash_before_compaction_commit_rebuilds(self, tmp_path, monkeypatch):
+        """Test a relabeled but uncommitted snapshot triggers a rebuild from source."""
+        items = _vectors(10)
+        live = items[6:]
+        index = _open(tmp_path)
+        index.add_vectors_batch(items)
+        index.save()
+        for item_id, _ in items[:6]:
+            index.delete_vector(item_id)
+
+        def crash(snapshot):
+            raise OSError("crash before manifest swap")
+
+        monkeypatch.setattr(index, "_commit_snapshot", crash)
+        with pytest.raises(OSError):
+            index.compact()
+        added = _vectors(2, seed=7)
+        index.add_vectors_batch(added)
+        index.close()
+        monkeypatch.undo()
+
+        reopened = _open(tmp_path, rebuild_source=lambda: live + added)
+        _assert_contains(reopened, live + added)
+        assert reopened._index.get_current_count() == len(live + added)
+
+
+class TestBackgroundCompaction:
+    """Test compaction triggered by writes."""
+
+    def test_searches_during_background_compaction(self, tmp_path):
+        """Test a background tombstone compaction leaves a consistent, replayable index."""
+        items = _vectors(12)
+        index = _open(tmp_path, min_tombstones=1)
+        index.add_vectors_batch(items)
+        for position, (item_id, _) in enumerate(items[:6]):
+            index.delete_vector(item_id)
+            _assert_contains(index, items[position + 1:])
+        index.wait_for_compaction()
+        assert index.tombstones() == 0
+        index.close()
+
+        _assert_contains(_open(tmp_path), items[6:])